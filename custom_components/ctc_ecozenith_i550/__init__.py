@@ -1,33 +1,133 @@
 """Integration for CTC Ecozenith i550."""
 
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from .const import BMS_REGISTERS, DOMAIN
+from .const import (
+    ATTR_CURVE,
+    ATTR_POINTS,
+    CONF_BOOST_DURATION,
+    CONF_BOOST_TRIGGERS,
+    CONF_MAX_IN_FLIGHT,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MAX_STALE_AGE,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_NUM_HEAT_PUMPS,
+    CONF_NUM_HEATING_SYSTEMS,
+    CONF_ROLLBACK_TIMEOUT,
+    CONF_WRITE_DEBOUNCE,
+    CURVE_POINTS,
+    CURVES,
+    DEFAULT_BOOST_DURATION,
+    DEFAULT_BOOST_TRIGGERS,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MAX_STALE_AGE,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_ROLLBACK_TIMEOUT,
+    DEFAULT_WRITE_DEBOUNCE,
+    DOMAIN,
+    SERVICE_REFRESH_LIMITS,
+    SERVICE_SET_HEATING_CURVE,
+)
 from .coordinator import CTCEcozenithDataUpdateCoordinator
+from .topology import Topology
 
-
-def update_method(client) -> dict:
-    """Fetch all required registers from the heat pump using a shared client."""
-    result = {}
-    for key, feature_register in BMS_REGISTERS.items():
-        feature_register.update(client)
-        result[key] = feature_register.value
-    return result
+SET_HEATING_CURVE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_CURVE): vol.In(CURVES),
+        vol.Required(ATTR_POINTS): vol.All(
+            cv.ensure_list,
+            [vol.ExactSequence([vol.Coerce(float), vol.Coerce(float)])],
+            vol.Length(min=CURVE_POINTS, max=CURVE_POINTS),
+        ),
+    }
+)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up CTC Ecozenith i550 from a config entry."""
     coordinator = CTCEcozenithDataUpdateCoordinator(
-        hass, entry.data["host"], entry.data["port"], update_method
+        hass,
+        entry.data["host"],
+        entry.data["port"],
+        max_in_flight=entry.options.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT),
+        max_stale_age=entry.options.get(CONF_MAX_STALE_AGE, DEFAULT_MAX_STALE_AGE),
+        scan_interval_bounds=(
+            entry.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+            entry.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+        ),
+        boost_triggers=entry.options.get(CONF_BOOST_TRIGGERS, DEFAULT_BOOST_TRIGGERS),
+        boost_duration=entry.options.get(CONF_BOOST_DURATION, DEFAULT_BOOST_DURATION),
+        rollback_timeout=entry.options.get(
+            CONF_ROLLBACK_TIMEOUT, DEFAULT_ROLLBACK_TIMEOUT
+        ),
+        write_debounce=entry.options.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE),
+    )
+    if CONF_NUM_HEAT_PUMPS not in entry.data:
+        try:
+            topology = await coordinator.async_discover_topology()
+        except UpdateFailed as err:
+            await coordinator.async_close()
+            raise ConfigEntryNotReady(str(err)) from err
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                **entry.data,
+                CONF_NUM_HEAT_PUMPS: topology.heat_pumps,
+                CONF_NUM_HEATING_SYSTEMS: topology.heating_systems,
+            },
+        )
+    coordinator.set_topology(
+        Topology(entry.data[CONF_NUM_HEAT_PUMPS], entry.data[CONF_NUM_HEATING_SYSTEMS])
     )
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup is retried with a new coordinator, so this one must not
+        # keep its connection open
+        await coordinator.async_close()
+        raise
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
+    async def async_refresh_limits(_call: ServiceCall) -> None:
+        """Reload the min/max/step limits of every configured heat pump."""
+        for loaded in hass.data[DOMAIN].values():
+            await loaded.async_refresh_limits()
+
+    async def async_set_heating_curve(call: ServiceCall) -> None:
+        """Write a heating or cooling curve on the selected heat pump."""
+        target = hass.data[DOMAIN].get(call.data[ATTR_CONFIG_ENTRY_ID])
+        if target is None:
+            msg = f"Heat pump {call.data[ATTR_CONFIG_ENTRY_ID]} is not loaded"
+            raise ServiceValidationError(msg)
+        await target.async_write_curve(call.data[ATTR_CURVE], call.data[ATTR_POINTS])
+
+    if not hass.services.has_service(DOMAIN, SERVICE_REFRESH_LIMITS):
+        hass.services.async_register(
+            DOMAIN, SERVICE_REFRESH_LIMITS, async_refresh_limits
+        )
+    if not hass.services.has_service(DOMAIN, SERVICE_SET_HEATING_CURVE):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SET_HEATING_CURVE,
+            async_set_heating_curve,
+            schema=SET_HEATING_CURVE_SCHEMA,
+        )
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     # Only this line should forward to the sensor platform
     await hass.config_entries.async_forward_entry_setups(
         entry, ["sensor", "select", "number"]
     )
+    coordinator.async_start_demand_polling()
     return True
 
 
@@ -38,4 +138,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     coordinator = hass.data[DOMAIN].pop(entry.entry_id)
     await coordinator.async_close()
+    if not hass.data[DOMAIN]:
+        hass.services.async_remove(DOMAIN, SERVICE_REFRESH_LIMITS)
+        hass.services.async_remove(DOMAIN, SERVICE_SET_HEATING_CURVE)
     return unload_ok
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -2,15 +2,36 @@
 
 from __future__ import annotations
 
-from pymodbus.client import ModbusTcpClient
-from pymodbus.exceptions import ModbusException
 import voluptuous as vol
-
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
 from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+from pymodbus.client import ModbusTcpClient
+from pymodbus.exceptions import ModbusException
 
-from .const import DEFAULT_NAME, DEFAULT_PORT, DOMAIN
+from .const import (
+    BOOST_TRIGGERS,
+    CONF_BOOST_DURATION,
+    CONF_BOOST_TRIGGERS,
+    CONF_MAX_IN_FLIGHT,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MAX_STALE_AGE,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_ROLLBACK_TIMEOUT,
+    CONF_WRITE_DEBOUNCE,
+    DEFAULT_BOOST_DURATION,
+    DEFAULT_BOOST_TRIGGERS,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MAX_STALE_AGE,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_NAME,
+    DEFAULT_PORT,
+    DEFAULT_ROLLBACK_TIMEOUT,
+    DEFAULT_WRITE_DEBOUNCE,
+    DOMAIN,
+)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -20,7 +41,34 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
-OPTIONS_SCHEMA = vol.Schema({})
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_MAX_IN_FLIGHT, default=DEFAULT_MAX_IN_FLIGHT): vol.All(
+            int, vol.Range(min=1, max=16)
+        ),
+        vol.Required(CONF_MAX_STALE_AGE, default=DEFAULT_MAX_STALE_AGE): vol.All(
+            int, vol.Range(min=0, max=3600)
+        ),
+        vol.Required(
+            CONF_MIN_SCAN_INTERVAL, default=DEFAULT_MIN_SCAN_INTERVAL
+        ): vol.All(int, vol.Range(min=1, max=60)),
+        vol.Required(
+            CONF_MAX_SCAN_INTERVAL, default=DEFAULT_MAX_SCAN_INTERVAL
+        ): vol.All(int, vol.Range(min=5, max=600)),
+        vol.Required(
+            CONF_BOOST_TRIGGERS, default=DEFAULT_BOOST_TRIGGERS
+        ): cv.multi_select(BOOST_TRIGGERS),
+        vol.Required(CONF_BOOST_DURATION, default=DEFAULT_BOOST_DURATION): vol.All(
+            int, vol.Range(min=0, max=60)
+        ),
+        vol.Required(CONF_ROLLBACK_TIMEOUT, default=DEFAULT_ROLLBACK_TIMEOUT): vol.All(
+            int, vol.Range(min=1, max=120)
+        ),
+        vol.Required(CONF_WRITE_DEBOUNCE, default=DEFAULT_WRITE_DEBOUNCE): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=10)
+        ),
+    }
+)
 
 
 class CTCEcozenithConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -62,24 +110,31 @@ class CTCEcozenithConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     @staticmethod
     @callback
-    def async_get_options_flow(config_entry):
+    def async_get_options_flow(
+        _config_entry: config_entries.ConfigEntry,
+    ) -> CTCEcozenithOptionsFlowHandler:
         """Get the options flow for this handler."""
-        return CTCEcozenithOptionsFlowHandler(config_entry)
+        return CTCEcozenithOptionsFlowHandler()
 
 
 class CTCEcozenithOptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options for CTC Ecozenith i550."""
 
-    def __init__(self, config_entry):
-        """Initialize options flow."""
-        self.config_entry = config_entry
-
-    async def async_step_init(self, user_input=None):
+    async def async_step_init(
+        self, user_input: dict | None = None
+    ) -> config_entries.FlowResult:
         """Manage the options."""
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors[CONF_MIN_SCAN_INTERVAL] = "min_above_max"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
             step_id="init",
-            data_schema=OPTIONS_SCHEMA,
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, user_input or self.config_entry.options
+            ),
+            errors=errors,
         )
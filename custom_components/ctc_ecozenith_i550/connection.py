@@ -0,0 +1,156 @@
+"""Connection management with backoff for CTC Ecozenith i550."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from .modbus import AsyncModbusTcpClient, ModbusError, ModbusExceptionResponseError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Delay before the first retry after the circuit opened, doubled on every
+# further failure up to the maximum
+BACKOFF_MIN = 5.0
+BACKOFF_MAX = 300.0
+# Failed sweeps or writes in a row that open the circuit on a live connection
+FAILURE_THRESHOLD = 3
+
+
+class CircuitState(StrEnum):
+    """State of the circuit breaker guarding the Modbus connection."""
+
+    CLOSED = "closed"  # requests go through
+    OPEN = "open"  # requests fail fast until the retry time
+    HALF_OPEN = "half_open"  # one trial decides, other requests fail fast
+
+
+class CircuitOpenError(ModbusError):
+    """Raised instead of contacting the device while the circuit is open."""
+
+    def __init__(self, retry_in: float) -> None:
+        """Initialize the error with the seconds left until the next attempt."""
+        super().__init__(f"Connection is down, retrying in {retry_in:.0f} s")
+        self.retry_in = retry_in
+
+
+class ConnectionManager:
+    """Circuit breaker with exponential backoff and jitter around the client."""
+
+    def __init__(
+        self,
+        client: AsyncModbusTcpClient,
+        on_state_change: Callable[[], None] | None = None,
+        backoff_min: float = BACKOFF_MIN,
+        backoff_max: float = BACKOFF_MAX,
+        failure_threshold: int = FAILURE_THRESHOLD,
+    ) -> None:
+        """Initialize the manager in the closed state."""
+        self._client = client
+        self._on_state_change = on_state_change
+        self._backoff_min = backoff_min
+        self._backoff_max = backoff_max
+        self._failure_threshold = failure_threshold
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._trips = 0
+        self._retry_at = 0.0
+        # Concurrent requests connect one at a time, so a failed attempt
+        # opens the circuit before the next one could try again
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds left until an open circuit allows a new attempt."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    async def async_run[T](self, request: Callable[[], Awaitable[T]]) -> T:
+        """Run a request on a connected client and record its outcome."""
+        try:
+            await self.async_connect()
+            result = await request()
+        except asyncio.CancelledError:
+            # A cancelled trial decides nothing, so the next request tries
+            if self.state is CircuitState.HALF_OPEN:
+                self._set_state(CircuitState.OPEN)
+            raise
+        except ModbusExceptionResponseError:
+            # The device answered, it just rejected the request
+            self.record_success()
+            raise
+        except ModbusError:
+            await self.async_record_failure()
+            raise
+        self.record_success()
+        return result
+
+    async def async_connect(self) -> None:
+        """
+        Connect unless connected, failing fast while the circuit is open.
+
+        The first request after the backoff becomes the trial, and the others
+        fail fast until its outcome closes or opens the circuit again.
+        """
+        async with self._connect_lock:
+            if self.state is CircuitState.HALF_OPEN:
+                raise CircuitOpenError(self.retry_in)
+            if self.state is CircuitState.OPEN:
+                if retry_in := self.retry_in:
+                    raise CircuitOpenError(retry_in)
+                self._set_state(CircuitState.HALF_OPEN)
+            if self._client.connected:
+                return
+            _LOGGER.debug("Modbus client not connected, attempting to connect")
+            try:
+                await self._client.connect()
+            except ModbusError:
+                # A refused or unreachable device will not answer the next
+                # attempt either, so back off right away
+                await self.async_record_failure(trip=True)
+                raise
+
+    def record_success(self) -> None:
+        """Close the circuit after the device answered."""
+        self.failures = 0
+        self._trips = 0
+        if self.state is not CircuitState.CLOSED:
+            _LOGGER.info("Connection to the heat pump restored")
+            self._set_state(CircuitState.CLOSED)
+
+    async def async_record_failure(self, *, trip: bool = False) -> None:
+        """Count a failed exchange and open the circuit once it keeps failing."""
+        self.failures += 1
+        if not (
+            trip
+            or self.state is CircuitState.HALF_OPEN
+            or self.failures >= self._failure_threshold
+        ):
+            return
+        delay = min(self._backoff_max, self._backoff_min * 2**self._trips)
+        # Half the delay is fixed and half is random, so several installations
+        # do not retry in lockstep after a shared outage
+        delay = delay / 2 + random.uniform(0, delay / 2)  # noqa: S311 jitter only
+        self._trips += 1
+        self._retry_at = time.monotonic() + delay
+        _LOGGER.warning(
+            "Heat pump not reachable after %s failed attempts, retrying in %.0f s",
+            self.failures,
+            delay,
+        )
+        await self._client.close()
+        self._set_state(CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        """Change the circuit state and report it."""
+        if state is self.state:
+            return
+        self.state = state
+        if self._on_state_change is not None:
+            self._on_state_change()
@@ -1,6 +1,6 @@
 """Constants for CTC Ecozenith i550 integration."""
 
-from config.custom_components.ctc_ecozenith_i550.feature_register import FeatureRegister
+from .feature_register import FeatureRegister, PollClass
 
 DOMAIN = "ctc_ecozenith_i550"
 DEFAULT_NAME = "CTC Ecozenith i550"
@@ -8,8 +8,52 @@ DEFAULT_PORT = 502  # Default Modbus TCP port
 CONF_SERIAL_NUMBER = "serial_number"
 CONF_MODEL = "model"
 CONF_ALLOW_COOLING = "allow_cooling"
+CONF_NUM_HEAT_PUMPS = "num_heat_pumps"
 CONF_NUM_HEATING_SYSTEMS = "num_heating_systems"
 CONF_HAS_SOLAR = "has_solar"
+CONF_MAX_IN_FLIGHT = "max_in_flight"
+DEFAULT_MAX_IN_FLIGHT = 1  # Strictly serial unless pipelining is enabled
+CONF_MAX_STALE_AGE = "max_stale_age"
+DEFAULT_MAX_STALE_AGE = 300  # Seconds a value survives failed reads past its interval
+# Bounds of the adaptive fast polling interval in seconds, the slower
+# groups scale them by their base interval
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL = 2
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+DEFAULT_MAX_SCAN_INTERVAL = 30
+# Registers whose change polls the fast registers of their unit at the
+# minimum interval for a number of minutes, named without the unit number
+CONF_BOOST_TRIGGERS = "boost_triggers"
+BOOST_TRIGGERS = {
+    "status": "System status",
+    "heat_pump_status": "Heat pump status",
+    "heat_pump_defrost_timer": "Heat pump defrost timer",
+}
+DEFAULT_BOOST_TRIGGERS = list(BOOST_TRIGGERS)
+CONF_BOOST_DURATION = "boost_duration"
+DEFAULT_BOOST_DURATION = 5
+# Seconds a written value is shown before a read must confirm it
+CONF_ROLLBACK_TIMEOUT = "rollback_timeout"
+DEFAULT_ROLLBACK_TIMEOUT = 15
+# Seconds a number entity waits for further changes before writing
+CONF_WRITE_DEBOUNCE = "write_debounce"
+DEFAULT_WRITE_DEBOUNCE = 1.0
+
+SERVICE_REFRESH_LIMITS = "refresh_limits"
+SERVICE_SET_HEATING_CURVE = "set_heating_curve"
+
+# Heating curves of the heating circuits and the cooling curve, each five
+# x/y points in ten consecutive registers
+CURVES = ("hc_1", "hc_2", "hc_3", "hc_4", "cooling")
+CURVE_POINTS = 5
+ATTR_CURVE = "curve"
+ATTR_POINTS = "points"
+
+ATTR_LAST_READ = "last_read"
+ATTR_PENDING = "pending"
+
+# Listener context of the connection state diagnostic entity
+CONNECTION_STATE = "connection_state"
 
 BMS_REGISTERS = {
     "hot_water_mode": FeatureRegister(
@@ -20,24 +64,29 @@ BMS_REGISTERS = {
         step_adresss=60002,
         visible_adresss=62500,
         visible_bit=0,
+        poll_class=PollClass.SETTING,
     ),
     "manual_stop_temp_hot_water": FeatureRegister(
         address=61501,
         scale=0.1,
+        signed=True,
         max_value_adresss=60003,
         min_value_adresss=60004,
         step_adresss=60005,
         visible_adresss=62500,
         visible_bit=1,
+        poll_class=PollClass.SETTING,
     ),
     "setting_outlet_temp_hot_water": FeatureRegister(
         address=61502,
         scale=0.1,
+        signed=True,
         max_value_adresss=60006,
         min_value_adresss=60007,
         step_adresss=60008,
         visible_adresss=62500,
         visible_bit=2,
+        poll_class=PollClass.SETTING,
     ),
     "extra_hot_water_timer": FeatureRegister(
         address=61503,
@@ -47,6 +96,7 @@ BMS_REGISTERS = {
         step_adresss=60011,
         visible_adresss=62500,
         visible_bit=3,
+        poll_class=PollClass.SETTING,
     ),
     "max_time_heating_heat_pump": FeatureRegister(
         address=61504,
@@ -56,6 +106,7 @@ BMS_REGISTERS = {
         step_adresss=60014,
         visible_adresss=62500,
         visible_bit=4,
+        poll_class=PollClass.SETTING,
     ),
     "max_time_hot_water": FeatureRegister(
         address=61505,
@@ -65,6 +116,7 @@ BMS_REGISTERS = {
         step_adresss=60017,
         visible_adresss=62500,
         visible_bit=5,
+        poll_class=PollClass.SETTING,
     ),
     "min_rps_hot_water": FeatureRegister(
         address=61506,
@@ -74,6 +126,7 @@ BMS_REGISTERS = {
         step_adresss=60020,
         visible_adresss=62500,
         visible_bit=6,
+        poll_class=PollClass.SETTING,
     ),
     "min_rps_pool": FeatureRegister(
         address=61507,
@@ -83,6 +136,7 @@ BMS_REGISTERS = {
         step_adresss=60023,
         visible_adresss=62500,
         visible_bit=7,
+        poll_class=PollClass.SETTING,
     ),
     "vacation_days_timer": FeatureRegister(
         address=61508,
@@ -92,15 +146,18 @@ BMS_REGISTERS = {
         step_adresss=60026,
         visible_adresss=62500,
         visible_bit=8,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_setting_room_temp": FeatureRegister(
         address=61509,
         scale=0.1,
+        signed=True,
         max_value_adresss=60027,
         min_value_adresss=60028,
         step_adresss=60029,
         visible_adresss=62500,
         visible_bit=9,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_setting_room_temp": FeatureRegister(
         address=61510,
@@ -110,6 +167,8 @@ BMS_REGISTERS = {
         visible_adresss=62500,
         visible_bit=10,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_setting_room_temp": FeatureRegister(
         address=61511,
@@ -119,6 +178,8 @@ BMS_REGISTERS = {
         visible_adresss=62500,
         visible_bit=11,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_setting_room_temp": FeatureRegister(
         address=61512,
@@ -128,6 +189,8 @@ BMS_REGISTERS = {
         visible_adresss=62500,
         visible_bit=12,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_change_inclination": FeatureRegister(
         address=61513,
@@ -137,6 +200,7 @@ BMS_REGISTERS = {
         visible_adresss=62500,
         visible_bit=13,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_change_inclination": FeatureRegister(
         address=61514,
@@ -146,6 +210,7 @@ BMS_REGISTERS = {
         visible_adresss=62500,
         visible_bit=14,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_change_inclination": FeatureRegister(
         address=61515,
@@ -155,6 +220,7 @@ BMS_REGISTERS = {
         visible_adresss=62500,
         visible_bit=15,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_change_inclination": FeatureRegister(
         address=61516,
@@ -164,6 +230,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=0,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "room1_adjustment": FeatureRegister(
         address=61517,
@@ -173,6 +240,8 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=1,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "room2_adjustment": FeatureRegister(
         address=61518,
@@ -182,6 +251,8 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=2,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "room3_adjustment": FeatureRegister(
         address=61519,
@@ -191,6 +262,8 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=3,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "room4_adjustment": FeatureRegister(
         address=61520,
@@ -200,6 +273,8 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=4,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_1_blocked": FeatureRegister(
         address=61521,
@@ -209,6 +284,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=5,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_2_blocked": FeatureRegister(
         address=61522,
@@ -218,6 +294,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=6,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_3_blocked": FeatureRegister(
         address=61523,
@@ -227,6 +304,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=7,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_4_blocked": FeatureRegister(
         address=61524,
@@ -236,6 +314,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=8,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_5_blocked": FeatureRegister(
         address=61525,
@@ -245,6 +324,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=9,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_6_blocked": FeatureRegister(
         address=61526,
@@ -254,6 +334,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=10,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_7_blocked": FeatureRegister(
         address=61527,
@@ -263,6 +344,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=11,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_8_blocked": FeatureRegister(
         address=61528,
@@ -272,6 +354,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=12,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_9_blocked": FeatureRegister(
         address=61529,
@@ -281,6 +364,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=13,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_10_blocked": FeatureRegister(
         address=61530,
@@ -290,6 +374,7 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "pool_stop_temp": FeatureRegister(
         address=61531,
@@ -299,6 +384,8 @@ BMS_REGISTERS = {
         visible_adresss=62501,
         visible_bit=15,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "pool_max_time": FeatureRegister(
         address=61532,
@@ -308,6 +395,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=0,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "pool_start_diff": FeatureRegister(
         address=61533,
@@ -317,6 +405,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=1,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_max_primary_flow": FeatureRegister(
         address=61534,
@@ -326,6 +415,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=2,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_max_primary_flow": FeatureRegister(
         address=61535,
@@ -335,6 +425,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=3,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_max_primary_flow": FeatureRegister(
         address=61536,
@@ -344,6 +435,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=4,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_max_primary_flow": FeatureRegister(
         address=61537,
@@ -353,6 +445,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=5,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_min_primary_flow": FeatureRegister(
         address=61538,
@@ -362,6 +455,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=6,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_min_primary_flow": FeatureRegister(
         address=61539,
@@ -371,6 +465,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=7,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_min_primary_flow": FeatureRegister(
         address=61540,
@@ -380,6 +475,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=8,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_min_primary_flow": FeatureRegister(
         address=61541,
@@ -389,6 +485,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=9,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_heating_mode": FeatureRegister(
         address=61542,
@@ -398,6 +495,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=10,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_heating_mode": FeatureRegister(
         address=61543,
@@ -407,6 +505,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=11,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_heating_mode": FeatureRegister(
         address=61544,
@@ -416,6 +515,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=12,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_heating_mode": FeatureRegister(
         address=61545,
@@ -425,6 +525,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=13,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_heating_off_out": FeatureRegister(
         address=61546,
@@ -434,6 +535,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=14,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_heating_off_out": FeatureRegister(
         address=61547,
@@ -443,6 +545,7 @@ BMS_REGISTERS = {
         visible_adresss=62502,
         visible_bit=15,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_heating_off_out": FeatureRegister(
         address=61548,
@@ -452,6 +555,7 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=0,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_heating_off_out": FeatureRegister(
         address=61549,
@@ -461,6 +565,7 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=1,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_heating_off_time": FeatureRegister(
         address=61550,
@@ -470,6 +575,7 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=2,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_heating_off_time": FeatureRegister(
         address=61551,
@@ -479,6 +585,7 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=3,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_heating_off_time": FeatureRegister(
         address=61552,
@@ -488,6 +595,7 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_heating_off_time": FeatureRegister(
         address=61553,
@@ -497,6 +605,7 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=5,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_room_temp_night_reduction": FeatureRegister(
         address=61554,
@@ -506,6 +615,8 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=6,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_room_temp_night_reduction": FeatureRegister(
         address=61555,
@@ -515,6 +626,8 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=7,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_room_temp_night_reduction": FeatureRegister(
         address=61556,
@@ -524,6 +637,8 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=8,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_room_temp_night_reduction": FeatureRegister(
         address=61557,
@@ -533,6 +648,8 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=9,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_primary_flow_night_reduction": FeatureRegister(
         address=61558,
@@ -542,6 +659,7 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=10,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_primary_flow_night_reduction": FeatureRegister(
         address=61559,
@@ -551,6 +669,7 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=11,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_primary_flow_night_reduction": FeatureRegister(
         address=61560,
@@ -560,6 +679,7 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=12,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_primary_flow_night_reduction": FeatureRegister(
         address=61561,
@@ -569,6 +689,7 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=13,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_outdoor_temp_night_reduction": FeatureRegister(
         address=61562,
@@ -578,6 +699,8 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=14,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_outdoor_temp_night_reduction": FeatureRegister(
         address=61563,
@@ -587,6 +710,8 @@ BMS_REGISTERS = {
         visible_adresss=62503,
         visible_bit=15,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_outdoor_temp_night_reduction": FeatureRegister(
         address=61564,
@@ -596,6 +721,8 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=0,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_outdoor_temp_night_reduction": FeatureRegister(
         address=61565,
@@ -605,6 +732,8 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=1,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_alarm_low_room_temp": FeatureRegister(
         address=61566,
@@ -614,6 +743,8 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=2,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_alarm_low_room_temp": FeatureRegister(
         address=61567,
@@ -623,6 +754,8 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=3,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_alarm_low_room_temp": FeatureRegister(
         address=61568,
@@ -632,6 +765,8 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=4,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_alarm_low_room_temp": FeatureRegister(
         address=61569,
@@ -641,6 +776,8 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=5,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "radiator_pump_setting": FeatureRegister(
         address=61570,
@@ -650,6 +787,7 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=6,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "start_at_degree_minute": FeatureRegister(
         address=61571,
@@ -659,6 +797,8 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=7,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_1_max_rps": FeatureRegister(
         address=61572,
@@ -668,6 +808,7 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=8,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_2_max_rps": FeatureRegister(
         address=61573,
@@ -677,6 +818,7 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=9,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_3_max_rps": FeatureRegister(
         address=61574,
@@ -686,6 +828,7 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=10,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_4_max_rps": FeatureRegister(
         address=61575,
@@ -695,6 +838,7 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=11,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_5_max_rps": FeatureRegister(
         address=61576,
@@ -704,6 +848,7 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=12,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_6_max_rps": FeatureRegister(
         address=61577,
@@ -713,6 +858,7 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=13,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_7_max_rps": FeatureRegister(
         address=61578,
@@ -722,6 +868,7 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=14,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_8_max_rps": FeatureRegister(
         address=61579,
@@ -731,6 +878,7 @@ BMS_REGISTERS = {
         visible_adresss=62504,
         visible_bit=15,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_9_max_rps": FeatureRegister(
         address=61580,
@@ -740,6 +888,7 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=0,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_10_max_rps": FeatureRegister(
         address=61581,
@@ -749,6 +898,7 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=1,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "e1_start_add_heat_degree_minute": FeatureRegister(
         address=61582,
@@ -758,6 +908,8 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=2,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "external_boiler_diff": FeatureRegister(
         address=61583,
@@ -767,6 +919,7 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=3,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "blocking_additional_heat_outdoor_temp": FeatureRegister(
         address=61584,
@@ -776,6 +929,8 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=4,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "boiler_open_mixing_valve": FeatureRegister(
         address=61585,
@@ -785,6 +940,7 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=5,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "delay_stop_external_boiler": FeatureRegister(
         address=61586,
@@ -794,6 +950,7 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=6,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "ext_boiler_mode": FeatureRegister(
         address=61587,
@@ -803,6 +960,7 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=7,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "ehs_open_shunt_degrees": FeatureRegister(
         address=61588,
@@ -812,6 +970,7 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=8,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "ehs_start_stop_diff": FeatureRegister(
         address=61589,
@@ -821,6 +980,7 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=9,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "max_immersion_heater_kw_lower": FeatureRegister(
         address=61590,
@@ -830,6 +990,7 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=10,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "max_immersion_heater_dhw_kw_upper": FeatureRegister(
         address=61591,
@@ -839,6 +1000,7 @@ BMS_REGISTERS = {
         visible_adresss=62505,
         visible_bit=11,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_holiday_reduction": FeatureRegister(
         address=61602,
@@ -848,6 +1010,7 @@ BMS_REGISTERS = {
         visible_adresss=62506,
         visible_bit=6,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_holiday_reduction": FeatureRegister(
         address=61603,
@@ -857,6 +1020,7 @@ BMS_REGISTERS = {
         visible_adresss=62506,
         visible_bit=7,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_holiday_reduction": FeatureRegister(
         address=61604,
@@ -866,6 +1030,7 @@ BMS_REGISTERS = {
         visible_adresss=62506,
         visible_bit=8,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_holiday_reduction": FeatureRegister(
         address=61605,
@@ -875,6 +1040,7 @@ BMS_REGISTERS = {
         visible_adresss=62506,
         visible_bit=9,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_holiday_reduction_time": FeatureRegister(
         address=61606,
@@ -884,6 +1050,7 @@ BMS_REGISTERS = {
         visible_adresss=62506,
         visible_bit=10,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_holiday_reduction_time": FeatureRegister(
         address=61607,
@@ -893,6 +1060,7 @@ BMS_REGISTERS = {
         visible_adresss=62506,
         visible_bit=11,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_holiday_reduction_time": FeatureRegister(
         address=61608,
@@ -902,6 +1070,7 @@ BMS_REGISTERS = {
         visible_adresss=62506,
         visible_bit=12,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_holiday_reduction_time": FeatureRegister(
         address=61609,
@@ -911,6 +1080,7 @@ BMS_REGISTERS = {
         visible_adresss=62506,
         visible_bit=13,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_diff_degree_minute": FeatureRegister(
         address=61610,
@@ -920,6 +1090,7 @@ BMS_REGISTERS = {
         visible_adresss=62506,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "heat_pump_delay_between": FeatureRegister(
         address=61611,
@@ -929,6 +1100,7 @@ BMS_REGISTERS = {
         visible_adresss=62506,
         visible_bit=15,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "e1_diff_add_heat_degree_minute": FeatureRegister(
         address=61612,
@@ -938,6 +1110,7 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=0,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "e2_start_0_10v_degree_minute": FeatureRegister(
         address=61613,
@@ -947,6 +1120,8 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=1,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "e2_diff_0_10v_degree_minute": FeatureRegister(
         address=61614,
@@ -956,6 +1131,7 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=2,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "e3_start_ecominiel_degree_minute": FeatureRegister(
         address=61615,
@@ -965,6 +1141,8 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=3,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "e3_number_of_steps_heating": FeatureRegister(
         address=61616,
@@ -974,6 +1152,7 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "e3_number_of_steps_dhw": FeatureRegister(
         address=61617,
@@ -983,6 +1162,7 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=5,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "e3_diff_step_ecominiel": FeatureRegister(
         address=61618,
@@ -992,6 +1172,7 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=6,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "e1_delay_add_heat_e1": FeatureRegister(
         address=61619,
@@ -1001,6 +1182,7 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=7,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "e2_delay_add_heat_0_10v": FeatureRegister(
         address=61620,
@@ -1010,6 +1192,7 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=8,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "e2_diff_0_10v_delay": FeatureRegister(
         address=61621,
@@ -1019,6 +1202,7 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=9,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "e3_delay_ecominiel": FeatureRegister(
         address=61622,
@@ -1028,6 +1212,7 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=10,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "e3_delay_steps_heating": FeatureRegister(
         address=61623,
@@ -1037,6 +1222,7 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=11,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_primary_flow_outdoor_20": FeatureRegister(
         address=61624,
@@ -1046,6 +1232,8 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=12,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_primary_flow_outdoor_40": FeatureRegister(
         address=61625,
@@ -1055,6 +1243,8 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=13,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_min_flow_temp": FeatureRegister(
         address=61626,
@@ -1064,6 +1254,8 @@ BMS_REGISTERS = {
         visible_adresss=62507,
         visible_bit=14,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "delay_mixing_valve_setting": FeatureRegister(
         address=61629,
@@ -1073,6 +1265,7 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=1,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "wood_boiler_start_flue_gas": FeatureRegister(
         address=61630,
@@ -1082,6 +1275,7 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=2,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "wood_boiler_start_boiler_temp": FeatureRegister(
         address=61631,
@@ -1091,6 +1285,8 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=3,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "wood_boiler_hysteresis": FeatureRegister(
         address=61632,
@@ -1100,6 +1296,7 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=4,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "boiler_lower_temp": FeatureRegister(
         address=61633,
@@ -1109,6 +1306,8 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=5,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "boiler_upper_temp": FeatureRegister(
         address=61634,
@@ -1118,6 +1317,8 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=6,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "boiler_add_heat_temp": FeatureRegister(
         address=61635,
@@ -1127,6 +1328,8 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=7,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "boiler_dhw_temp": FeatureRegister(
         address=61636,
@@ -1136,6 +1339,8 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=8,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "diff_thermostat_start_temp_diff": FeatureRegister(
         address=61637,
@@ -1145,6 +1350,7 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=9,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "diff_thermostat_stop_temp_diff": FeatureRegister(
         address=61638,
@@ -1154,6 +1360,7 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=10,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "diff_thermostat_charge_temp": FeatureRegister(
         address=61639,
@@ -1163,6 +1370,7 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=11,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "solar_deltat_max": FeatureRegister(
         address=61640,
@@ -1172,6 +1380,7 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=12,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "solar_deltat_min": FeatureRegister(
         address=61641,
@@ -1181,6 +1390,7 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=13,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "solar_charge_pump_min": FeatureRegister(
         address=61642,
@@ -1190,6 +1400,7 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     # TODO : Rename the following registers to be more descriptive
     "solar_deltat_max_borehole": FeatureRegister(
@@ -1200,6 +1411,7 @@ BMS_REGISTERS = {
         visible_adresss=62508,
         visible_bit=15,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "solar_deltat_min_borehole": FeatureRegister(
         address=61644,
@@ -1209,6 +1421,7 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=0,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "solar_h_tank_charge_temp": FeatureRegister(
         address=61645,
@@ -1218,6 +1431,8 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=1,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "solar_x_tank_charge_temp": FeatureRegister(
         address=61646,
@@ -1227,6 +1442,8 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=2,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "solar_eco_tank_charge_temp": FeatureRegister(
         address=61647,
@@ -1236,6 +1453,8 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=3,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "solar_h_tank_charge_start_diff": FeatureRegister(
         address=61648,
@@ -1245,6 +1464,7 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "solar_h_tank_charge_stop_diff": FeatureRegister(
         address=61649,
@@ -1254,6 +1474,7 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=5,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "solar_h_tank_charge_stop_temp": FeatureRegister(
         address=61650,
@@ -1263,6 +1484,8 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=6,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     # Registers to rename ends here
     "wood_boiler_buffer_tank_delay_recharge_time": FeatureRegister(
@@ -1273,6 +1496,7 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=7,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "setpoint_upper_tank_el_heater": FeatureRegister(
         address=61652,
@@ -1282,6 +1506,7 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=8,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "capacity_start_point_charging_dhw": FeatureRegister(
         address=61653,
@@ -1291,6 +1516,7 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=9,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "lower_temp_sensor_start_point_charging_dhw": FeatureRegister(
         address=61654,
@@ -1300,6 +1526,8 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=10,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "ventilation_mode": FeatureRegister(
         address=61655,
@@ -1309,6 +1537,7 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=11,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "night_cooling_on_off": FeatureRegister(
         address=61656,
@@ -1318,6 +1547,7 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=12,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "ventilation_away_mode": FeatureRegister(
         address=61657,
@@ -1327,6 +1557,7 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=13,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "pool_enable": FeatureRegister(
         address=61658,
@@ -1336,6 +1567,7 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "room_temp_cooling": FeatureRegister(
         address=61659,
@@ -1345,6 +1577,8 @@ BMS_REGISTERS = {
         visible_adresss=62509,
         visible_bit=15,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_permitted_from_outdoor_temp": FeatureRegister(
         address=61660,
@@ -1354,6 +1588,8 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=0,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_delay_active": FeatureRegister(
         address=61661,
@@ -1363,6 +1599,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=1,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "delay_cooling_from_heating_off": FeatureRegister(
         address=61662,
@@ -1372,6 +1609,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=2,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_start_delay": FeatureRegister(
         address=61663,
@@ -1381,6 +1619,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=3,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_diff_calc_delay": FeatureRegister(
         address=61664,
@@ -1390,6 +1629,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "primary_flow_temp_outdoor_20": FeatureRegister(
         address=61665,
@@ -1399,6 +1639,8 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=5,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "primary_flow_temp_outdoor_40": FeatureRegister(
         address=61666,
@@ -1408,6 +1650,8 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=6,
         scale=0.1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "primary_flow_diff_outdoor_20": FeatureRegister(
         address=61667,
@@ -1417,6 +1661,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=7,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "primary_flow_diff_outdoor_40": FeatureRegister(
         address=61668,
@@ -1426,6 +1671,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=8,
         scale=0.1,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_max_time_hp_active": FeatureRegister(
         address=61669,
@@ -1435,6 +1681,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=9,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_hp_charge_pump_speed": FeatureRegister(
         address=61670,
@@ -1444,6 +1691,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=10,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_heating_program": FeatureRegister(
         address=61671,
@@ -1453,6 +1701,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=11,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_heating_program": FeatureRegister(
         address=61672,
@@ -1462,6 +1711,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=12,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_heating_program": FeatureRegister(
         address=61673,
@@ -1471,6 +1721,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=13,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_heating_program": FeatureRegister(
         address=61674,
@@ -1480,6 +1731,7 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_curve_point_1_x": FeatureRegister(
         address=61675,
@@ -1489,6 +1741,8 @@ BMS_REGISTERS = {
         visible_adresss=62510,
         visible_bit=15,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_curve_point_1_y": FeatureRegister(
         address=61676,
@@ -1498,6 +1752,7 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=0,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_curve_point_2_x": FeatureRegister(
         address=61677,
@@ -1507,6 +1762,8 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=1,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_curve_point_2_y": FeatureRegister(
         address=61678,
@@ -1516,6 +1773,7 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=2,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_curve_point_3_x": FeatureRegister(
         address=61679,
@@ -1525,6 +1783,8 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=3,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_curve_point_3_y": FeatureRegister(
         address=61680,
@@ -1534,6 +1794,7 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_curve_point_4_x": FeatureRegister(
         address=61681,
@@ -1543,6 +1804,8 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=5,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_curve_point_4_y": FeatureRegister(
         address=61682,
@@ -1552,6 +1815,7 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=6,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_curve_point_5_x": FeatureRegister(
         address=61683,
@@ -1561,6 +1825,8 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=7,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_1_curve_point_5_y": FeatureRegister(
         address=61684,
@@ -1570,6 +1836,7 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=8,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_curve_point_1_x": FeatureRegister(
         address=61685,
@@ -1579,6 +1846,8 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=9,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_curve_point_1_y": FeatureRegister(
         address=61686,
@@ -1588,6 +1857,7 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=10,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_curve_point_2_x": FeatureRegister(
         address=61687,
@@ -1597,6 +1867,8 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=11,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_curve_point_2_y": FeatureRegister(
         address=61688,
@@ -1606,6 +1878,7 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=12,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_curve_point_3_x": FeatureRegister(
         address=61689,
@@ -1615,6 +1888,8 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=13,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_curve_point_3_y": FeatureRegister(
         address=61690,
@@ -1624,6 +1899,7 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_curve_point_4_x": FeatureRegister(
         address=61691,
@@ -1633,6 +1909,8 @@ BMS_REGISTERS = {
         visible_adresss=62511,
         visible_bit=15,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_curve_point_4_y": FeatureRegister(
         address=61692,
@@ -1642,6 +1920,7 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=0,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_curve_point_5_x": FeatureRegister(
         address=61693,
@@ -1651,6 +1930,8 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=1,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_2_curve_point_5_y": FeatureRegister(
         address=61694,
@@ -1660,6 +1941,7 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=2,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_curve_point_1_x": FeatureRegister(
         address=61695,
@@ -1669,6 +1951,8 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=3,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_curve_point_1_y": FeatureRegister(
         address=61696,
@@ -1678,6 +1962,7 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_curve_point_2_x": FeatureRegister(
         address=61697,
@@ -1687,6 +1972,8 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=5,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_curve_point_2_y": FeatureRegister(
         address=61698,
@@ -1696,6 +1983,7 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=6,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_curve_point_3_x": FeatureRegister(
         address=61699,
@@ -1705,6 +1993,8 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=7,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_curve_point_3_y": FeatureRegister(
         address=61700,
@@ -1714,6 +2004,7 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=8,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_curve_point_4_x": FeatureRegister(
         address=61701,
@@ -1723,6 +2014,8 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=9,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_curve_point_4_y": FeatureRegister(
         address=61702,
@@ -1732,6 +2025,7 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=10,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_curve_point_5_x": FeatureRegister(
         address=61703,
@@ -1741,6 +2035,8 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=11,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_3_curve_point_5_y": FeatureRegister(
         address=61704,
@@ -1750,6 +2046,7 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=12,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_curve_point_1_x": FeatureRegister(
         address=61705,
@@ -1759,6 +2056,8 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=13,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_curve_point_1_y": FeatureRegister(
         address=61706,
@@ -1768,6 +2067,7 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_curve_point_2_x": FeatureRegister(
         address=61707,
@@ -1777,6 +2077,8 @@ BMS_REGISTERS = {
         visible_adresss=62512,
         visible_bit=15,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_curve_point_2_y": FeatureRegister(
         address=61708,
@@ -1786,6 +2088,7 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=0,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_curve_point_3_x": FeatureRegister(
         address=61709,
@@ -1795,6 +2098,8 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=1,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_curve_point_3_y": FeatureRegister(
         address=61710,
@@ -1804,6 +2109,7 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=2,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_curve_point_4_x": FeatureRegister(
         address=61711,
@@ -1813,6 +2119,8 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=3,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_curve_point_4_y": FeatureRegister(
         address=61712,
@@ -1822,6 +2130,7 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_curve_point_5_x": FeatureRegister(
         address=61713,
@@ -1831,6 +2140,8 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=5,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "hc_4_curve_point_5_y": FeatureRegister(
         address=61714,
@@ -1840,6 +2151,7 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=6,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_curve_point_1_x": FeatureRegister(
         address=61715,
@@ -1849,6 +2161,8 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=7,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_curve_point_1_y": FeatureRegister(
         address=61716,
@@ -1858,6 +2172,7 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=8,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_curve_point_2_x": FeatureRegister(
         address=61717,
@@ -1867,6 +2182,8 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=9,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_curve_point_2_y": FeatureRegister(
         address=61718,
@@ -1876,6 +2193,7 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=10,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_curve_point_3_x": FeatureRegister(
         address=61719,
@@ -1885,6 +2203,8 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=11,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_curve_point_3_y": FeatureRegister(
         address=61720,
@@ -1894,6 +2214,7 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=12,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_curve_point_4_x": FeatureRegister(
         address=61721,
@@ -1903,6 +2224,8 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=13,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_curve_point_4_y": FeatureRegister(
         address=61722,
@@ -1912,6 +2235,7 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_curve_point_5_x": FeatureRegister(
         address=61723,
@@ -1921,6 +2245,8 @@ BMS_REGISTERS = {
         visible_adresss=62513,
         visible_bit=15,
         scale=1,
+        signed=True,
+        poll_class=PollClass.SETTING,
     ),
     "cooling_curve_point_5_y": FeatureRegister(
         address=61724,
@@ -1930,6 +2256,7 @@ BMS_REGISTERS = {
         visible_adresss=62514,
         visible_bit=0,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_1_heating_on_time": FeatureRegister(
         address=61725,
@@ -1939,6 +2266,7 @@ BMS_REGISTERS = {
         visible_adresss=62514,
         visible_bit=1,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_2_heating_on_time": FeatureRegister(
         address=61726,
@@ -1948,6 +2276,7 @@ BMS_REGISTERS = {
         visible_adresss=62514,
         visible_bit=2,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_3_heating_on_time": FeatureRegister(
         address=61727,
@@ -1957,6 +2286,7 @@ BMS_REGISTERS = {
         visible_adresss=62514,
         visible_bit=3,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     "hs_4_heating_on_time": FeatureRegister(
         address=61728,
@@ -1966,6 +2296,7 @@ BMS_REGISTERS = {
         visible_adresss=62514,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.SETTING,
     ),
     ###### Read Only ######
     "outdoor_temperature": FeatureRegister(
@@ -1976,6 +2307,7 @@ BMS_REGISTERS = {
         visible_adresss=62531,
         visible_bit=4,
         scale=0.1,
+        signed=True,
     ),
     "stop_temp_dhw": FeatureRegister(
         address=62001,
@@ -1985,6 +2317,7 @@ BMS_REGISTERS = {
         visible_adresss=62531,
         visible_bit=5,
         scale=0.1,
+        signed=True,
     ),
     "setpoint_outlet_temp_dhw": FeatureRegister(
         address=62002,
@@ -1994,6 +2327,7 @@ BMS_REGISTERS = {
         visible_adresss=62531,
         visible_bit=6,
         scale=1,
+        signed=True,
     ),
     "hot_water_temp": FeatureRegister(
         address=62003,
@@ -2003,6 +2337,7 @@ BMS_REGISTERS = {
         visible_adresss=62531,
         visible_bit=7,
         scale=0.1,
+        signed=True,
     ),
     "delay_mixing_valve": FeatureRegister(
         address=62004,
@@ -2030,6 +2365,7 @@ BMS_REGISTERS = {
         visible_adresss=62531,
         visible_bit=10,
         scale=0.1,
+        signed=True,
     ),
     "hs_1_temp_setpoint": FeatureRegister(
         address=62007,
@@ -2039,6 +2375,7 @@ BMS_REGISTERS = {
         visible_adresss=62531,
         visible_bit=11,
         scale=0.1,
+        signed=True,
     ),
     "hs_2_temp_setpoint": FeatureRegister(
         address=62008,
@@ -2048,6 +2385,7 @@ BMS_REGISTERS = {
         visible_adresss=62531,
         visible_bit=12,
         scale=0.1,
+        signed=True,
     ),
     "hs_3_temp_setpoint": FeatureRegister(
         address=62009,
@@ -2057,6 +2395,7 @@ BMS_REGISTERS = {
         visible_adresss=62531,
         visible_bit=13,
         scale=0.1,
+        signed=True,
     ),
     "hs_4_temp_setpoint": FeatureRegister(
         address=62010,
@@ -2066,6 +2405,7 @@ BMS_REGISTERS = {
         visible_adresss=62531,
         visible_bit=14,
         scale=0.1,
+        signed=True,
     ),
     "hs_1_primary_flow_temp": FeatureRegister(
         address=62011,
@@ -2075,6 +2415,7 @@ BMS_REGISTERS = {
         visible_adresss=62531,
         visible_bit=15,
         scale=0.1,
+        signed=True,
     ),
     "hs_2_primary_flow_temp": FeatureRegister(
         address=62012,
@@ -2084,6 +2425,7 @@ BMS_REGISTERS = {
         visible_adresss=62532,
         visible_bit=0,
         scale=0.1,
+        signed=True,
     ),
     "hs_3_primary_flow_temp": FeatureRegister(
         address=62013,
@@ -2093,6 +2435,7 @@ BMS_REGISTERS = {
         visible_adresss=62532,
         visible_bit=1,
         scale=0.1,
+        signed=True,
     ),
     "hs_4_primary_flow_temp": FeatureRegister(
         address=62014,
@@ -2102,6 +2445,7 @@ BMS_REGISTERS = {
         visible_adresss=62532,
         visible_bit=2,
         scale=0.1,
+        signed=True,
     ),
     "return_temp": FeatureRegister(
         address=62015,
@@ -2111,6 +2455,7 @@ BMS_REGISTERS = {
         visible_adresss=62532,
         visible_bit=3,
         scale=0.1,
+        signed=True,
     ),
     "dhw_circulation": FeatureRegister(
         address=62016,
@@ -2219,6 +2564,7 @@ BMS_REGISTERS = {
         visible_adresss=62532,
         visible_bit=15,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_2_hp_in": FeatureRegister(
         address=62028,
@@ -2228,6 +2574,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=0,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_3_hp_in": FeatureRegister(
         address=62029,
@@ -2237,6 +2584,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=1,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_4_hp_in": FeatureRegister(
         address=62030,
@@ -2246,6 +2594,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=2,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_5_hp_in": FeatureRegister(
         address=62031,
@@ -2255,6 +2604,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=3,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_6_hp_in": FeatureRegister(
         address=62032,
@@ -2264,6 +2614,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=4,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_7_hp_in": FeatureRegister(
         address=62033,
@@ -2273,6 +2624,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=5,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_8_hp_in": FeatureRegister(
         address=62034,
@@ -2282,6 +2634,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=6,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_9_hp_in": FeatureRegister(
         address=62035,
@@ -2291,6 +2644,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=7,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_10_hp_in": FeatureRegister(
         address=62036,
@@ -2300,6 +2654,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=8,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_1_hp_out": FeatureRegister(
         address=62037,
@@ -2309,6 +2664,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=9,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_2_hp_out": FeatureRegister(
         address=62038,
@@ -2318,6 +2674,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=10,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_3_hp_out": FeatureRegister(
         address=62039,
@@ -2327,6 +2684,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=11,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_4_hp_out": FeatureRegister(
         address=62040,
@@ -2336,6 +2694,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=12,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_5_hp_out": FeatureRegister(
         address=62041,
@@ -2345,6 +2704,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=13,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_6_hp_out": FeatureRegister(
         address=62042,
@@ -2354,6 +2714,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=14,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_7_hp_out": FeatureRegister(
         address=62043,
@@ -2363,6 +2724,7 @@ BMS_REGISTERS = {
         visible_adresss=62533,
         visible_bit=15,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_8_hp_out": FeatureRegister(
         address=62044,
@@ -2372,6 +2734,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=0,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_9_hp_out": FeatureRegister(
         address=62045,
@@ -2381,6 +2744,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=1,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_10_hp_out": FeatureRegister(
         address=62046,
@@ -2390,6 +2754,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=2,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_1_discharge_temp": FeatureRegister(
         address=62047,
@@ -2399,6 +2764,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=3,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_2_discharge_temp": FeatureRegister(
         address=62048,
@@ -2408,6 +2774,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=4,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_3_discharge_temp": FeatureRegister(
         address=62049,
@@ -2417,6 +2784,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=5,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_4_discharge_temp": FeatureRegister(
         address=62050,
@@ -2426,6 +2794,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=6,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_5_discharge_temp": FeatureRegister(
         address=62051,
@@ -2435,6 +2804,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=7,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_6_discharge_temp": FeatureRegister(
         address=62052,
@@ -2444,6 +2814,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=8,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_7_discharge_temp": FeatureRegister(
         address=62053,
@@ -2453,6 +2824,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=9,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_8_discharge_temp": FeatureRegister(
         address=62054,
@@ -2462,6 +2834,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=10,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_9_discharge_temp": FeatureRegister(
         address=62055,
@@ -2471,6 +2844,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=11,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_10_discharge_temp": FeatureRegister(
         address=62056,
@@ -2480,6 +2854,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=12,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_1_suction_gas_temp": FeatureRegister(
         address=62057,
@@ -2489,6 +2864,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=13,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_2_suction_gas_temp": FeatureRegister(
         address=62058,
@@ -2498,6 +2874,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=14,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_3_suction_gas_temp": FeatureRegister(
         address=62059,
@@ -2507,6 +2884,7 @@ BMS_REGISTERS = {
         visible_adresss=62534,
         visible_bit=15,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_4_suction_gas_temp": FeatureRegister(
         address=62060,
@@ -2516,6 +2894,7 @@ BMS_REGISTERS = {
         visible_adresss=62535,
         visible_bit=0,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_5_suction_gas_temp": FeatureRegister(
         address=62061,
@@ -2525,6 +2904,7 @@ BMS_REGISTERS = {
         visible_adresss=62535,
         visible_bit=1,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_6_suction_gas_temp": FeatureRegister(
         address=62062,
@@ -2534,6 +2914,7 @@ BMS_REGISTERS = {
         visible_adresss=62535,
         visible_bit=2,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_7_suction_gas_temp": FeatureRegister(
         address=62063,
@@ -2543,6 +2924,7 @@ BMS_REGISTERS = {
         visible_adresss=62535,
         visible_bit=3,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_8_suction_gas_temp": FeatureRegister(
         address=62064,
@@ -2552,6 +2934,7 @@ BMS_REGISTERS = {
         visible_adresss=62535,
         visible_bit=4,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_9_suction_gas_temp": FeatureRegister(
         address=62065,
@@ -2561,6 +2944,7 @@ BMS_REGISTERS = {
         visible_adresss=62535,
         visible_bit=5,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_10_suction_gas_temp": FeatureRegister(
         address=62066,
@@ -2570,6 +2954,7 @@ BMS_REGISTERS = {
         visible_adresss=62535,
         visible_bit=6,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_1_high_pressure": FeatureRegister(
         address=62067,
@@ -2759,6 +3144,7 @@ BMS_REGISTERS = {
         visible_adresss=62536,
         visible_bit=11,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_2_brine_in": FeatureRegister(
         address=62088,
@@ -2768,6 +3154,7 @@ BMS_REGISTERS = {
         visible_adresss=62536,
         visible_bit=12,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_3_brine_in": FeatureRegister(
         address=62089,
@@ -2777,6 +3164,7 @@ BMS_REGISTERS = {
         visible_adresss=62536,
         visible_bit=13,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_4_brine_in": FeatureRegister(
         address=62090,
@@ -2786,6 +3174,7 @@ BMS_REGISTERS = {
         visible_adresss=62536,
         visible_bit=14,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_5_brine_in": FeatureRegister(
         address=62091,
@@ -2795,6 +3184,7 @@ BMS_REGISTERS = {
         visible_adresss=62536,
         visible_bit=15,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_6_brine_in": FeatureRegister(
         address=62092,
@@ -2804,6 +3194,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=0,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_7_brine_in": FeatureRegister(
         address=62093,
@@ -2813,6 +3204,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=1,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_8_brine_in": FeatureRegister(
         address=62094,
@@ -2822,6 +3214,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=2,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_9_brine_in": FeatureRegister(
         address=62095,
@@ -2831,6 +3224,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=3,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_10_brine_in": FeatureRegister(
         address=62096,
@@ -2840,6 +3234,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=4,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_1_brine_out": FeatureRegister(
         address=62097,
@@ -2849,6 +3244,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=5,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_2_brine_out": FeatureRegister(
         address=62098,
@@ -2858,6 +3254,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=6,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_3_brine_out": FeatureRegister(
         address=62099,
@@ -2867,6 +3264,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=7,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_4_brine_out": FeatureRegister(
         address=62100,
@@ -2876,6 +3274,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=8,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_5_brine_out": FeatureRegister(
         address=62101,
@@ -2885,6 +3284,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=9,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_6_brine_out": FeatureRegister(
         address=62102,
@@ -2894,6 +3294,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=10,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_7_brine_out": FeatureRegister(
         address=62103,
@@ -2903,6 +3304,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=11,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_8_brine_out": FeatureRegister(
         address=62104,
@@ -2912,6 +3314,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=12,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_9_brine_out": FeatureRegister(
         address=62105,
@@ -2921,6 +3324,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=13,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_10_brine_out": FeatureRegister(
         address=62106,
@@ -2930,6 +3334,7 @@ BMS_REGISTERS = {
         visible_adresss=62537,
         visible_bit=14,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_1_charge_pump": FeatureRegister(
         address=62107,
@@ -3299,6 +3704,7 @@ BMS_REGISTERS = {
         visible_adresss=62540,
         visible_bit=7,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_2_outdoor_temp": FeatureRegister(
         address=62148,
@@ -3308,6 +3714,7 @@ BMS_REGISTERS = {
         visible_adresss=62540,
         visible_bit=8,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_3_outdoor_temp": FeatureRegister(
         address=62149,
@@ -3317,6 +3724,7 @@ BMS_REGISTERS = {
         visible_adresss=62540,
         visible_bit=9,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_4_outdoor_temp": FeatureRegister(
         address=62150,
@@ -3326,6 +3734,7 @@ BMS_REGISTERS = {
         visible_adresss=62540,
         visible_bit=10,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_5_outdoor_temp": FeatureRegister(
         address=62151,
@@ -3335,6 +3744,7 @@ BMS_REGISTERS = {
         visible_adresss=62540,
         visible_bit=11,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_6_outdoor_temp": FeatureRegister(
         address=62152,
@@ -3344,6 +3754,7 @@ BMS_REGISTERS = {
         visible_adresss=62540,
         visible_bit=12,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_7_outdoor_temp": FeatureRegister(
         address=62153,
@@ -3353,6 +3764,7 @@ BMS_REGISTERS = {
         visible_adresss=62540,
         visible_bit=13,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_8_outdoor_temp": FeatureRegister(
         address=62154,
@@ -3362,6 +3774,7 @@ BMS_REGISTERS = {
         visible_adresss=62540,
         visible_bit=14,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_9_outdoor_temp": FeatureRegister(
         address=62155,
@@ -3371,6 +3784,7 @@ BMS_REGISTERS = {
         visible_adresss=62540,
         visible_bit=15,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_10_outdoor_temp": FeatureRegister(
         address=62156,
@@ -3380,6 +3794,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=0,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_1_software_version": FeatureRegister(
         address=62157,
@@ -3389,6 +3804,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=1,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_2_software_version": FeatureRegister(
         address=62158,
@@ -3398,6 +3814,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=2,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_3_software_version": FeatureRegister(
         address=62159,
@@ -3407,6 +3824,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=3,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_4_software_version": FeatureRegister(
         address=62160,
@@ -3416,6 +3834,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_5_software_version": FeatureRegister(
         address=62161,
@@ -3425,6 +3844,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=5,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_6_software_version": FeatureRegister(
         address=62162,
@@ -3434,6 +3854,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=6,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_7_software_version": FeatureRegister(
         address=62163,
@@ -3443,6 +3864,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=7,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_8_software_version": FeatureRegister(
         address=62164,
@@ -3452,6 +3874,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=8,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_9_software_version": FeatureRegister(
         address=62165,
@@ -3461,6 +3884,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=9,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_10_software_version": FeatureRegister(
         address=62166,
@@ -3470,6 +3894,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=10,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "degree_minute": FeatureRegister(
         address=62167,
@@ -3479,6 +3904,7 @@ BMS_REGISTERS = {
         visible_adresss=62541,
         visible_bit=11,
         scale=0.1,
+        signed=True,
     ),
     "power_kw_immersion_heater": FeatureRegister(
         address=62168,
@@ -3560,6 +3986,7 @@ BMS_REGISTERS = {
         visible_adresss=62542,
         visible_bit=4,
         scale=0.1,
+        signed=True,
     ),
     "ehs_primary_flow_mode": FeatureRegister(
         address=62177,
@@ -3587,6 +4014,7 @@ BMS_REGISTERS = {
         visible_adresss=62542,
         visible_bit=7,
         scale=0.1,
+        signed=True,
     ),
     "pool_stop_temperature": FeatureRegister(
         address=62180,
@@ -3596,6 +4024,7 @@ BMS_REGISTERS = {
         visible_adresss=62542,
         visible_bit=8,
         scale=0.1,
+        signed=True,
     ),
     "solar_mode": FeatureRegister(
         address=62181,
@@ -3614,6 +4043,7 @@ BMS_REGISTERS = {
         visible_adresss=62542,
         visible_bit=10,
         scale=0.1,
+        signed=True,
     ),
     "solar_temperature_in": FeatureRegister(
         address=62183,
@@ -3623,6 +4053,7 @@ BMS_REGISTERS = {
         visible_adresss=62542,
         visible_bit=11,
         scale=0.1,
+        signed=True,
     ),
     "solar_pump_panel": FeatureRegister(
         address=62184,
@@ -3650,6 +4081,7 @@ BMS_REGISTERS = {
         visible_adresss=62542,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "stat_immersion_heater_kwh": FeatureRegister(
         address=62191,
@@ -3659,6 +4091,7 @@ BMS_REGISTERS = {
         visible_adresss=62543,
         visible_bit=3,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "function_test": FeatureRegister(
         address=62192,
@@ -3767,6 +4200,7 @@ BMS_REGISTERS = {
         visible_adresss=62543,
         visible_bit=15,
         scale=0.1,
+        signed=True,
     ),
     "current_room_temp_2": FeatureRegister(
         address=62204,
@@ -3776,6 +4210,7 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=0,
         scale=0.1,
+        signed=True,
     ),
     "current_room_temp_3": FeatureRegister(
         address=62205,
@@ -3785,6 +4220,7 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=1,
         scale=0.1,
+        signed=True,
     ),
     "current_room_temp_4": FeatureRegister(
         address=62206,
@@ -3794,6 +4230,7 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=2,
         scale=0.1,
+        signed=True,
     ),
     "system_type": FeatureRegister(
         address=62207,
@@ -3803,6 +4240,7 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=3,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "wood_flue_gas_temp_b8": FeatureRegister(
         address=62208,
@@ -3812,6 +4250,7 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=4,
         scale=1,
+        signed=True,
     ),
     "wood_boiler_temp_b9": FeatureRegister(
         address=62209,
@@ -3821,6 +4260,7 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=5,
         scale=1,
+        signed=True,
     ),
     "e1_boiler_temp_b9": FeatureRegister(
         address=62210,
@@ -3830,6 +4270,7 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=6,
         scale=0.1,
+        signed=True,
     ),
     "e1_boiler_out_temp_b10": FeatureRegister(
         address=62211,
@@ -3839,6 +4280,7 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=7,
         scale=0.1,
+        signed=True,
     ),
     "e2_number_of_steps": FeatureRegister(
         address=62212,
@@ -3858,7 +4300,7 @@ BMS_REGISTERS = {
         visible_bit=9,
         scale=1,
     ),
-    "heat_pump_1_compressor_operating_time_lsb": FeatureRegister(
+    "heat_pump_1_compressor_operating_time": FeatureRegister(
         address=62214,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -3866,8 +4308,10 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=10,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_2_compressor_operating_time_lsb": FeatureRegister(
+    "heat_pump_2_compressor_operating_time": FeatureRegister(
         address=62216,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -3875,8 +4319,10 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=12,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_3_compressor_operating_time_lsb": FeatureRegister(
+    "heat_pump_3_compressor_operating_time": FeatureRegister(
         address=62218,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -3884,8 +4330,10 @@ BMS_REGISTERS = {
         visible_adresss=62544,
         visible_bit=14,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_4_compressor_operating_time_lsb": FeatureRegister(
+    "heat_pump_4_compressor_operating_time": FeatureRegister(
         address=62220,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -3893,8 +4341,10 @@ BMS_REGISTERS = {
         visible_adresss=62545,
         visible_bit=0,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_5_compressor_operating_time_lsb": FeatureRegister(
+    "heat_pump_5_compressor_operating_time": FeatureRegister(
         address=62222,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -3902,8 +4352,10 @@ BMS_REGISTERS = {
         visible_adresss=62545,
         visible_bit=2,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_6_compressor_operating_time_lsb": FeatureRegister(
+    "heat_pump_6_compressor_operating_time": FeatureRegister(
         address=62224,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -3911,8 +4363,10 @@ BMS_REGISTERS = {
         visible_adresss=62545,
         visible_bit=4,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_7_compressor_operating_time_lsb": FeatureRegister(
+    "heat_pump_7_compressor_operating_time": FeatureRegister(
         address=62226,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -3920,8 +4374,10 @@ BMS_REGISTERS = {
         visible_adresss=62545,
         visible_bit=6,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_8_compressor_operating_time_lsb": FeatureRegister(
+    "heat_pump_8_compressor_operating_time": FeatureRegister(
         address=62228,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -3929,8 +4385,10 @@ BMS_REGISTERS = {
         visible_adresss=62545,
         visible_bit=8,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_9_compressor_operating_time_lsb": FeatureRegister(
+    "heat_pump_9_compressor_operating_time": FeatureRegister(
         address=62230,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -3938,8 +4396,10 @@ BMS_REGISTERS = {
         visible_adresss=62545,
         visible_bit=10,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_10_compressor_operating_time_lsb": FeatureRegister(
+    "heat_pump_10_compressor_operating_time": FeatureRegister(
         address=62232,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -3947,6 +4407,8 @@ BMS_REGISTERS = {
         visible_adresss=62545,
         visible_bit=12,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
     "heat_pump_1_compressor_last_24h": FeatureRegister(
         address=62234,
@@ -3956,6 +4418,7 @@ BMS_REGISTERS = {
         visible_adresss=62545,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "heat_pump_2_compressor_last_24h": FeatureRegister(
         address=62235,
@@ -3965,6 +4428,7 @@ BMS_REGISTERS = {
         visible_adresss=62545,
         visible_bit=15,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "heat_pump_3_compressor_last_24h": FeatureRegister(
         address=62236,
@@ -3974,6 +4438,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=0,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "heat_pump_4_compressor_last_24h": FeatureRegister(
         address=62237,
@@ -3983,6 +4448,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=1,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "heat_pump_5_compressor_last_24h": FeatureRegister(
         address=62238,
@@ -3992,6 +4458,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=2,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "heat_pump_6_compressor_last_24h": FeatureRegister(
         address=62239,
@@ -4001,6 +4468,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=3,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "heat_pump_7_compressor_last_24h": FeatureRegister(
         address=62240,
@@ -4010,6 +4478,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "heat_pump_8_compressor_last_24h": FeatureRegister(
         address=62241,
@@ -4019,6 +4488,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=5,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "heat_pump_9_compressor_last_24h": FeatureRegister(
         address=62242,
@@ -4028,6 +4498,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=6,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "heat_pump_10_compressor_last_24h": FeatureRegister(
         address=62243,
@@ -4037,6 +4508,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=7,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "software_version_display_month_day": FeatureRegister(
         address=62244,
@@ -4046,6 +4518,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=8,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "software_version_display_year": FeatureRegister(
         address=62245,
@@ -4055,6 +4528,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=9,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "hs_1_status": FeatureRegister(
         address=62246,
@@ -4100,6 +4574,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=14,
         scale=0.1,
+        signed=True,
     ),
     "ext_buffer_tank_lower_b42": FeatureRegister(
         address=62251,
@@ -4109,6 +4584,7 @@ BMS_REGISTERS = {
         visible_adresss=62546,
         visible_bit=15,
         scale=0.1,
+        signed=True,
     ),
     "ext_dhw_buffer_tank_b43": FeatureRegister(
         address=62252,
@@ -4118,6 +4594,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=0,
         scale=0.1,
+        signed=True,
     ),
     "product_type": FeatureRegister(
         address=62253,
@@ -4127,6 +4604,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=1,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_1_type": FeatureRegister(
         address=62254,
@@ -4136,6 +4614,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=4,
         scale=2,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_2_type": FeatureRegister(
         address=62255,
@@ -4145,6 +4624,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=3,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_3_type": FeatureRegister(
         address=62256,
@@ -4154,6 +4634,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_4_type": FeatureRegister(
         address=62257,
@@ -4163,6 +4644,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=5,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_5_type": FeatureRegister(
         address=62258,
@@ -4172,6 +4654,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=6,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_6_type": FeatureRegister(
         address=62259,
@@ -4181,6 +4664,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=7,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_7_type": FeatureRegister(
         address=62260,
@@ -4190,6 +4674,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=8,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_8_type": FeatureRegister(
         address=62261,
@@ -4199,6 +4684,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=9,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_9_type": FeatureRegister(
         address=62262,
@@ -4208,6 +4694,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=10,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_10_type": FeatureRegister(
         address=62263,
@@ -4217,6 +4704,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=11,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_1_compressor_model": FeatureRegister(
         address=62264,
@@ -4226,6 +4714,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=12,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_2_compressor_model": FeatureRegister(
         address=62265,
@@ -4235,6 +4724,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=13,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_3_compressor_model": FeatureRegister(
         address=62266,
@@ -4244,6 +4734,7 @@ BMS_REGISTERS = {
         visible_adresss=62547,
         visible_bit=14,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_4_compressor_model": FeatureRegister(
         address=62267,
@@ -4253,6 +4744,7 @@ BMS_REGISTERS = {
         visible_adresss=62548,
         visible_bit=15,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_5_compressor_model": FeatureRegister(
         address=62268,
@@ -4262,6 +4754,7 @@ BMS_REGISTERS = {
         visible_adresss=62548,
         visible_bit=0,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_6_compressor_model": FeatureRegister(
         address=62269,
@@ -4271,6 +4764,7 @@ BMS_REGISTERS = {
         visible_adresss=62548,
         visible_bit=1,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_7_compressor_model": FeatureRegister(
         address=62270,
@@ -4280,6 +4774,7 @@ BMS_REGISTERS = {
         visible_adresss=62548,
         visible_bit=2,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_8_compressor_model": FeatureRegister(
         address=62271,
@@ -4289,6 +4784,7 @@ BMS_REGISTERS = {
         visible_adresss=62548,
         visible_bit=3,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_9_compressor_model": FeatureRegister(
         address=62272,
@@ -4298,6 +4794,7 @@ BMS_REGISTERS = {
         visible_adresss=62548,
         visible_bit=4,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "heat_pump_10_compressor_model": FeatureRegister(
         address=62273,
@@ -4307,6 +4804,7 @@ BMS_REGISTERS = {
         visible_adresss=62548,
         visible_bit=5,
         scale=1,
+        poll_class=PollClass.IDENTITY,
     ),
     "setpoint_lower_tank": FeatureRegister(
         address=62274,
@@ -4325,6 +4823,7 @@ BMS_REGISTERS = {
         visible_adresss=62548,
         visible_bit=7,
         scale=0.1,
+        signed=True,
     ),
     "actual_temp_dhw": FeatureRegister(
         address=62276,
@@ -4334,6 +4833,7 @@ BMS_REGISTERS = {
         visible_adresss=62548,
         visible_bit=8,
         scale=0.1,
+        signed=True,
     ),
     "actual_temp_tank_solar_coil": FeatureRegister(
         address=62277,
@@ -4343,6 +4843,7 @@ BMS_REGISTERS = {
         visible_adresss=62548,
         visible_bit=9,
         scale=0.1,
+        signed=True,
     ),
     "calculated_setpoint_upper_tank_el_heater": FeatureRegister(
         address=62278,
@@ -4424,6 +4925,7 @@ BMS_REGISTERS = {
         visible_adresss=62549,
         visible_bit=5,
         scale=0.1,
+        signed=True,
     ),
     "active_cooling_return_temp": FeatureRegister(
         address=62290,
@@ -4433,6 +4935,7 @@ BMS_REGISTERS = {
         visible_adresss=62549,
         visible_bit=6,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_1_primary_system_flow": FeatureRegister(
         address=62291,
@@ -4784,6 +5287,7 @@ BMS_REGISTERS = {
         visible_adresss=62551,
         visible_bit=13,
         scale=1,
+        poll_class=PollClass.COUNTER,
     ),
     "current_room_temp_cooling": FeatureRegister(
         address=62330,
@@ -4793,6 +5297,7 @@ BMS_REGISTERS = {
         visible_adresss=62551,
         visible_bit=14,
         scale=0.1,
+        signed=True,
     ),
     "heat_pump_1_power_consumption_kw": FeatureRegister(
         address=62331,
@@ -4884,7 +5389,7 @@ BMS_REGISTERS = {
         visible_bit=8,
         scale=0.1,
     ),
-    "heat_pump_1_compressor_power_consumption_kwh_lsb": FeatureRegister(
+    "heat_pump_1_compressor_power_consumption_kwh": FeatureRegister(
         address=62341,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -4892,17 +5397,10 @@ BMS_REGISTERS = {
         visible_adresss=62552,
         visible_bit=9,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_1_compressor_power_consumption_kwh_msb": FeatureRegister(
-        address=62342,
-        max_value_adresss=None,
-        min_value_adresss=None,
-        step_adresss=None,
-        visible_adresss=62552,
-        visible_bit=10,
-        scale=1,
-    ),
-    "heat_pump_2_compressor_power_consumption_kwh_lsb": FeatureRegister(
+    "heat_pump_2_compressor_power_consumption_kwh": FeatureRegister(
         address=62343,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -4910,17 +5408,10 @@ BMS_REGISTERS = {
         visible_adresss=62552,
         visible_bit=11,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_2_compressor_power_consumption_kwh_msb": FeatureRegister(
-        address=62344,
-        max_value_adresss=None,
-        min_value_adresss=None,
-        step_adresss=None,
-        visible_adresss=62552,
-        visible_bit=12,
-        scale=1,
-    ),
-    "heat_pump_3_compressor_power_consumption_kwh_lsb": FeatureRegister(
+    "heat_pump_3_compressor_power_consumption_kwh": FeatureRegister(
         address=62345,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -4928,17 +5419,10 @@ BMS_REGISTERS = {
         visible_adresss=62552,
         visible_bit=13,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_3_compressor_power_consumption_kwh_msb": FeatureRegister(
-        address=62346,
-        max_value_adresss=None,
-        min_value_adresss=None,
-        step_adresss=None,
-        visible_adresss=62552,
-        visible_bit=14,
-        scale=1,
-    ),
-    "heat_pump_4_compressor_power_consumption_kwh_lsb": FeatureRegister(
+    "heat_pump_4_compressor_power_consumption_kwh": FeatureRegister(
         address=62347,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -4946,17 +5430,10 @@ BMS_REGISTERS = {
         visible_adresss=62552,
         visible_bit=15,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_4_compressor_power_consumption_kwh_msb": FeatureRegister(
-        address=62348,
-        max_value_adresss=None,
-        min_value_adresss=None,
-        step_adresss=None,
-        visible_adresss=62553,
-        visible_bit=0,
-        scale=1,
-    ),
-    "heat_pump_5_compressor_power_consumption_kwh_lsb": FeatureRegister(
+    "heat_pump_5_compressor_power_consumption_kwh": FeatureRegister(
         address=62349,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -4964,17 +5441,10 @@ BMS_REGISTERS = {
         visible_adresss=62553,
         visible_bit=1,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_5_compressor_power_consumption_kwh_msb": FeatureRegister(
-        address=62350,
-        max_value_adresss=None,
-        min_value_adresss=None,
-        step_adresss=None,
-        visible_adresss=62553,
-        visible_bit=2,
-        scale=1,
-    ),
-    "heat_pump_6_compressor_power_consumption_kwh_lsb": FeatureRegister(
+    "heat_pump_6_compressor_power_consumption_kwh": FeatureRegister(
         address=62351,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -4982,17 +5452,10 @@ BMS_REGISTERS = {
         visible_adresss=62553,
         visible_bit=3,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_6_compressor_power_consumption_kwh_msb": FeatureRegister(
-        address=62352,
-        max_value_adresss=None,
-        min_value_adresss=None,
-        step_adresss=None,
-        visible_adresss=62553,
-        visible_bit=4,
-        scale=1,
-    ),
-    "heat_pump_7_compressor_power_consumption_kwh_lsb": FeatureRegister(
+    "heat_pump_7_compressor_power_consumption_kwh": FeatureRegister(
         address=62353,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -5000,17 +5463,10 @@ BMS_REGISTERS = {
         visible_adresss=62553,
         visible_bit=5,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_7_compressor_power_consumption_kwh_msb": FeatureRegister(
-        address=62354,
-        max_value_adresss=None,
-        min_value_adresss=None,
-        step_adresss=None,
-        visible_adresss=62553,
-        visible_bit=6,
-        scale=1,
-    ),
-    "heat_pump_8_compressor_power_consumption_kwh_lsb": FeatureRegister(
+    "heat_pump_8_compressor_power_consumption_kwh": FeatureRegister(
         address=62355,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -5018,17 +5474,10 @@ BMS_REGISTERS = {
         visible_adresss=62553,
         visible_bit=7,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_8_compressor_power_consumption_kwh_msb": FeatureRegister(
-        address=62356,
-        max_value_adresss=None,
-        min_value_adresss=None,
-        step_adresss=None,
-        visible_adresss=62553,
-        visible_bit=8,
-        scale=1,
-    ),
-    "heat_pump_9_compressor_power_consumption_kwh_lsb": FeatureRegister(
+    "heat_pump_9_compressor_power_consumption_kwh": FeatureRegister(
         address=62357,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -5036,17 +5485,10 @@ BMS_REGISTERS = {
         visible_adresss=62553,
         visible_bit=9,
         scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
-    "heat_pump_9_compressor_power_consumption_kwh_msb": FeatureRegister(
-        address=62358,
-        max_value_adresss=None,
-        min_value_adresss=None,
-        step_adresss=None,
-        visible_adresss=62553,
-        visible_bit=10,
-        scale=1,
-    ),
-    "heat_pump_10_compressor_power_consumption_kwh_lsb": FeatureRegister(
+    "heat_pump_10_compressor_power_consumption_kwh": FeatureRegister(
         address=62359,
         max_value_adresss=None,
         min_value_adresss=None,
@@ -5054,15 +5496,8 @@ BMS_REGISTERS = {
         visible_adresss=62553,
         visible_bit=11,
         scale=1,
-    ),
-    "heat_pump_10_compressor_power_consumption_kwh_msb": FeatureRegister(
-        address=62360,
-        max_value_adresss=None,
-        min_value_adresss=None,
-        step_adresss=None,
-        visible_adresss=62553,
-        visible_bit=12,
-        scale=1,
+        word_count=2,
+        poll_class=PollClass.COUNTER,
     ),
     "power_kw_immersion_heaters": FeatureRegister(
         address=62361,
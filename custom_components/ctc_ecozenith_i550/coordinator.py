@@ -2,26 +2,86 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
 import logging
+import math
+import time
+from collections import Counter, defaultdict
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-from pymodbus.client import ModbusTcpClient
-
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .connection import CircuitOpenError, ConnectionManager
+from .const import (
+    ATTR_LAST_READ,
+    ATTR_PENDING,
+    BMS_REGISTERS,
+    CONNECTION_STATE,
+    CURVE_POINTS,
+    DEFAULT_BOOST_DURATION,
+    DEFAULT_BOOST_TRIGGERS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MAX_STALE_AGE,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_ROLLBACK_TIMEOUT,
+    DEFAULT_WRITE_DEBOUNCE,
+    DOMAIN,
+)
+from .feature_register import PollClass
+from .limits import LimitCache
+from .modbus import PRIORITY_VERIFY, AsyncModbusTcpClient, ModbusError
+from .read_planner import (
+    ReadBlock,
+    build_read_plan,
+    build_span_plan,
+    decode_visibility,
+    read_plan,
+    read_plan_into,
+    register_span,
+)
+from .register_store import SIGNED_WORD_RANGE, WORD_RANGE, RegisterStore
+from .scheduler import (
+    POLL_INTERVALS,
+    SWEEP_BUDGET_SHARE,
+    PollGroup,
+    build_boost_group,
+    build_poll_groups,
+)
+from .topology import Topology, discover_topology, register_unit, unit_template
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
 
 _LOGGER = logging.getLogger(__name__)
 
-UPDATE_INTERVAL = timedelta(seconds=5)
+UPDATE_INTERVAL = POLL_INTERVALS[PollClass.FAST]
 
 
-class CTCEcozenithDataUpdateCoordinator(DataUpdateCoordinator[dict]):
+class CTCEcozenithDataUpdateCoordinator(DataUpdateCoordinator[RegisterStore]):
     """Coordinator for CTC Ecozenith i550."""
 
     def __init__(
-        self, hass: HomeAssistant, host: str, port: int, update_method
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        *,
+        max_in_flight: int = 1,
+        max_stale_age: float = DEFAULT_MAX_STALE_AGE,
+        scan_interval_bounds: tuple[float, float] = (
+            DEFAULT_MIN_SCAN_INTERVAL,
+            DEFAULT_MAX_SCAN_INTERVAL,
+        ),
+        boost_triggers: Iterable[str] = DEFAULT_BOOST_TRIGGERS,
+        boost_duration: float = DEFAULT_BOOST_DURATION,
+        rollback_timeout: float = DEFAULT_ROLLBACK_TIMEOUT,
+        write_debounce: float = DEFAULT_WRITE_DEBOUNCE,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -29,47 +89,670 @@ class CTCEcozenithDataUpdateCoordinator(DataUpdateCoordinator[dict]):
             _LOGGER,
             name=DOMAIN,
             update_interval=UPDATE_INTERVAL,
+            # The store is updated in place, so listeners are filtered on the
+            # changed slots in async_update_listeners instead of by comparing
+            # the data of two refreshes
+            always_update=True,
+        )
+        self._client = AsyncModbusTcpClient(
+            host=host, port=port, max_in_flight=max_in_flight
+        )
+        self.connection = ConnectionManager(
+            self._client, self._async_connection_state_changed
         )
-        self._client = ModbusTcpClient(host=host, port=port)
-        self.update_method = update_method
+        self._plans: dict[
+            frozenset[PollClass], tuple[tuple[ReadBlock, ...], tuple[ReadBlock, ...]]
+        ] = {}
+        # Until the platforms are set up every register is read, so entity
+        # creation can see which registers the device provides
+        self._demand_driven = False
+        self._consumers: Counter[str] = Counter()
+        self._unread_keys: set[str] = set()
+        # Listeners indexed by the register key passed as their context;
+        # listeners without a context are stored under None
+        self._key_listeners: dict[str | None, dict[object, CALLBACK_TYPE]] = {}
+        self._changed_keys: set[str] | None = None
+        # Slots whose value a read changed since the current sweep started,
+        # including those already notified by a write confirmation meanwhile
+        self._sweep_changes: set[int] = set()
+        self._notified_success = True
+        # Values of blocks that failed to read are served for this long
+        self.max_stale_age = max_stale_age
+        self._scan_interval_bounds = scan_interval_bounds
+        # Changes of these registers poll their unit faster for a while
+        self._boost_names = frozenset(boost_triggers)
+        self._boost_duration = boost_duration * 60
+        self.rollback_timeout = rollback_timeout
+        # Debounced writes by register key: the raw value, the value shown
+        # while pending, and the timer that sends it
+        self.write_debounce = write_debounce
+        self._queued_writes: dict[str, tuple[int, float]] = {}
+        self._write_timers: dict[str, CALLBACK_TYPE] = {}
+        # Held while a queued write of a register is sent and read back
+        self._write_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.set_topology(Topology())
 
-    async def _async_update_data(self) -> dict:
+    def set_topology(self, topology: Topology) -> None:
+        """Drop the registers of absent units from polling."""
+        self.topology = topology
+        self._registers = {
+            key: register
+            for key, register in BMS_REGISTERS.items()
+            if topology.includes(key)
+        }
+        self._store = RegisterStore(self._registers)
+        self.limits = LimitCache(self._registers)
+        self._groups = build_poll_groups(self._registers, self._scan_interval_bounds)
+        # A value may go without a good read for its group's longest interval
+        # plus the stale age; identity values are read once and always kept
+        for group in self._groups.values():
+            if group.interval is not None:
+                self._store.set_max_age(
+                    map(self._store.slot, group.keys),
+                    group.max_interval + self.max_stale_age,
+                )
+        self._plans.clear()
+        self._boost_triggers = {
+            key: register_unit(key)
+            for key in self._registers
+            if unit_template(key) in self._boost_names
+        }
+        # Boosted units with their group and the monotonic time it ends
+        self._boosts: dict[tuple[str, int] | None, tuple[PollGroup, float]] = {}
+        self._visibility_plan = build_read_plan(
+            register.visible_adresss for register in self._registers.values()
+        )
+        _LOGGER.debug(
+            "Polling %s of %s registers for %s heat pumps and %s heating systems",
+            len(self._registers),
+            len(BMS_REGISTERS),
+            topology.heat_pumps,
+            topology.heating_systems,
+        )
+
+    async def async_discover_topology(self) -> Topology:
+        """Discover the installed units from the full visibility bitmap."""
+        plan = build_read_plan(
+            register.visible_adresss for register in BMS_REGISTERS.values()
+        )
+        try:
+            words = await self.connection.async_run(
+                partial(read_plan, self._client, plan)
+            )
+        except ModbusError as err:
+            msg = f"Failed to discover installed units: {err}"
+            raise UpdateFailed(msg) from err
+        return discover_topology(decode_visibility(words, BMS_REGISTERS))
+
+    async def _async_update_data(self) -> RegisterStore:
         """Fetch data from the heat pump."""
+        self._changed_keys = None
+        self._sweep_changes = set()
         try:
-            # Only connect if not already connected
-            if not self._client.connected:
-                if not await self.hass.async_add_executor_job(self._client.connect):
-                    raise UpdateFailed("Could not connect to Modbus device")
-            return await self.hass.async_add_executor_job(
-                self.update_method, self._client
-            )
-        except Exception as err:
-            raise UpdateFailed(
-                f"Error communicating with the heat pump: {err}"
-            ) from err
-
-    async def async_write_register(self, address: int, value: int) -> None:
-        """Write a value to a Modbus register asynchronously."""
-
-        # Ensure connection
-        if not self._client.connected:
-            _LOGGER.debug("Modbus client not connected, attempting to connect")
-            if not await self.hass.async_add_executor_job(self._client.connect):
-                raise UpdateFailed("Could not connect to Modbus device")
-
-        def _write():
-            # Write a single register (16 bit)
-            return self._client.write_register(address, value, 1)
-
-        result = await self.hass.async_add_executor_job(_write)
-        # Add debug logging
-        _LOGGER.debug(
-            "Modbus write_register(%s, %s) result: %s", address, value, result
+            return await self.connection.async_run(self._async_sweep)
+        except ModbusError as err:
+            # Keep serving the last good values of the groups this sweep
+            # failed to refresh until they grow too old
+            now = time.monotonic()
+            self._mark_stale(
+                self._store.slot(key)
+                for group in self._groups.values()
+                if group.due(now)
+                for key in group.keys
+            )
+            if not self._store.has_values():
+                msg = f"Error communicating with the heat pump: {err}"
+                raise UpdateFailed(msg) from err
+            # The circuit breaker already logged why the device is skipped
+            _LOGGER.log(
+                logging.DEBUG if isinstance(err, CircuitOpenError) else logging.WARNING,
+                "Error communicating with the heat pump, keeping last values: %s",
+                err,
+            )
+            return self._finish_sweep()
+
+    async def _async_sweep(self) -> RegisterStore:
+        """Refresh expired limits and read the poll groups that are due."""
+        if self.limits.expired():
+            await self.limits.async_refresh(self._client)
+        return await self._async_poll(time.monotonic())
+
+    @callback
+    def async_add_consumer(self, keys: Iterable[str]) -> CALLBACK_TYPE:
+        """Register keys that an entity or internal feature needs polled."""
+        keys = tuple(dict.fromkeys(key for key in keys if key in self._registers))
+        added = [key for key in keys if not self._consumers[key]]
+        self._consumers.update(keys)
+        if added:
+            self._plans.clear()
+            self._unread_keys.update(added)
+
+        @callback
+        def _remove_consumer() -> None:
+            self._consumers.subtract(keys)
+            removed = [key for key in keys if self._consumers[key] <= 0]
+            for key in removed:
+                del self._consumers[key]
+                self._unread_keys.discard(key)
+            if removed:
+                self._plans.clear()
+
+        return _remove_consumer
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for updates of the register key given as context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        token = object()
+        self._key_listeners.setdefault(context, {})[token] = update_callback
+        remove_consumer = (
+            self.async_add_consumer([context]) if context is not None else None
+        )
+
+        @callback
+        def _remove_listener() -> None:
+            remove_listener()
+            listeners = self._key_listeners[context]
+            del listeners[token]
+            if not listeners:
+                del self._key_listeners[context]
+            if remove_consumer is not None:
+                remove_consumer()
+
+        return _remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners of keys that changed in the last sweep."""
+        changed = self._changed_keys
+        self._changed_keys = None
+        if changed is None or self.last_update_success != self._notified_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+        if not changed:
+            return
+        for key in (None, *changed):
+            for update_callback in list(self._key_listeners.get(key, {}).values()):
+                update_callback()
+
+    @callback
+    def _async_connection_state_changed(self) -> None:
+        """Notify the listeners of the connection state."""
+        for update_callback in list(
+            self._key_listeners.get(CONNECTION_STATE, {}).values()
+        ):
+            update_callback()
+
+    @callback
+    def async_start_demand_polling(self) -> None:
+        """Poll only consumed registers once all platforms have been set up."""
+        self._demand_driven = True
+        self._plans.clear()
+        self._unread_keys.clear()
+        # Boost triggers are watched even without an entity
+        self.async_add_consumer(self._boost_triggers)
+
+    def _poll_set(
+        self, groups: tuple[PollGroup, ...]
+    ) -> tuple[tuple[ReadBlock, ...], tuple[ReadBlock, ...]]:
+        """Return the wanted register spans and read plan of a set of groups."""
+        plan_key = frozenset(group.poll_class for group in groups)
+        if plan_key not in self._plans:
+            spans = self._spans(key for group in groups for key in group.keys)
+            self._plans[plan_key] = (spans, build_span_plan(spans))
+        return self._plans[plan_key]
+
+    def _spans(self, keys: Iterable[str]) -> tuple[ReadBlock, ...]:
+        """Return the register spans of the keys that need polling."""
+        return tuple(
+            register_span(self._registers[key])
+            for key in keys
+            if not self._demand_driven or key in self._consumers
+        )
+
+    async def _async_poll(self, now: float) -> RegisterStore:
+        """Read the due poll groups in priority order within the time budget."""
+        # Until the platforms have registered their consumers every group is
+        # read in full, as entities are only created for keys that have a value
+        deadline = (
+            now + self.update_interval.total_seconds() * SWEEP_BUDGET_SHARE
+            if self._demand_driven
+            else math.inf
+        )
+        # A group that still has blocks carried over finishes its round
+        # before it starts a new one
+        started = [
+            group
+            for group in self._groups.values()
+            if not group.backlog and group.due(now)
+        ]
+        # Visibility follows the installer settings, so it is refreshed
+        # together with the settings group
+        if any(group.poll_class is PollClass.SETTING for group in started):
+            start = time.monotonic()
+            words = await read_plan(self._client, self._visibility_plan)
+            self._store.set_visibility(decode_visibility(words, self._registers))
+            self._groups[PollClass.SETTING].cost += time.monotonic() - start
+        for group in started:
+            group.backlog.extend(self._poll_set((group,))[1])
+            group.due_at = now
+
+        fast, *rest = self._groups.values()
+        plan = list(fast.backlog)
+        fast.backlog.clear()
+        # Registers that just gained a consumer are read right away instead
+        # of waiting for their group to come due, and boosted units are read
+        # along with the fast group
+        boosted = [group for group, _ in self._boosts.values() if group.due(now)]
+        if self._unread_keys or boosted:
+            plan = build_span_plan(
+                (
+                    *(self._poll_set((fast,))[0] if fast in started else ()),
+                    *(register_span(self._registers[key]) for key in self._unread_keys),
+                    *(span for group in boosted for span in self._spans(group.keys)),
+                )
+            )
+            self._unread_keys.clear()
+        start = time.monotonic()
+        failed = await read_plan_into(self._client, plan, self._store, time.time())
+        fast.cost += time.monotonic() - start
+        attempted = len(plan)
+        active = {group.poll_class: group for group in started}
+
+        # The other groups get what is left of the budget, a window of
+        # blocks at a time, and continue in the next sweep where they stopped
+        for group in rest:
+            while group.backlog and (start := time.monotonic()) < deadline:
+                batch = [
+                    group.backlog.popleft()
+                    for _ in range(min(len(group.backlog), self._client.max_in_flight))
+                ]
+                failed += await read_plan_into(
+                    self._client, batch, self._store, time.time()
+                )
+                group.cost += time.monotonic() - start
+                attempted += len(batch)
+                active[group.poll_class] = group
+
+        if failed:
+            self._keep_failed_blocks(failed, attempted)
+        store = self._finish_sweep()
+        end = time.monotonic()
+        swept = {self._store.keys[slot] for slot in self._sweep_changes}
+        for group in active.values():
+            group.changes += len(swept.intersection(group.keys))
+            if group.backlog:
+                _LOGGER.debug(
+                    "Sweep budget used up, carrying %s %s blocks over, %.1f s behind",
+                    len(group.backlog),
+                    group.poll_class,
+                    group.lag(end),
+                )
+                continue
+            first_round = group.last_poll is None
+            # Anchor the next round to when this one became due, so a
+            # carried over group keeps its interval
+            group.last_poll = group.due_at
+            if first_round:
+                # The first round only fills the store and tells nothing
+                # about how often the registers change
+                group.changes = 0
+                group.cost = 0.0
+                continue
+            group.adapt(len(self._poll_set((group,))[0]))
+        for group in boosted:
+            group.last_poll = now
+        if self._demand_driven and self._boost_duration:
+            self._update_boosts(end, swept)
+        # The coordinator ticks as often as the fastest group needs
+        self.update_interval = min(
+            group.interval
+            for group in (
+                *self._groups.values(),
+                *(group for group, _ in self._boosts.values()),
+            )
+            if group.interval
+        )
+        return store
+
+    def _update_boosts(self, now: float, changed: set[str]) -> None:
+        """Start or extend boosts on changed triggers and end expired ones."""
+        interval = timedelta(seconds=self._groups[PollClass.FAST].min_interval)
+        for key in changed.intersection(self._boost_triggers):
+            unit = self._boost_triggers[key]
+            if unit in self._boosts:
+                group = self._boosts[unit][0]
+            else:
+                _LOGGER.debug("%s changed, polling its unit every %s", key, interval)
+                group = build_boost_group(self._registers, unit, interval)
+                group.last_poll = now
+            self._boosts[unit] = (group, now + self._boost_duration)
+        for unit, (_, until) in list(self._boosts.items()):
+            if until <= now:
+                _LOGGER.debug("Boost of %s ended", unit or "the main unit")
+                del self._boosts[unit]
+
+    def _keep_failed_blocks(
+        self, failed: list[tuple[ReadBlock, ModbusError]], attempted: int
+    ) -> None:
+        """Keep the last values of failed blocks, or fail if no block was read."""
+        self._mark_stale(
+            slot
+            for block, _ in failed
+            for slot in self._store.slots_between(block.address, block.end)
+        )
+        if len(failed) == attempted:
+            raise failed[0][1]
+        _LOGGER.warning(
+            "Failed to read %s of %s register blocks, keeping last values: %s",
+            len(failed),
+            attempted,
+            failed[0][1],
         )
-        if not hasattr(result, "isError") or result.isError():
-            _LOGGER.error("Modbus write_register failed: %s", result)
-            raise UpdateFailed(f"Failed to write value {value} to register {address}")
+
+    def _mark_stale(self, slots: Iterable[int]) -> None:
+        """Keep serving the last values of slots and drop those too old."""
+        self._store.mark_stale(slots)
+        self._store.expire(time.time())
+
+    def _finish_sweep(self) -> RegisterStore:
+        """Record the keys changed since the last fan-out for the listeners."""
+        changed = self._store.pop_changed()
+        # A register getting its first value is no change of the device,
+        # or every start and new consumer would speed polling up
+        self._sweep_changes |= changed - self._store.pop_first_reads()
+        self._changed_keys = {self._store.keys[slot] for slot in changed}
+        return self._store
+
+    def value_attributes(self, slot: int) -> dict[str, Any] | None:
+        """Return if a value awaits confirmation, or when a stale one was read."""
+        if self._store.is_pending(slot):
+            return {ATTR_PENDING: True}
+        if not self._store.is_stale(slot):
+            return None
+        read_at = dt_util.utc_from_timestamp(self._store.read_at(slot))
+        return {ATTR_LAST_READ: read_at.isoformat()}
+
+    async def async_write_register(
+        self, address: int, value: int, pending: tuple[str, float] | None = None
+    ) -> None:
+        """
+        Write a value to a Modbus register asynchronously.
+
+        With pending, the given register key shows the expected value right
+        away until a read after the write confirms or replaces it. A newer
+        write queued for the key meanwhile keeps its own pending value.
+        """
+        slot = None
+        if pending is not None and pending[0] not in self._queued_writes:
+            slot = self._store.slot(pending[0])
+            # No read counts as confirmation before the write went out
+            self._store.set_pending(slot, pending[1], math.inf)
+            self._async_notify_changed()
+        try:
+            # Write a single register (16 bit), failing fast while the
+            # connection is down
+            await self.connection.async_run(
+                partial(self._client.write_register, address, value)
+            )
+        except ModbusError as err:
+            if slot is not None and pending[0] not in self._queued_writes:
+                self._store.drop_pending(slot)
+                self._async_notify_changed()
+            _LOGGER.error(
+                "Modbus write_register(%s, %s) failed: %s", address, value, err
+            )
+            msg = f"Failed to write value {value} to register {address}"
+            raise UpdateFailed(msg) from err
+        _LOGGER.debug("Modbus write_register(%s, %s) succeeded", address, value)
+        if slot is not None and pending[0] not in self._queued_writes:
+            since = time.time()
+            self._store.set_pending(slot, pending[1], since)
+            async_call_later(
+                self.hass,
+                self.rollback_timeout,
+                partial(self._async_rollback, (slot,), since),
+            )
+
+    async def async_refresh_register(self, key: str) -> None:
+        """
+        Re-read a written register, then its visibility word and limits.
+
+        The new value is confirmed with a single transaction ahead of any
+        polling instead of a full sweep.
+        """
+        register = self._registers[key]
+        try:
+            failed = await self.connection.async_run(
+                partial(
+                    read_plan_into,
+                    self._client,
+                    (register_span(register),),
+                    self._store,
+                    time.time(),
+                    PRIORITY_VERIFY,
+                )
+            )
+            if failed:
+                raise failed[0][1]
+            self._async_notify_changed()
+            words = await self.connection.async_run(
+                partial(
+                    read_plan,
+                    self._client,
+                    build_read_plan((register.visible_adresss,)),
+                    PRIORITY_VERIFY,
+                )
+            )
+            self._store.set_visibility(
+                decode_visibility(
+                    words,
+                    {
+                        other_key: other
+                        for other_key, other in self._registers.items()
+                        if other.visible_adresss == register.visible_adresss
+                    },
+                )
+            )
+            await self.connection.async_run(
+                partial(
+                    self.limits.async_refresh_keys,
+                    self._client,
+                    (key,),
+                    PRIORITY_VERIFY,
+                )
+            )
+        except ModbusError as err:
+            _LOGGER.debug("Could not re-read %s after a write: %s", key, err)
+            await self.async_request_refresh()
+            return
+        # New limits are not a change of the store, so the key is added
+        self._async_notify_changed(key)
+
+    @callback
+    def async_queue_write(self, key: str, value: int, expected: float) -> None:
+        """
+        Coalesce writes to a register into the last one after a quiet window.
+
+        The expected value is shown as pending right away. A write of the
+        value the device already reports is skipped.
+        """
+        self._store.set_pending(self._store.slot(key), expected, math.inf)
+        self._async_notify_changed()
+        self._queued_writes[key] = (value, expected)
+        if cancel := self._write_timers.pop(key, None):
+            cancel()
+        self._write_timers[key] = async_call_later(
+            self.hass, self.write_debounce, partial(self._async_flush_write, key)
+        )
+
+    async def _async_flush_write(self, key: str, _now: Any) -> None:
+        """Send the last queued write of a register."""
+        del self._write_timers[key]
+        # A write queued while the previous one is still in flight waits for
+        # it, so one register never has two writes racing
+        async with self._write_locks[key]:
+            # An earlier flush that waited here may already have sent it
+            if (queued := self._queued_writes.pop(key, None)) is None:
+                return
+            value, expected = queued
+            register = self._registers[key]
+            slot = self._store.slot(key)
+            reported = self._store.reported(slot)
+            if reported is not None and round(reported / register.scale) == value:
+                _LOGGER.debug("Skipping write of %s to %s, already set", value, key)
+                self._store.drop_pending(slot)
+                self._async_notify_changed()
+                return
+            try:
+                await self.async_write_register(
+                    register.address, value, pending=(key, expected)
+                )
+            except UpdateFailed:
+                # Already logged, and there is no caller left to raise to
+                return
+            await self.async_refresh_register(key)
+
+    async def async_write_curve(
+        self, curve: str, points: Sequence[tuple[float, float]]
+    ) -> None:
+        """
+        Write all points of a curve in one transaction and read them back.
+
+        The values are checked against the cached limits first, so a curve
+        is either written completely or not at all.
+        """
+        keys = [
+            f"{curve}_curve_point_{point}_{axis}"
+            for point in range(1, CURVE_POINTS + 1)
+            for axis in ("x", "y")
+        ]
+        if any(key not in self._registers for key in keys):
+            msg = f"Curve {curve} is not available"
+            raise ServiceValidationError(msg)
+        values = [value for point in points for value in point]
+        if len(values) != len(keys):
+            msg = f"Expected {CURVE_POINTS} points"
+            raise ServiceValidationError(msg)
+        # The points of a curve are stored in consecutive registers
+        registers = [self._registers[key] for key in keys]
+        address = registers[0].address
+        words = []
+        for key, register, value in zip(keys, registers, values, strict=True):
+            limits = self.limits.get(key)
+            word = round(value / register.scale)
+            if (
+                limits is not None
+                and (
+                    (limits.min_value is not None and value < limits.min_value)
+                    or (limits.max_value is not None and value > limits.max_value)
+                )
+            ) or word not in (SIGNED_WORD_RANGE if register.signed else WORD_RANGE):
+                msg = f"{value} is out of range for {key}"
+                raise ServiceValidationError(msg)
+            words.append(word)
+
+        slots = tuple(self._store.slot(key) for key in keys)
+        for slot, value in zip(slots, values, strict=True):
+            self._store.set_pending(slot, value, math.inf)
+        self._async_notify_changed()
+        try:
+            await self.connection.async_run(
+                partial(self._client.write_registers, address, words)
+            )
+        except ModbusError as err:
+            for slot in slots:
+                self._store.drop_pending(slot)
+            self._async_notify_changed()
+            _LOGGER.error("Modbus write of curve %s failed: %s", curve, err)
+            msg = f"Failed to write curve {curve}"
+            raise UpdateFailed(msg) from err
+        since = time.time()
+        for slot, value in zip(slots, values, strict=True):
+            self._store.set_pending(slot, value, since)
+        async_call_later(
+            self.hass,
+            self.rollback_timeout,
+            partial(self._async_rollback, slots, since),
+        )
+
+        # One block read confirms every point, then the points' limits,
+        # which can depend on their neighbours, are read back together
+        try:
+            failed = await self.connection.async_run(
+                partial(
+                    read_plan_into,
+                    self._client,
+                    (ReadBlock(address, len(words)),),
+                    self._store,
+                    time.time(),
+                    PRIORITY_VERIFY,
+                )
+            )
+            if failed:
+                raise failed[0][1]
+            await self.connection.async_run(
+                partial(
+                    self.limits.async_refresh_keys, self._client, keys, PRIORITY_VERIFY
+                )
+            )
+        except ModbusError as err:
+            _LOGGER.debug("Could not read back curve %s: %s", curve, err)
+            await self.async_request_refresh()
+            return
+        self._async_notify_changed(*keys)
+        for key, slot, word in zip(keys, slots, words, strict=True):
+            reported = self._store.reported(slot)
+            if (
+                reported is not None
+                and round(reported / self._registers[key].scale) != word
+            ):
+                _LOGGER.warning(
+                    "Heat pump reports %s for %s after the write", reported, key
+                )
+
+    @callback
+    def _async_rollback(self, slots: Iterable[int], since: float, _now: Any) -> None:
+        """Drop written values that no read confirmed in time."""
+        dropped = [slot for slot in slots if self._store.drop_pending(slot, since)]
+        if dropped:
+            _LOGGER.warning(
+                "Write to %s was not confirmed within %s s, showing the last"
+                " read value",
+                ", ".join(self._store.keys[slot] for slot in dropped),
+                self.rollback_timeout,
+            )
+            self._async_notify_changed()
+
+    @callback
+    def _async_notify_changed(self, *keys: str) -> None:
+        """
+        Notify the listeners of keys changed outside of a sweep.
+
+        Slots a running sweep read meanwhile are notified too, and still
+        count as changed for that sweep.
+        """
+        self._finish_sweep()
+        self._changed_keys.update(keys)
+        self.async_update_listeners()
+
+    async def async_refresh_limits(self) -> None:
+        """Reload the min/max/step limits and notify the entities."""
+        try:
+            await self.connection.async_run(
+                partial(self.limits.async_refresh, self._client)
+            )
+        except ModbusError as err:
+            msg = f"Failed to refresh limits: {err}"
+            raise UpdateFailed(msg) from err
+        self.async_update_listeners()
 
     async def async_close(self) -> None:
         """Close the Modbus client connection."""
-        await self.hass.async_add_executor_job(self._client.close)
+        for cancel in self._write_timers.values():
+            cancel()
+        self._write_timers.clear()
+        await self._client.close()
@@ -0,0 +1,124 @@
+"""Cached min/max/step metadata for CTC Ecozenith i550 setting registers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+from .modbus import PRIORITY_POLL, AsyncModbusTcpClient
+from .read_planner import build_read_plan, read_plan
+from .register_store import to_signed
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+# Limits only change with a firmware update or a change of installer settings
+LIMITS_TTL = timedelta(hours=6)
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterLimits:
+    """Min, max and step of a setting register, already scaled."""
+
+    min_value: float | None = None
+    max_value: float | None = None
+    step: float | None = None
+
+
+class LimitCache:
+    """Bulk-loaded limits kept apart from the live register values."""
+
+    def __init__(
+        self, registers: Mapping[str, Any], ttl: timedelta = LIMITS_TTL
+    ) -> None:
+        """Initialize the cache for all registers that define limits."""
+        self._registers = {
+            key: register
+            for key, register in registers.items()
+            if register.min_value_adresss is not None
+            or register.max_value_adresss is not None
+            or register.step_adresss is not None
+        }
+        self._plan = build_read_plan(
+            address
+            for register in self._registers.values()
+            for address in _limit_addresses(register)
+        )
+        self._ttl = ttl
+        self._limits: dict[str, RegisterLimits] = {}
+        self.last_refresh: datetime | None = None
+
+    def get(self, key: str) -> RegisterLimits | None:
+        """Return the cached limits of a register."""
+        return self._limits.get(key)
+
+    def expired(self) -> bool:
+        """Return True if the limits must be read again."""
+        return (
+            self.last_refresh is None
+            or dt_util.utcnow() - self.last_refresh >= self._ttl
+        )
+
+    async def async_refresh(self, client: AsyncModbusTcpClient) -> None:
+        """Read all limit registers in bulk and replace the cache."""
+        words = await read_plan(client, self._plan)
+        self._limits = {
+            key: _decode_limits(words, register)
+            for key, register in self._registers.items()
+        }
+        self.last_refresh = dt_util.utcnow()
+
+    async def async_refresh_keys(
+        self,
+        client: AsyncModbusTcpClient,
+        keys: Iterable[str],
+        priority: int = PRIORITY_POLL,
+    ) -> None:
+        """Read the limits of some registers and update their cache entries."""
+        registers = {
+            key: self._registers[key] for key in keys if key in self._registers
+        }
+        if not registers:
+            return
+        words = await read_plan(
+            client,
+            build_read_plan(
+                address
+                for register in registers.values()
+                for address in _limit_addresses(register)
+            ),
+            priority,
+        )
+        for key, register in registers.items():
+            self._limits[key] = _decode_limits(words, register)
+
+
+def _limit_addresses(register: Any) -> list[int]:
+    """Return the addresses of the limits a register defines."""
+    return [
+        address
+        for address in (
+            register.min_value_adresss,
+            register.max_value_adresss,
+            register.step_adresss,
+        )
+        if address is not None
+    ]
+
+
+def _decode_limits(words: Mapping[int, int], register: Any) -> RegisterLimits:
+    """Scale the limit words of a register like its value."""
+
+    def _scaled(address: int | None) -> float | None:
+        if address is None or address not in words:
+            return None
+        return to_signed(words[address], signed=register.signed) * register.scale
+
+    return RegisterLimits(
+        min_value=_scaled(register.min_value_adresss),
+        max_value=_scaled(register.max_value_adresss),
+        step=_scaled(register.step_adresss),
+    )
@@ -0,0 +1,320 @@
+"""Asyncio Modbus TCP client for CTC Ecozenith i550."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_UNIT_ID = 1
+
+READ_HOLDING_REGISTERS = 0x03
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+
+# Transaction id, protocol id, length, unit id
+MBAP_HEADER = struct.Struct(">HHHB")
+
+# Queued transactions are sent lowest priority first. Writes go out alone,
+# so nothing is interleaved with them on the wire
+PRIORITY_WRITE = 0
+PRIORITY_VERIFY = 1
+PRIORITY_POLL = 2
+
+
+class ModbusError(Exception):
+    """Raised when a Modbus transaction cannot be completed."""
+
+
+class ModbusExceptionResponseError(ModbusError):
+    """Raised when the device answers a request with a Modbus exception."""
+
+    def __init__(self, function_code: int, exception_code: int) -> None:
+        """Initialize the error from the function and exception code."""
+        super().__init__(
+            f"Function {function_code:#04x} failed with exception code {exception_code}"
+        )
+        self.function_code = function_code
+        self.exception_code = exception_code
+
+
+class AsyncModbusTcpClient:
+    """Minimal Modbus TCP client running on the event loop."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        unit_id: int = DEFAULT_UNIT_ID,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_in_flight: int = 1,
+    ) -> None:
+        """Initialize the client."""
+        self._host = host
+        self._port = port
+        self._unit_id = unit_id
+        self._timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._read_task: asyncio.Task | None = None
+        # A sweep and a write may both find the client disconnected, only
+        # one of them opens the connection
+        self._connect_lock = asyncio.Lock()
+        self._pending: dict[int, asyncio.Future[bytes]] = {}
+        self._transaction_id = 0
+        # The window shrinks to one request while the device cannot keep up
+        # with pipelining, and is restored on the next connection
+        self._pipeline_limit = max(1, max_in_flight)
+        self._max_in_flight = self._pipeline_limit
+        self._in_flight = 0
+        self._exclusive = False
+        # Heap of transactions waiting for the window: priority, arrival
+        # order, exclusive flag and the future that grants the slot
+        self._waiters: list[tuple[int, int, bool, asyncio.Future[None]]] = []
+        self._arrival = itertools.count()
+
+    @property
+    def max_in_flight(self) -> int:
+        """Return how many requests may currently be outstanding."""
+        return self._max_in_flight
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the TCP connection is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> None:
+        """Open the TCP connection to the device."""
+        async with self._connect_lock:
+            if self.connected:
+                return
+            try:
+                async with asyncio.timeout(self._timeout):
+                    self._reader, self._writer = await asyncio.open_connection(
+                        self._host, self._port
+                    )
+            except (OSError, TimeoutError) as err:
+                msg = f"Could not connect to {self._host}:{self._port}: {err}"
+                raise ModbusError(msg) from err
+            self._read_task = asyncio.create_task(
+                self._read_loop(self._reader, self._writer)
+            )
+            if self._max_in_flight < self._pipeline_limit:
+                _LOGGER.debug("Reconnected, pipelining requests again")
+                self._max_in_flight = self._pipeline_limit
+
+    async def close(self) -> None:
+        """Close the connection and fail all outstanding requests."""
+        if self._read_task is not None:
+            self._read_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._read_task
+            self._read_task = None
+        if self._writer is not None:
+            self._writer.close()
+            with contextlib.suppress(OSError):
+                await self._writer.wait_closed()
+        self._reader = self._writer = None
+        self._fail_pending(ModbusError("Connection closed"))
+
+    async def read_holding_registers(
+        self, address: int, count: int, priority: int = PRIORITY_POLL
+    ) -> list[int]:
+        """Read a range of holding registers."""
+        data = await self.read_holding_registers_raw(address, count, priority)
+        return list(struct.unpack_from(f">{count}H", data))
+
+    async def read_holding_registers_raw(
+        self, address: int, count: int, priority: int = PRIORITY_POLL
+    ) -> memoryview:
+        """Read a range of holding registers as big-endian bytes without copying."""
+        data = await self._execute(
+            READ_HOLDING_REGISTERS, struct.pack(">HH", address, count), priority
+        )
+        if len(data) != 1 + 2 * count or data[0] != 2 * count:
+            msg = f"Malformed response reading {count} registers at {address}"
+            raise ModbusError(msg)
+        return memoryview(data)[1:]
+
+    async def write_register(self, address: int, value: int) -> None:
+        """Write a single holding register."""
+        await self._execute(
+            WRITE_SINGLE_REGISTER,
+            struct.pack(">HH", address, value & 0xFFFF),
+            PRIORITY_WRITE,
+            exclusive=True,
+        )
+
+    async def write_registers(self, address: int, values: Sequence[int]) -> None:
+        """Write a contiguous range of holding registers in one transaction."""
+        count = len(values)
+        data = await self._execute(
+            WRITE_MULTIPLE_REGISTERS,
+            struct.pack(
+                f">HHB{count}H",
+                address,
+                count,
+                2 * count,
+                *(value & 0xFFFF for value in values),
+            ),
+            PRIORITY_WRITE,
+            exclusive=True,
+        )
+        if data[:4] != struct.pack(">HH", address, count):
+            msg = f"Malformed response writing {count} registers at {address}"
+            raise ModbusError(msg)
+
+    async def _execute(
+        self,
+        function_code: int,
+        payload: bytes,
+        priority: int,
+        *,
+        exclusive: bool = False,
+    ) -> bytes:
+        """Send one request and return the response data after the function code."""
+        await self._acquire(priority, exclusive=exclusive)
+        pipelined = self._in_flight > 1
+        try:
+            pdu = await self._transact(function_code, payload, pipelined=pipelined)
+        finally:
+            self._release(exclusive=exclusive)
+
+        if not pdu:
+            msg = f"Empty response to function {function_code:#04x}"
+            raise ModbusError(msg)
+        if pdu[0] == function_code | 0x80 and len(pdu) > 1:
+            raise ModbusExceptionResponseError(function_code, pdu[1])
+        if pdu[0] != function_code:
+            if pipelined:
+                # The device mixed up the responses of pipelined requests
+                self._fall_back_to_serial()
+            msg = (
+                f"Unexpected function code {pdu[0]:#04x} in response"
+                f" to {function_code:#04x}"
+            )
+            raise ModbusError(msg)
+        return pdu[1:]
+
+    async def _acquire(self, priority: int, *, exclusive: bool) -> None:
+        """Wait until the transaction may be sent."""
+        granted: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters, (priority, next(self._arrival), exclusive, granted)
+        )
+        self._grant()
+        try:
+            await granted
+        except asyncio.CancelledError:
+            # Give the slot back if it was granted just before the cancel
+            if granted.done() and not granted.cancelled():
+                self._release(exclusive=exclusive)
+            raise
+
+    def _release(self, *, exclusive: bool) -> None:
+        """Free the slot of a finished transaction."""
+        self._in_flight -= 1
+        if exclusive:
+            self._exclusive = False
+        self._grant()
+
+    def _grant(self) -> None:
+        """Hand free slots to the waiting transactions in priority order."""
+        while self._waiters:
+            _, _, exclusive, granted = self._waiters[0]
+            if granted.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            # The first waiter blocks the ones behind it, so a write is not
+            # starved by reads that still fit in the window
+            if (
+                self._exclusive
+                or self._in_flight >= self._max_in_flight
+                or (exclusive and self._in_flight)
+            ):
+                return
+            heapq.heappop(self._waiters)
+            self._in_flight += 1
+            self._exclusive = exclusive
+            granted.set_result(None)
+
+    async def _transact(
+        self, function_code: int, payload: bytes, *, pipelined: bool
+    ) -> bytes:
+        """Send a request frame and wait for the matching response PDU."""
+        if not self.connected:
+            msg = "Not connected"
+            raise ModbusError(msg)
+        self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+        transaction_id = self._transaction_id
+        future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        self._pending[transaction_id] = future
+        writer = self._writer
+        writer.write(
+            MBAP_HEADER.pack(transaction_id, 0, len(payload) + 2, self._unit_id)
+            + bytes((function_code,))
+            + payload
+        )
+        try:
+            async with asyncio.timeout(self._timeout):
+                await writer.drain()
+                return await future
+        except TimeoutError as err:
+            # A lost connection fails the request on its own, so a timeout on
+            # a live one means the device dropped a pipelined request
+            if pipelined and not writer.is_closing():
+                self._fall_back_to_serial()
+            msg = f"Timeout waiting for response to function {function_code:#04x}"
+            raise ModbusError(msg) from err
+        finally:
+            self._pending.pop(transaction_id, None)
+
+    def _fall_back_to_serial(self) -> None:
+        """Stop pipelining after the device failed to keep up."""
+        if self._max_in_flight > 1:
+            _LOGGER.warning(
+                "Device at %s did not answer pipelined requests, falling back"
+                " to one request at a time",
+                self._host,
+            )
+            self._max_in_flight = 1
+
+    async def _read_loop(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Read responses of one connection and hand them to the requests."""
+        try:
+            while True:
+                header = await reader.readexactly(MBAP_HEADER.size)
+                transaction_id, _, length, _ = MBAP_HEADER.unpack(header)
+                pdu = await reader.readexactly(length - 1)
+                future = self._pending.get(transaction_id)
+                if future is None or future.done():
+                    _LOGGER.debug(
+                        "Dropping response for unknown transaction %s",
+                        transaction_id,
+                    )
+                    continue
+                future.set_result(pdu)
+        except (asyncio.IncompleteReadError, OSError) as err:
+            _LOGGER.debug("Modbus connection lost: %s", err)
+            writer.close()
+            self._fail_pending(ModbusError(f"Connection lost: {err}"))
+
+    def _fail_pending(self, err: ModbusError) -> None:
+        """Fail every request still waiting for a response."""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(err)
+        self._pending.clear()
@@ -1,15 +1,15 @@
 """Number entities for CTC Ecozenith i550."""
 
-import logging
+from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import BMS_REGISTERS, DOMAIN
-
-_LOGGER = logging.getLogger(__name__)
+from .coordinator import CTCEcozenithDataUpdateCoordinator
 
 
 async def async_setup_entry(
@@ -26,7 +26,6 @@ async def async_setup_entry(
         "max_immersion_heater_kw_lower",
     ]:
         reg = BMS_REGISTERS[key]
-        _LOGGER.warning("Register %s", key)
         entities.append(
             CTCNumberEntity(
                 coordinator,
@@ -35,21 +34,31 @@ async def async_setup_entry(
                     name=key.replace("_", " ").title(),
                     native_unit_of_measurement="kW",
                 ),
+                key,
                 reg,
             )
         )
     async_add_entities(entities)
 
 
-class CTCNumberEntity(NumberEntity):
+class CTCNumberEntity(
+    CoordinatorEntity[CTCEcozenithDataUpdateCoordinator], NumberEntity
+):
     """Number entity for CTC Ecozenith i550."""
 
-    def __init__(self, coordinator, description, feature_register: object) -> None:
+    def __init__(
+        self,
+        coordinator: CTCEcozenithDataUpdateCoordinator,
+        description: NumberEntityDescription,
+        register_key: str,
+        feature_register: object,
+    ) -> None:
         """Initialize the number entity."""
-
-        self.coordinator = coordinator
+        super().__init__(coordinator, context=register_key)
         self.entity_description = description
+        self._register_key = register_key
         self.feature_register = feature_register
+        self._slot = coordinator.data.slot(register_key)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{description.key}"
 
     @property
@@ -65,26 +74,40 @@ class CTCNumberEntity(NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        return self.feature_register.value
+        return self.coordinator.data.value(self._slot)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return whether the value awaits confirmation or was kept stale."""
+        return self.coordinator.value_attributes(self._slot)
 
     @property
     def native_min_value(self) -> float:
         """Return the minimum value."""
-        return self.feature_register.min_value
+        limits = self.coordinator.limits.get(self._register_key)
+        if limits is None or limits.min_value is None:
+            return super().native_min_value
+        return limits.min_value
 
     @property
     def native_max_value(self) -> float:
         """Return the maximum value."""
-        return self.feature_register.max_value
+        limits = self.coordinator.limits.get(self._register_key)
+        if limits is None or limits.max_value is None:
+            return super().native_max_value
+        return limits.max_value
 
     @property
-    def native_step(self) -> float:
+    def native_step(self) -> float | None:
         """Return the step value."""
-        return self.feature_register.step
+        limits = self.coordinator.limits.get(self._register_key)
+        if limits is None or not limits.step:
+            return super().native_step
+        return limits.step
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
-        await self.coordinator.async_write_register(
-            self.feature_register.address, int(value / self.feature_register.scale)
+        # A dragged slider sends a burst of values, only the last is written
+        self.coordinator.async_queue_write(
+            self._register_key, round(value / self.feature_register.scale), value
         )
-        await self.coordinator.async_request_refresh()
@@ -0,0 +1,200 @@
+"""Read planner for CTC Ecozenith i550 Modbus registers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .modbus import (
+    PRIORITY_POLL,
+    AsyncModbusTcpClient,
+    ModbusError,
+    ModbusExceptionResponseError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from .feature_register import FeatureRegister
+    from .register_store import RegisterStore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modbus limits a single Read Holding Registers request to 125 words
+MAX_READ_COUNT = 125
+# Unused addresses between two wanted registers that are read anyway
+# instead of starting a new request
+MAX_READ_GAP = 10
+
+
+@dataclass(frozen=True, slots=True)
+class ReadBlock:
+    """A contiguous range of holding registers fetched in one request."""
+
+    address: int
+    count: int
+
+    @property
+    def end(self) -> int:
+        """Return the first address after the block."""
+        return self.address + self.count
+
+
+def build_read_plan(
+    addresses: Iterable[int],
+    max_count: int = MAX_READ_COUNT,
+    max_gap: int = MAX_READ_GAP,
+) -> tuple[ReadBlock, ...]:
+    """Coalesce register addresses into as few block reads as possible."""
+    return build_span_plan(
+        (ReadBlock(address, 1) for address in addresses), max_count, max_gap
+    )
+
+
+def build_span_plan(
+    spans: Iterable[ReadBlock],
+    max_count: int = MAX_READ_COUNT,
+    max_gap: int = MAX_READ_GAP,
+) -> tuple[ReadBlock, ...]:
+    """
+    Coalesce register spans into block reads without splitting a span.
+
+    A multi-word register always lands in a single block, so its words are
+    read in one transaction and cannot tear.
+    """
+    blocks: list[ReadBlock] = []
+    start: int | None = None
+    end = 0
+    for span in sorted(set(spans), key=lambda span: span.address):
+        if (
+            start is not None
+            and span.address - end <= max_gap
+            and max(end, span.end) - start <= max_count
+        ):
+            end = max(end, span.end)
+            continue
+        if start is not None:
+            blocks.append(ReadBlock(start, end - start))
+        start, end = span.address, span.end
+    if start is not None:
+        blocks.append(ReadBlock(start, end - start))
+    return tuple(blocks)
+
+
+def register_span(register: FeatureRegister) -> ReadBlock:
+    """Return the addresses occupied by a register."""
+    return ReadBlock(register.address, register.word_count)
+
+
+async def read_block(
+    client: AsyncModbusTcpClient, block: ReadBlock, priority: int = PRIORITY_POLL
+) -> dict[int, int]:
+    """Read a block and return its words keyed by register address."""
+    try:
+        registers = await client.read_holding_registers(
+            block.address, block.count, priority
+        )
+    except ModbusExceptionResponseError:
+        return await _read_singles(client, block, priority)
+    return dict(zip(range(block.address, block.end), registers, strict=False))
+
+
+async def read_block_into(
+    client: AsyncModbusTcpClient,
+    block: ReadBlock,
+    store: RegisterStore,
+    now: float,
+    priority: int = PRIORITY_POLL,
+) -> None:
+    """Read a block straight from the response bytes into the register store."""
+    try:
+        data = await client.read_holding_registers_raw(
+            block.address, block.count, priority
+        )
+    except ModbusExceptionResponseError:
+        words = await _read_singles(client, block, priority)
+        store.update(words, store.slots_between(block.address, block.end), now)
+    else:
+        store.load(block.address, data, now)
+
+
+async def _read_singles(
+    client: AsyncModbusTcpClient, block: ReadBlock, priority: int
+) -> dict[int, int]:
+    """Read a block one register at a time, skipping rejected addresses."""
+    # Some firmwares reject ranges that span unmapped addresses
+    _LOGGER.debug(
+        "Block read %s+%s failed, falling back to single reads",
+        block.address,
+        block.count,
+    )
+    words: dict[int, int] = {}
+    for address in range(block.address, block.end):
+        try:
+            words[address] = (
+                await client.read_holding_registers(address, 1, priority)
+            )[0]
+        except ModbusExceptionResponseError:
+            continue
+    return words
+
+
+async def read_plan(
+    client: AsyncModbusTcpClient,
+    plan: Iterable[ReadBlock],
+    priority: int = PRIORITY_POLL,
+) -> dict[int, int]:
+    """
+    Execute a read plan and merge all blocks into one address map.
+
+    The blocks are issued together, so a client that allows several requests
+    in flight pipelines them while a serial client simply queues them.
+    """
+    results = await asyncio.gather(
+        *(read_block(client, block, priority) for block in plan),
+        return_exceptions=True,
+    )
+    words: dict[int, int] = {}
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        words.update(result)
+    return words
+
+
+async def read_plan_into(
+    client: AsyncModbusTcpClient,
+    plan: Sequence[ReadBlock],
+    store: RegisterStore,
+    now: float,
+    priority: int = PRIORITY_POLL,
+) -> list[tuple[ReadBlock, ModbusError]]:
+    """
+    Execute a read plan into the register store and return failed blocks.
+
+    A failing block does not abort the others, so the caller can keep the
+    last values of just the registers that could not be read.
+    """
+    results = await asyncio.gather(
+        *(read_block_into(client, block, store, now, priority) for block in plan),
+        return_exceptions=True,
+    )
+    failed: list[tuple[ReadBlock, ModbusError]] = []
+    for block, result in zip(plan, results, strict=True):
+        if isinstance(result, ModbusError):
+            failed.append((block, result))
+        elif isinstance(result, BaseException):
+            raise result
+    return failed
+
+
+def decode_visibility(
+    words: Mapping[int, int], registers: Mapping[str, Any]
+) -> dict[str, bool]:
+    """Unpack the visibility bitmap into one flag per register key."""
+    return {
+        key: bool((words.get(register.visible_adresss, 0) >> register.visible_bit) & 1)
+        for key, register in registers.items()
+    }
@@ -0,0 +1,344 @@
+"""Compact store of the live register words of a CTC Ecozenith i550."""
+
+from __future__ import annotations
+
+import math
+import operator
+import struct
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer, Iterable, Mapping, Sequence
+
+    from .feature_register import FeatureRegister
+
+UINT16 = struct.Struct(">H")
+# Values a single register word can take
+WORD_RANGE = range(0x10000)
+SIGNED_WORD_RANGE = range(-0x8000, 0x8000)
+# Struct codes per register type. 32-bit counters are stored low word
+# first, so they unpack as a big-endian uint32 with the words swapped.
+SIGNED = "h"
+UNSIGNED = "H"
+COUNTER = "I"
+
+
+def to_signed(word: int, *, signed: bool) -> int:
+    """Reinterpret a single register word as int16 if the register is signed."""
+    return word - 0x10000 if signed and word & 0x8000 else word
+
+
+def _swap_words(value: int) -> int:
+    """Return a uint32 with its high and low words swapped."""
+    return (value & 0xFFFF) << 16 | value >> 16
+
+
+def _build_decoders(
+    codes: Sequence[str], offsets: Sequence[int], sizes: Sequence[int]
+) -> tuple[list[struct.Struct], list[int]]:
+    """Return structs that decode every slot of an image and the field slots."""
+    # Each struct unpacks the slots of one pass over the image, with pad bytes
+    # over the gaps. A slot that overlaps the last one of every pass starts a
+    # new pass. The returned slots are listed in the order of the fields.
+    passes: list[tuple[list[str], list[int]]] = []
+    ends: list[int] = []
+    for slot in sorted(range(len(codes)), key=offsets.__getitem__):
+        offset = offsets[slot]
+        index = next(
+            (index for index, end in enumerate(ends) if end <= offset), len(ends)
+        )
+        if index == len(ends):
+            passes.append(([], []))
+            ends.append(0)
+        formats, slots = passes[index]
+        if offset > ends[index]:
+            formats.append(f"{offset - ends[index]}x")
+        formats.append(codes[slot])
+        slots.append(slot)
+        ends[index] = offset + sizes[slot]
+    decoders = [struct.Struct(">" + "".join(formats)) for formats, _ in passes]
+    return decoders, [slot for _, slots in passes for slot in slots]
+
+
+class RegisterStore:
+    """
+    Raw register words kept as one big-endian image and addressed by slot.
+
+    Every polled register gets a fixed slot index when the store is built.
+    The image spans the address range of the registers in Modbus byte order,
+    so a block response is copied in as received. The first read after the
+    image changed decodes all registers at once.
+    """
+
+    def __init__(self, registers: Mapping[str, FeatureRegister]) -> None:
+        """Initialize an empty store for the given registers."""
+        self.keys = tuple(registers)
+        self._slots = {key: slot for slot, key in enumerate(self.keys)}
+        self._addresses = tuple(register.address for register in registers.values())
+        self._sizes = tuple(2 * register.word_count for register in registers.values())
+        self._base = min(self._addresses, default=0)
+        self._offsets = tuple(2 * (address - self._base) for address in self._addresses)
+        self._image = bytearray(
+            max(map(sum, zip(self._offsets, self._sizes, strict=True)), default=0)
+        )
+        # The image is decoded as a whole, a struct call per pass gives the
+        # raw values of all registers and one map scales them
+        codes = [
+            COUNTER
+            if register.word_count > 1
+            else SIGNED
+            if register.signed
+            else UNSIGNED
+            for register in registers.values()
+        ]
+        self._decoders, field_slots = _build_decoders(codes, self._offsets, self._sizes)
+        self._fields = [0] * len(self.keys)
+        for field, slot in enumerate(field_slots):
+            self._fields[slot] = field
+        self._field_scales = [registers[self.keys[slot]].scale for slot in field_slots]
+        self._counter_fields = [
+            field for field, slot in enumerate(field_slots) if codes[slot] == COUNTER
+        ]
+        # Scaled values in field order, None until the image is decoded again
+        self._decoded: list[float] | None = None
+        by_address = sorted(range(len(self.keys)), key=self._addresses.__getitem__)
+        self._sorted_addresses = [self._addresses[slot] for slot in by_address]
+        self._sorted_slots = by_address
+        # One byte per slot: set once the register was read and when the
+        # visibility bitmap reports it as in use
+        self._read = bytearray(len(self.keys))
+        self._visible = bytearray(len(self.keys))
+        # Wall clock time of the last good read, and a flag for values kept
+        # from an earlier sweep because their block failed
+        self._read_at = array("d", [0.0]) * len(self.keys)
+        self._stale = bytearray(len(self.keys))
+        # Seconds after its last good read a stale value is dropped, never
+        # unless a slot gets a limit
+        self._max_age = array("d", [math.inf]) * len(self.keys)
+        # Written values shown until a read confirms or replaces them, with
+        # the wall clock time from which a read counts
+        self._pending: dict[int, tuple[float, float]] = {}
+        self._changed: set[int] = set()
+        # Slots that got a value without having one before
+        self._first_reads: set[int] = set()
+
+    def __len__(self) -> int:
+        """Return the number of slots."""
+        return len(self.keys)
+
+    def slot(self, key: str) -> int:
+        """Return the slot index of a register key."""
+        return self._slots[key]
+
+    def value(self, slot: int) -> float | None:
+        """Return the scaled value of a slot, or None if it has no value."""
+        if self._pending and slot in self._pending:
+            return self._pending[slot][0]
+        return self.reported(slot)
+
+    def reported(self, slot: int) -> float | None:
+        """Return the scaled value last read from the device, ignoring writes."""
+        if not (self._read[slot] and self._visible[slot]):
+            return None
+        decoded = self._decoded
+        if decoded is None:
+            decoded = self._decode()
+        return decoded[self._fields[slot]]
+
+    def snapshot(self) -> list[float | None]:
+        """Return the value last read from the device for every slot."""
+        decoded = self._decoded
+        if decoded is None:
+            decoded = self._decode()
+        return [
+            decoded[field] if read and visible else None
+            for field, read, visible in zip(
+                self._fields, self._read, self._visible, strict=True
+            )
+        ]
+
+    def _decode(self) -> list[float]:
+        """Unpack and scale the whole image."""
+        raw = [
+            value
+            for decoder in self._decoders
+            for value in decoder.unpack_from(self._image)
+        ]
+        for field in self._counter_fields:
+            raw[field] = _swap_words(raw[field])
+        self._decoded = list(map(operator.mul, raw, self._field_scales))
+        return self._decoded
+
+    def get(self, key: str) -> float | None:
+        """Return the scaled value of a register key."""
+        slot = self._slots.get(key)
+        return None if slot is None else self.value(slot)
+
+    def is_stale(self, slot: int) -> bool:
+        """Return True if the value of a slot was not refreshed by the last read."""
+        return bool(self._stale[slot])
+
+    def is_pending(self, slot: int) -> bool:
+        """Return True if a slot shows a written value not yet read back."""
+        return slot in self._pending
+
+    def set_pending(self, slot: int, value: float, since: float) -> None:
+        """Show a written value until a read started at or after since."""
+        self._pending[slot] = (value, since)
+        self._changed.add(slot)
+
+    def drop_pending(self, slot: int, since: float | None = None) -> bool:
+        """Fall back to the read value, if since matches when it is given."""
+        pending = self._pending.get(slot)
+        if pending is None or (since is not None and pending[1] != since):
+            return False
+        del self._pending[slot]
+        self._changed.add(slot)
+        return True
+
+    def _settle(self, slots: Iterable[int], now: float) -> None:
+        """Replace pending values by a read that started after the write."""
+        for slot in slots:
+            pending = self._pending.get(slot)
+            if pending is not None and now >= pending[1]:
+                del self._pending[slot]
+                self._changed.add(slot)
+
+    def read_at(self, slot: int) -> float:
+        """Return the wall clock time a slot was last read successfully."""
+        return self._read_at[slot]
+
+    def mark_stale(self, slots: Iterable[int]) -> None:
+        """Keep serving the last values of slots that failed to read."""
+        for slot in slots:
+            if self._read[slot] and not self._stale[slot]:
+                self._stale[slot] = True
+                if self._visible[slot]:
+                    self._changed.add(slot)
+
+    def set_max_age(self, slots: Iterable[int], max_age: float) -> None:
+        """Set how long after their last good read stale slots are dropped."""
+        for slot in slots:
+            self._max_age[slot] = max_age
+
+    def expire(self, now: float) -> None:
+        """Drop stale values that are older than the max age of their slot."""
+        for slot, stale in enumerate(self._stale):
+            if stale and now - self._read_at[slot] > self._max_age[slot]:
+                self._stale[slot] = False
+                self._read[slot] = False
+                if self._visible[slot]:
+                    self._changed.add(slot)
+
+    def has_values(self) -> bool:
+        """Return True if any slot holds a value."""
+        return any(self._read)
+
+    def pop_changed(self) -> set[int]:
+        """Return the slots whose value changed since the last call."""
+        changed, self._changed = self._changed, set()
+        return changed
+
+    def pop_first_reads(self) -> set[int]:
+        """Return the slots that got a value for the first time since the last call."""
+        first_reads, self._first_reads = self._first_reads, set()
+        return first_reads
+
+    def slots_between(self, start: int, end: int) -> list[int]:
+        """Return the slots of the registers starting in an address range."""
+        low = bisect_left(self._sorted_addresses, start)
+        high = bisect_left(self._sorted_addresses, end, low)
+        return self._sorted_slots[low:high]
+
+    def set_visibility(self, visibility: Mapping[str, bool]) -> None:
+        """Store the visibility bitmap."""
+        for key, is_visible in visibility.items():
+            slot = self._slots[key]
+            if self._visible[slot] != is_visible:
+                self._visible[slot] = is_visible
+                if self._read[slot]:
+                    self._changed.add(slot)
+
+    def load(self, address: int, data: Buffer, now: float) -> None:
+        """Copy the big-endian words of a block response into the image."""
+        # Slices of bytes compare with a memcmp, unlike those of a memoryview
+        data = bytes(data)
+        start = 2 * (address - self._base)
+        end = start + len(data)
+        # A register is only taken from the block if all of its words are in it
+        slots = [
+            slot
+            for slot in self.slots_between(address, address + len(data) // 2)
+            if self._offsets[slot] + self._sizes[slot] <= end
+        ]
+        old = self._image[start:end]
+        if old == data:
+            # The block is unchanged, only registers read for the first time
+            # or after a failed read need a notification
+            changed = [
+                slot for slot in slots if not self._read[slot] or self._stale[slot]
+            ]
+        else:
+            self._image[start:end] = data
+            self._decoded = None
+            changed = []
+            for slot in slots:
+                offset = self._offsets[slot] - start
+                size = offset + self._sizes[slot]
+                if (
+                    not self._read[slot]
+                    or self._stale[slot]
+                    or old[offset:size] != data[offset:size]
+                ):
+                    changed.append(slot)
+        for slot in slots:
+            self._read_at[slot] = now
+        if self._pending:
+            self._settle(slots, now)
+        for slot in changed:
+            if not self._read[slot]:
+                self._first_reads.add(slot)
+            self._read[slot] = True
+            self._stale[slot] = False
+            if self._visible[slot]:
+                self._changed.add(slot)
+
+    def update(
+        self, words: Mapping[int, int], slots: Iterable[int], now: float
+    ) -> None:
+        """Store words keyed by register address for the given slots."""
+        slots = list(slots)
+        if self._pending:
+            self._settle(slots, now)
+        for slot in slots:
+            address = self._addresses[slot]
+            offset = self._offsets[slot]
+            size = self._sizes[slot]
+            try:
+                data = b"".join(
+                    UINT16.pack(words[address + index]) for index in range(size // 2)
+                )
+            except KeyError:
+                # A register only has a value if all of its words were read
+                if self._read[slot]:
+                    self._read[slot] = False
+                    self._stale[slot] = False
+                    if self._visible[slot]:
+                        self._changed.add(slot)
+                continue
+            self._read_at[slot] = now
+            if (
+                not self._read[slot]
+                or self._stale[slot]
+                or self._image[offset : offset + size] != data
+            ):
+                self._image[offset : offset + size] = data
+                self._decoded = None
+                if not self._read[slot]:
+                    self._first_reads.add(slot)
+                self._read[slot] = True
+                self._stale[slot] = False
+                if self._visible[slot]:
+                    self._changed.add(slot)
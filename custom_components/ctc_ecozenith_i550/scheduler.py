@@ -0,0 +1,139 @@
+"""Polling groups for CTC Ecozenith i550 registers."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from .feature_register import PollClass
+from .topology import register_unit
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .read_planner import ReadBlock
+
+# Groups are listed by priority: when a sweep runs out of time the groups
+# further down are carried over to the next sweeps
+POLL_INTERVALS: dict[PollClass, timedelta | None] = {
+    PollClass.FAST: timedelta(seconds=5),
+    PollClass.SETTING: timedelta(minutes=1),
+    PollClass.COUNTER: timedelta(minutes=5),
+    # Identity registers are only read on the first sweep after setup
+    PollClass.IDENTITY: None,
+}
+
+# Coordinator ticks drift by a few milliseconds, so a group that is due
+# "almost now" is polled in this tick rather than a full interval later
+SCHEDULER_SLACK = 0.5
+
+# Share of the update interval a sweep may spend on the groups after the
+# fast group, which is always read in full to keep its cadence
+SWEEP_BUDGET_SHARE = 0.8
+
+# After each round a group polls faster when at least ACTIVE_SHARE of its
+# registers changed, and slower when fewer than IDLE_SHARE did
+ACTIVE_SHARE = 0.1
+IDLE_SHARE = 0.02
+SPEED_UP = 0.5
+BACK_OFF = 1.25
+# A group may keep the link busy for at most this share of its interval
+MAX_LINK_SHARE = 0.5
+
+
+@dataclass(slots=True)
+class PollGroup:
+    """Registers that share a polling interval."""
+
+    poll_class: PollClass
+    keys: tuple[str, ...]
+    interval: timedelta | None
+    last_poll: float | None = None
+    # Blocks of the current round that are still to be read, and the
+    # monotonic time the round became due
+    backlog: deque[ReadBlock] = field(default_factory=deque)
+    due_at: float = 0.0
+    # Bounds of the adaptive interval in seconds, and the changed registers
+    # and seconds spent reading in the current round
+    min_interval: float = 0.0
+    max_interval: float = float("inf")
+    changes: int = 0
+    cost: float = 0.0
+
+    def due(self, now: float) -> bool:
+        """Return True if the group must be polled at monotonic time now."""
+        if self.last_poll is None:
+            return True
+        if self.interval is None:
+            return False
+        return now - self.last_poll + SCHEDULER_SLACK >= self.interval.total_seconds()
+
+    def lag(self, now: float) -> float:
+        """Return how long the current round has been waiting to complete."""
+        return now - self.due_at if self.backlog else 0.0
+
+    def adapt(self, polled: int) -> None:
+        """Tune the interval from the change rate and cost of the last round."""
+        if self.interval is not None and polled:
+            seconds = self.interval.total_seconds()
+            share = self.changes / polled
+            if share >= ACTIVE_SHARE:
+                seconds *= SPEED_UP
+            elif share < IDLE_SHARE:
+                seconds *= BACK_OFF
+            seconds = min(max(seconds, self.min_interval), self.max_interval)
+            # A slow link wins over the lower bound
+            self.interval = timedelta(seconds=max(seconds, self.cost / MAX_LINK_SHARE))
+        self.changes = 0
+        self.cost = 0.0
+
+
+def build_poll_groups(
+    registers: Mapping[str, Any],
+    bounds: tuple[float, float] = (0.0, float("inf")),
+) -> dict[PollClass, PollGroup]:
+    """
+    Split the register table into one polling group per poll class.
+
+    The bounds apply to the fast group; the other groups scale them by
+    their base interval.
+    """
+    fast = POLL_INTERVALS[PollClass.FAST]
+    return {
+        poll_class: PollGroup(
+            poll_class,
+            tuple(
+                key
+                for key, register in registers.items()
+                if register.poll_class == poll_class
+            ),
+            interval,
+            min_interval=bounds[0] * (interval / fast if interval else 1),
+            max_interval=bounds[1] * (interval / fast if interval else 1),
+        )
+        for poll_class, interval in POLL_INTERVALS.items()
+    }
+
+
+def build_boost_group(
+    registers: Mapping[str, Any],
+    unit: tuple[str, int] | None,
+    interval: timedelta,
+) -> PollGroup:
+    """
+    Return a group of the fast registers of one unit polled at interval.
+
+    Registers that belong to no heat pump or heating system form the unit
+    None.
+    """
+    return PollGroup(
+        PollClass.FAST,
+        tuple(
+            key
+            for key, register in registers.items()
+            if register.poll_class == PollClass.FAST and register_unit(key) == unit
+        ),
+        interval,
+    )
@@ -12,8 +12,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .coordinator import CTCEcozenithDataUpdateCoordinator
+from .topology import Topology
 
 # Common select maps
 HOT_WATER_MODE_MAP = {
@@ -257,17 +260,22 @@ def get_device_info(entity_key: str) -> dict:
     }
 
 
-class CTCEcozenithSelect(SelectEntity):
+class CTCEcozenithSelect(
+    CoordinatorEntity[CTCEcozenithDataUpdateCoordinator], SelectEntity
+):
     """Generic select entity for CTC Ecozenith i550."""
 
     entity_description: CTCSelectEntityDescription
 
     def __init__(
-        self, coordinator: Any, description: CTCSelectEntityDescription
+        self,
+        coordinator: CTCEcozenithDataUpdateCoordinator,
+        description: CTCSelectEntityDescription,
     ) -> None:
         """Initialize the select entity."""
-        self.coordinator = coordinator
+        super().__init__(coordinator, context=description.value_key)
         self.entity_description = description
+        self._slot = coordinator.data.slot(description.value_key)
         self._attr_name = description.name
         self._attr_options = list(description.options_map.values())
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{description.key}"
@@ -280,40 +288,38 @@ class CTCEcozenithSelect(SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the current option."""
-        value = self.coordinator.data.get(self.entity_description.value_key)
+        value = self.coordinator.data.value(self._slot)
         return self.entity_description.options_map.get(value)
 
     async def async_select_option(self, option: str) -> None:
         """Set the selected option."""
         value = self.entity_description.reverse_map[option]
         await self.coordinator.async_write_register(
-            self.entity_description.register, value
+            self.entity_description.register,
+            value,
+            pending=(self.entity_description.value_key, value),
         )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_register(self.entity_description.value_key)
 
     @property
     def available(self) -> bool:
         """Return True if select data is available."""
-        return self.entity_description.value_key in self.coordinator.data
+        return super().available and self.coordinator.data.value(self._slot) is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return whether the value awaits confirmation or was kept stale."""
+        return self.coordinator.value_attributes(self._slot)
 
 
 def filter_heatpump_sensors(
-    sensor_descriptions: list[SelectEntityDescription],
-) -> list[SelectEntityDescription]:
-    """Filter sensor descriptions to only include the configured number of heat pumps."""
-    filtered: list[SelectEntityDescription] = []
-    for desc in sensor_descriptions:
-        if desc.key.startswith("heat_pump_"):
-            parts = desc.key.split("_")
-            if len(parts) > 2 and parts[2].isdigit():
-                filtered.append(desc)
-                continue
-        if desc.key.startswith("hs") or desc.key.startswith("hc"):
-            parts = desc.key.split("_")
-            if len(parts) > 2 and parts[1].isdigit():
-                filtered.append(desc)
-        filtered.append(desc)
-    return filtered
+    sensor_descriptions: tuple[CTCSelectEntityDescription, ...],
+    num_heatpumps: int,
+    num_heating_systems: int,
+) -> list[CTCSelectEntityDescription]:
+    """Filter select descriptions to only include the installed units."""
+    topology = Topology(num_heatpumps, num_heating_systems)
+    return [desc for desc in sensor_descriptions if topology.includes(desc.key)]
 
 
 async def async_setup_entry(
@@ -325,7 +331,11 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
     entities = []
-    for description in SELECTS:
+    for description in filter_heatpump_sensors(
+        SELECTS,
+        coordinator.topology.heat_pumps,
+        coordinator.topology.heating_systems,
+    ):
         if coordinator.data.get(description.key) is None:
             continue
         if description.key == "sgmode":
@@ -361,7 +371,7 @@ class CTCEcozenithSGModeSelect(CTCEcozenithSelect):
     @property
     def current_option(self) -> str | None:
         """Return the current option."""
-        value = self.coordinator.data.get(self.entity_description.value_key)
+        value = self.coordinator.data.value(self._slot)
         return self.entity_description.options_map.get(value)
 
     async def async_select_option(self, option: str) -> None:
@@ -371,13 +381,17 @@ class CTCEcozenithSGModeSelect(CTCEcozenithSelect):
         if write_value is not None:
             async with self._write_lock:
                 await self.coordinator.async_write_register(
-                    self.entity_description.register, write_value
+                    self.entity_description.register,
+                    write_value,
+                    pending=(self.entity_description.value_key, value),
+                )
+                await self.coordinator.async_refresh_register(
+                    self.entity_description.value_key
                 )
-                await self.coordinator.async_request_refresh()
 
     async def _async_periodic_write(self, now) -> None:
         """Periodically write the current value to prevent reset."""
-        value = self.coordinator.data.get(self.entity_description.value_key)
+        value = self.coordinator.data.value(self._slot)
         write_value = SGMODE_READ_TO_WRITE.get(value)
         if write_value is not None:
             async with self._write_lock:
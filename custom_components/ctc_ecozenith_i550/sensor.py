@@ -3,17 +3,37 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
+from typing import Any, Self
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorExtraStoredData,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfEnergy, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .connection import CircuitState
+from .const import CONNECTION_STATE, DOMAIN
+from .coordinator import CTCEcozenithDataUpdateCoordinator
+from .topology import MAX_HEAT_PUMPS, MAX_HEATING_SYSTEMS, Topology
+
+_LOGGER = logging.getLogger(__name__)
+
+# Range of the 32-bit counter registers
+COUNTER_WRAP = 1 << 32
+
+# Counters that had a sensor per word, with an _lsb or _msb key suffix
+SPLIT_COUNTERS = ("_compressor_operating_time", "_compressor_power_consumption_kwh")
 
 SENSOR_DESCRIPTIONS = [
     # Hot Water Settings
@@ -2443,53 +2463,83 @@ SENSOR_DESCRIPTIONS = [
         icon="mdi:information-outline",
     ),
     SensorEntityDescription(
-        key="heat_pump_1_compressor_operating_time_lsb",
-        name="Compressor Operating Time LSB",
+        key="heat_pump_1_compressor_operating_time",
+        name="Compressor Operating Time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:timer-outline",
     ),
     SensorEntityDescription(
-        key="heat_pump_2_compressor_operating_time_lsb",
-        name="Compressor Operating Time LSB",
+        key="heat_pump_2_compressor_operating_time",
+        name="Compressor Operating Time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:timer-outline",
     ),
     SensorEntityDescription(
-        key="heat_pump_3_compressor_operating_time_lsb",
-        name="Compressor Operating Time LSB",
+        key="heat_pump_3_compressor_operating_time",
+        name="Compressor Operating Time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:timer-outline",
     ),
     SensorEntityDescription(
-        key="heat_pump_4_compressor_operating_time_lsb",
-        name="Compressor Operating Time LSB",
+        key="heat_pump_4_compressor_operating_time",
+        name="Compressor Operating Time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:timer-outline",
     ),
     SensorEntityDescription(
-        key="heat_pump_5_compressor_operating_time_lsb",
-        name="Compressor Operating Time LSB",
+        key="heat_pump_5_compressor_operating_time",
+        name="Compressor Operating Time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:timer-outline",
     ),
     SensorEntityDescription(
-        key="heat_pump_6_compressor_operating_time_lsb",
-        name="Compressor Operating Time LSB",
+        key="heat_pump_6_compressor_operating_time",
+        name="Compressor Operating Time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:timer-outline",
     ),
     SensorEntityDescription(
-        key="heat_pump_7_compressor_operating_time_lsb",
-        name="Compressor Operating Time LSB",
+        key="heat_pump_7_compressor_operating_time",
+        name="Compressor Operating Time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:timer-outline",
     ),
     SensorEntityDescription(
-        key="heat_pump_8_compressor_operating_time_lsb",
-        name="Compressor Operating Time LSB",
+        key="heat_pump_8_compressor_operating_time",
+        name="Compressor Operating Time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:timer-outline",
     ),
     SensorEntityDescription(
-        key="heat_pump_9_compressor_operating_time_lsb",
-        name="Compressor Operating Time LSB",
+        key="heat_pump_9_compressor_operating_time",
+        name="Compressor Operating Time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:timer-outline",
     ),
     SensorEntityDescription(
-        key="heat_pump_10_compressor_operating_time_lsb",
-        name="Compressor Operating Time LSB",
+        key="heat_pump_10_compressor_operating_time",
+        name="Compressor Operating Time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:timer-outline",
     ),
     SensorEntityDescription(
@@ -3047,123 +3097,83 @@ SENSOR_DESCRIPTIONS = [
         icon="mdi:flash",
     ),
     SensorEntityDescription(
-        key="heat_pump_1_compressor_power_consumption_kwh_lsb",
-        name="Compressor Power Consumption kWh LSB",
-        native_unit_of_measurement="kWh",
-        icon="mdi:flash",
-    ),
-    SensorEntityDescription(
-        key="heat_pump_1_compressor_power_consumption_kwh_msb",
-        name="Compressor Power Consumption kWh MSB",
-        native_unit_of_measurement="kWh",
-        icon="mdi:flash",
-    ),
-    SensorEntityDescription(
-        key="heat_pump_2_compressor_power_consumption_kwh_lsb",
-        name="Compressor Power Consumption kWh LSB",
-        native_unit_of_measurement="kWh",
-        icon="mdi:flash",
-    ),
-    SensorEntityDescription(
-        key="heat_pump_2_compressor_power_consumption_kwh_msb",
-        name="Compressor Power Consumption kWh MSB",
-        native_unit_of_measurement="kWh",
-        icon="mdi:flash",
-    ),
-    SensorEntityDescription(
-        key="heat_pump_3_compressor_power_consumption_kwh_lsb",
-        name="Compressor Power Consumption kWh LSB",
-        native_unit_of_measurement="kWh",
-        icon="mdi:flash",
-    ),
-    SensorEntityDescription(
-        key="heat_pump_3_compressor_power_consumption_kwh_msb",
-        name="Compressor Power Consumption kWh MSB",
-        native_unit_of_measurement="kWh",
-        icon="mdi:flash",
-    ),
-    SensorEntityDescription(
-        key="heat_pump_4_compressor_power_consumption_kwh_lsb",
-        name="Compressor Power Consumption kWh LSB",
-        native_unit_of_measurement="kWh",
+        key="heat_pump_1_compressor_power_consumption_kwh",
+        name="Compressor Power Consumption",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:flash",
     ),
     SensorEntityDescription(
-        key="heat_pump_4_compressor_power_consumption_kwh_msb",
-        name="Compressor Power Consumption kWh MSB",
-        native_unit_of_measurement="kWh",
+        key="heat_pump_2_compressor_power_consumption_kwh",
+        name="Compressor Power Consumption",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:flash",
     ),
     SensorEntityDescription(
-        key="heat_pump_5_compressor_power_consumption_kwh_lsb",
-        name="Compressor Power Consumption kWh LSB",
-        native_unit_of_measurement="kWh",
+        key="heat_pump_3_compressor_power_consumption_kwh",
+        name="Compressor Power Consumption",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:flash",
     ),
     SensorEntityDescription(
-        key="heat_pump_5_compressor_power_consumption_kwh_msb",
-        name="Compressor Power Consumption kWh MSB",
-        native_unit_of_measurement="kWh",
+        key="heat_pump_4_compressor_power_consumption_kwh",
+        name="Compressor Power Consumption",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:flash",
     ),
     SensorEntityDescription(
-        key="heat_pump_6_compressor_power_consumption_kwh_lsb",
-        name="Compressor Power Consumption kWh LSB",
-        native_unit_of_measurement="kWh",
+        key="heat_pump_5_compressor_power_consumption_kwh",
+        name="Compressor Power Consumption",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:flash",
     ),
     SensorEntityDescription(
-        key="heat_pump_6_compressor_power_consumption_kwh_msb",
-        name="Compressor Power Consumption kWh MSB",
-        native_unit_of_measurement="kWh",
-        icon="mdi:flash",
-    ),
-    SensorEntityDescription(
-        key="heat_pump_7_compressor_power_consumption_kwh_lsb",
-        name="Compressor Power Consumption kWh LSB",
-        native_unit_of_measurement="kWh",
+        key="heat_pump_6_compressor_power_consumption_kwh",
+        name="Compressor Power Consumption",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:flash",
     ),
     SensorEntityDescription(
-        key="heat_pump_7_compressor_power_consumption_kwh_msb",
-        name="Compressor Power Consumption kWh MSB",
-        native_unit_of_measurement="kWh",
-        icon="mdi:flash",
-    ),
-    SensorEntityDescription(
-        key="heat_pump_8_compressor_power_consumption_kwh_lsb",
-        name="Compressor Power Consumption kWh LSB",
-        native_unit_of_measurement="kWh",
-        icon="mdi:flash",
-    ),
-    SensorEntityDescription(
-        key="heat_pump_8_compressor_power_consumption_kwh_msb",
-        name="Compressor Power Consumption kWh MSB",
-        native_unit_of_measurement="kWh",
-        icon="mdi:flash",
-    ),
-    SensorEntityDescription(
-        key="heat_pump_9_compressor_power_consumption_kwh_lsb",
-        name="Compressor Power Consumption kWh LSB",
-        native_unit_of_measurement="kWh",
+        key="heat_pump_7_compressor_power_consumption_kwh",
+        name="Compressor Power Consumption",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:flash",
     ),
     SensorEntityDescription(
-        key="heat_pump_9_compressor_power_consumption_kwh_msb",
-        name="Compressor Power Consumption kWh MSB",
-        native_unit_of_measurement="kWh",
+        key="heat_pump_8_compressor_power_consumption_kwh",
+        name="Compressor Power Consumption",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:flash",
     ),
     SensorEntityDescription(
-        key="heat_pump_10_compressor_power_consumption_kwh_lsb",
-        name="Compressor Power Consumption kWh LSB",
-        native_unit_of_measurement="kWh",
+        key="heat_pump_9_compressor_power_consumption_kwh",
+        name="Compressor Power Consumption",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:flash",
     ),
     SensorEntityDescription(
-        key="heat_pump_10_compressor_power_consumption_kwh_msb",
-        name="Compressor Power Consumption kWh MSB",
-        native_unit_of_measurement="kWh",
+        key="heat_pump_10_compressor_power_consumption_kwh",
+        name="Compressor Power Consumption",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:flash",
     ),
     SensorEntityDescription(
@@ -3175,8 +3185,6 @@ SENSOR_DESCRIPTIONS = [
     # ...existing code...
 ]
 
-_logger = logging.getLogger(__name__)
-
 STATUS_MAP = {
     0: "HP upper",
     1: "HP lower",
@@ -3228,6 +3236,26 @@ SG_MODE_MAP = {
     3: "High cap",
 }
 
+# Enum maps of the registers whose raw value is a mode or status code
+VALUE_MAPS: dict[str, dict[int, str]] = {
+    "status": STATUS_MAP,
+    "solar_mode": SOLAR_MODE_MAP,
+    "sgmode": SG_MODE_MAP,
+    **{
+        f"heat_pump_{number}_status": HP_STATUS_MAP
+        for number in range(1, MAX_HEAT_PUMPS + 1)
+    },
+    **{
+        f"hs_{number}_status": HEATING_SYSTEM_MODE_MAP
+        for number in range(1, MAX_HEATING_SYSTEMS + 1)
+    },
+}
+
+
+def _raw_value(value: StateType) -> StateType:
+    """Return a register value that needs no conversion."""
+    return value
+
 
 def filter_heatpump_sensors(
     sensor_descriptions: list[SensorEntityDescription],
@@ -3235,25 +3263,8 @@ def filter_heatpump_sensors(
     num_heating_systems: int,
 ) -> list[SensorEntityDescription]:
     """Filter sensor descriptions to only include the configured number of heat pumps."""
-    filtered: list[SensorEntityDescription] = []
-    for desc in sensor_descriptions:
-        if desc.key.startswith("heat_pump_"):
-            parts = desc.key.split("_")
-            if len(parts) > 2 and parts[2].isdigit():
-                hp_number = int(parts[2])
-                if 1 <= hp_number <= num_heatpumps:
-                    filtered.append(desc)
-                continue
-        if desc.key.startswith("hs") or desc.key.startswith("hc"):
-            parts = desc.key.split("_")
-            _logger.debug("parts: %s", parts)
-            if len(parts) > 2 and parts[1].isdigit():
-                hs_number = int(parts[1])
-                if 1 <= hs_number <= num_heating_systems:
-                    filtered.append(desc)
-                continue
-        filtered.append(desc)
-    return filtered
+    topology = Topology(num_heatpumps, num_heating_systems)
+    return [desc for desc in sensor_descriptions if topology.includes(desc.key)]
 
 
 async def async_setup_entry(
@@ -3263,22 +3274,64 @@ async def async_setup_entry(
 ) -> None:
     """Set up CTC Ecozenith i550 sensors from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    _migrate_split_counters(hass, entry)
+    descriptions = filter_heatpump_sensors(
+        SENSOR_DESCRIPTIONS,
+        coordinator.topology.heat_pumps,
+        coordinator.topology.heating_systems,
+    )
     entities = [
-        CTCEcozenithSensor(coordinator, description)
-        for description in SENSOR_DESCRIPTIONS
+        CTCEcozenithCounterSensor(coordinator, description)
+        if description.state_class is SensorStateClass.TOTAL_INCREASING
+        else CTCEcozenithSensor(coordinator, description)
+        for description in descriptions
         if coordinator.data.get(description.key) is not None
     ]
+    entities.append(CTCEcozenithConnectionSensor(coordinator))
     async_add_entities(entities)
 
 
-class CTCEcozenithSensor(SensorEntity):
+@callback
+def _migrate_split_counters(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Move the low word sensors of the 32-bit counters to the counter sensor."""
+    # The entity keeps its id and history, the high word sensors are removed
+    registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        new_unique_id, suffix = (
+            registry_entry.unique_id[:-4],
+            registry_entry.unique_id[-4:],
+        )
+        if suffix not in ("_lsb", "_msb") or not new_unique_id.endswith(SPLIT_COUNTERS):
+            continue
+        if suffix == "_msb" or registry.async_get_entity_id(
+            registry_entry.domain, DOMAIN, new_unique_id
+        ):
+            registry.async_remove(registry_entry.entity_id)
+            continue
+        _LOGGER.debug("Migrating %s to %s", registry_entry.entity_id, new_unique_id)
+        registry.async_update_entity(
+            registry_entry.entity_id, new_unique_id=new_unique_id
+        )
+
+
+class CTCEcozenithSensor(
+    CoordinatorEntity[CTCEcozenithDataUpdateCoordinator], SensorEntity
+):
     """Sensor for a CTC Ecozenith i550 register."""
 
-    def __init__(self, coordinator, description: SensorEntityDescription) -> None:
+    def __init__(
+        self,
+        coordinator: CTCEcozenithDataUpdateCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
         """Initialize the sensor."""
-        self.coordinator = coordinator
+        # The register key as context limits updates to changes of this key
+        super().__init__(coordinator, context=description.key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{description.key}"
+        self._slot = coordinator.data.slot(description.key)
+        value_map = VALUE_MAPS.get(description.key)
+        self._convert_value = value_map.get if value_map is not None else _raw_value
 
     @property
     def device_info(self) -> dict:
@@ -3302,56 +3355,164 @@ class CTCEcozenithSensor(SensorEntity):
         }
 
     @property
-    def native_value(self):
+    def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        raw_value = self.coordinator.data.get(self.entity_description.key)
-        # Extract value from FeatureRegister if present
-        if hasattr(raw_value, "value"):
-            raw_value = raw_value.value
-        # Return None if value is not available
-        if raw_value is None:
-            return None
-        if self.entity_description.key == "status":
-            return STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "heat_pump_1_status":
-            return HP_STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "heat_pump_2_status":
-            return HP_STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "heat_pump_3_status":
-            return HP_STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "heat_pump_4_status":
-            return HP_STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "heat_pump_5_status":
-            return HP_STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "heat_pump_6_status":
-            return HP_STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "heat_pump_7_status":
-            return HP_STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "heat_pump_8_status":
-            return HP_STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "heat_pump_9_status":
-            return HP_STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "heat_pump_10_status":
-            return HP_STATUS_MAP.get(raw_value)
-        if self.entity_description.key == "solar_mode":
-            return SOLAR_MODE_MAP.get(raw_value)
-        if self.entity_description.key == "hs_1_status":
-            return HEATING_SYSTEM_MODE_MAP.get(raw_value)
-        if self.entity_description.key == "hs_2_status":
-            return HEATING_SYSTEM_MODE_MAP.get(raw_value)
-        if self.entity_description.key == "hs_3_status":
-            return HEATING_SYSTEM_MODE_MAP.get(raw_value)
-        if self.entity_description.key == "hs_4_status":
-            return HEATING_SYSTEM_MODE_MAP.get(raw_value)
-        if self.entity_description.key == "sgmode":
-            return SG_MODE_MAP.get(raw_value)
-        return raw_value
+        return self._convert_value(self.coordinator.data.value(self._slot))
 
     @property
     def available(self) -> bool:
         """Return True if sensor data is available."""
-        return self.coordinator.data.get(self.entity_description.key) is not None
+        return super().available and self.coordinator.data.value(self._slot) is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return whether the value awaits confirmation or was kept stale."""
+        return self.coordinator.value_attributes(self._slot)
+
+
+@dataclass
+class CounterExtraStoredData(SensorExtraStoredData):
+    """Counter state kept across restarts."""
+
+    rollover: int
+    last_count: float | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the counter data."""
+        return {
+            **super().as_dict(),
+            "rollover": self.rollover,
+            "last_count": self.last_count,
+        }
+
+    @classmethod
+    def from_dict(cls, restored: dict[str, Any]) -> Self | None:
+        """Initialize a stored counter state from a dict."""
+        sensor = SensorExtraStoredData.from_dict(restored)
+        if sensor is None:
+            return None
+        try:
+            rollover = int(restored["rollover"])
+            last_count = restored["last_count"]
+        except (KeyError, TypeError, ValueError):
+            return None
+        return cls(
+            sensor.native_value,
+            sensor.native_unit_of_measurement,
+            rollover,
+            last_count,
+        )
+
+
+class CTCEcozenithCounterSensor(CTCEcozenithSensor, RestoreSensor):
+    """Total increasing sensor for a 32-bit counter register."""
+
+    def __init__(
+        self,
+        coordinator: CTCEcozenithDataUpdateCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the counter sensor."""
+        super().__init__(coordinator, description)
+        self._last_count: float | None = coordinator.data.value(self._slot)
+        self._rollover = 0
 
-    async def async_update(self):
-        """Update the sensor."""
-        await self.coordinator.async_request_refresh()
+    async def async_added_to_hass(self) -> None:
+        """Restore the rollovers counted before the last restart."""
+        await super().async_added_to_hass()
+        last_extra_data = await self.async_get_last_extra_data()
+        if last_extra_data is None:
+            return
+        restored = CounterExtraStoredData.from_dict(last_extra_data.as_dict())
+        if restored is None:
+            return
+        self._rollover = restored.rollover
+        # The counter may have wrapped while Home Assistant was stopped
+        count = self._last_count
+        self._last_count = restored.last_count
+        self._track(count)
+
+    @property
+    def extra_restore_state_data(self) -> CounterExtraStoredData:
+        """Return the counter state to restore after a restart."""
+        return CounterExtraStoredData(
+            self.native_value,
+            self.native_unit_of_measurement,
+            self._rollover,
+            self._last_count,
+        )
+
+    def _track(self, count: float | None) -> None:
+        """Count a rollover or reset if the counter dropped since the last value."""
+        if count is None:
+            return
+        last = self._last_count
+        if last is not None and count < last:
+            if last - count > COUNTER_WRAP // 2:
+                # Wrapped past the top of the range, keep counting up
+                self._rollover += COUNTER_WRAP
+            else:
+                # A smaller value is a reset of the counter, which Home
+                # Assistant starts a new cycle for
+                _LOGGER.debug(
+                    "Counter %s reset from %s to %s",
+                    self.entity_description.key,
+                    last,
+                    count,
+                )
+                self._rollover = 0
+        self._last_count = count
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Track rollovers and resets of the counter before writing the state."""
+        self._track(self.coordinator.data.value(self._slot))
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the counter including any rollovers."""
+        count = self.coordinator.data.value(self._slot)
+        return None if count is None else count + self._rollover
+
+
+class CTCEcozenithConnectionSensor(
+    CoordinatorEntity[CTCEcozenithDataUpdateCoordinator], SensorEntity
+):
+    """Diagnostic sensor for the state of the connection circuit breaker."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:lan-connect"
+    _attr_name = "Connection State"
+
+    def __init__(self, coordinator: CTCEcozenithDataUpdateCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, context=CONNECTION_STATE)
+        self._attr_options = [state.value for state in CircuitState]
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{CONNECTION_STATE}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, "ctc_ecozenith_i550")},
+            "name": "CTC Ecozenith i550",
+            "manufacturer": "CTC",
+            "model": "Ecozenith i550",
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return True, the state is known even while the device is down."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the circuit breaker."""
+        return self.coordinator.connection.state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the failed attempts and the time until the next retry."""
+        connection = self.coordinator.connection
+        return {
+            "failures": connection.failures,
+            "retry_in": round(connection.retry_in),
+        }
@@ -0,0 +1,87 @@
+"""Installed heat pumps and heating systems of a CTC Ecozenith i550."""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_HEAT_PUMPS = 10
+MAX_HEATING_SYSTEMS = 4
+
+HEAT_PUMP = "heat_pump"
+HEATING_SYSTEM = "heating_system"
+
+# Keys of unit registers start with the unit and its number, as in
+# heat_pump_2_status or hs_1_room_temp
+UNIT_KEY = re.compile(r"(heat_pump|hs|hc)_(\d+)_")
+
+
+def register_unit(key: str) -> tuple[str, int] | None:
+    """Return the unit family and number a register key belongs to."""
+    match = UNIT_KEY.match(key)
+    if match is None:
+        return None
+    return HEAT_PUMP if match[1] == HEAT_PUMP else HEATING_SYSTEM, int(match[2])
+
+
+def unit_template(key: str) -> str:
+    """Return a register key with the number of its unit left out."""
+    unit = register_unit(key)
+    if unit is None:
+        return key
+    parts = key.split("_")
+    index = 2 if unit[0] == HEAT_PUMP else 1
+    return "_".join(parts[:index] + parts[index + 1 :])
+
+
+@dataclass(frozen=True, slots=True)
+class Topology:
+    """Number of heat pumps and heating systems present on the site."""
+
+    heat_pumps: int = MAX_HEAT_PUMPS
+    heating_systems: int = MAX_HEATING_SYSTEMS
+
+    def includes(self, key: str) -> bool:
+        """Return True if the register key belongs to an installed unit."""
+        unit = register_unit(key)
+        if unit is None:
+            return True
+        family, number = unit
+        if family == HEAT_PUMP:
+            return 1 <= number <= self.heat_pumps
+        return 1 <= number <= self.heating_systems
+
+
+def discover_topology(visibility: Mapping[str, bool]) -> Topology:
+    """
+    Derive the installed units from the visibility bitmap.
+
+    A unit counts as installed when most of its registers are visible, since a
+    few registers share their visibility bit with a register of another unit.
+    """
+    visible: Counter[tuple[str, int]] = Counter()
+    total: Counter[tuple[str, int]] = Counter()
+    for key, is_visible in visibility.items():
+        unit = register_unit(key)
+        if unit is not None:
+            total[unit] += 1
+            visible[unit] += is_visible
+
+    highest = {HEAT_PUMP: 0, HEATING_SYSTEM: 0}
+    for (family, number), count in total.items():
+        if 2 * visible[family, number] > count:
+            highest[family] = max(highest[family], number)
+
+    if not highest[HEAT_PUMP] and not highest[HEATING_SYSTEM]:
+        # Nothing visible at all is more likely a bad read than an empty site
+        _LOGGER.warning("Could not discover any units, keeping all of them")
+        return Topology()
+    return Topology(highest[HEAT_PUMP], highest[HEATING_SYSTEM])
@@ -0,0 +1 @@
+"""Tests for the CTC Ecozenith i550 integration."""
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark of decoding a full snapshot of the register table.
+
+Compares the batch decode of the register store against the former
+per-register path, which scaled each read word on its own. The store
+decodes the whole image with one struct call and one map, timed as a
+full snapshot and as one value read per slot the way entities read them.
+Run from the repository root:
+
+    python tests/benchmark_decode.py
+"""
+
+import random
+import struct
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from custom_components.ctc_ecozenith_i550.const import BMS_REGISTERS
+from custom_components.ctc_ecozenith_i550.register_store import (
+    RegisterStore,
+    to_signed,
+)
+
+NUMBER = 200
+
+
+def main() -> None:
+    """Time both decode paths over one snapshot of every register."""
+    registers = BMS_REGISTERS
+    low = min(register.address for register in registers.values())
+    high = max(
+        register.address + register.word_count for register in registers.values()
+    )
+    rng = random.Random(0)  # noqa: S311 benchmark data only
+    words = {address: rng.randrange(0x10000) for address in range(low, high)}
+
+    def per_register() -> dict[str, float]:
+        return {
+            key: to_signed(words[register.address], signed=register.signed)
+            * register.scale
+            for key, register in registers.items()
+        }
+
+    store = RegisterStore(registers)
+    store.set_visibility(dict.fromkeys(registers, True))
+    store.load(
+        low, struct.pack(f">{high - low}H", *(words[a] for a in range(low, high))), 0.0
+    )
+    slots = range(len(store))
+    # Loading one changed word before each decode keeps the timing on the
+    # decode of a fresh image and off the copy of a whole sweep
+    changes = [struct.pack(">H", word) for word in (words[low] ^ 1, words[low])]
+
+    def store_snapshot() -> list[float | None]:
+        values = []
+        for data in changes:
+            store.load(low, data, 0.0)
+            values.extend(store.snapshot())
+        return values
+
+    def store_per_slot() -> list[float | None]:
+        values = []
+        for data in changes:
+            store.load(low, data, 0.0)
+            values.extend(store.value(slot) for slot in slots)
+        return values
+
+    print(f"{len(registers)} registers over {high - low} words")
+    for name, func, count in (
+        ("per register", per_register, 1),
+        ("store, snapshot", store_snapshot, 2),
+        ("store, per slot", store_per_slot, 2),
+    ):
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER / count
+        print(f"{name:>15}: {seconds * 1e6:8.1f} us per snapshot")
+
+
+if __name__ == "__main__":
+    main()
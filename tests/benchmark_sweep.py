@@ -0,0 +1,68 @@
+"""
+Micro-benchmark of storing the responses of a full register sweep.
+
+Compares copying the FC3 response bytes straight into the register store
+with the list path, which unpacks every response into a list of ints like
+pymodbus does and stores the words keyed by address. Run from the
+repository root:
+
+    python tests/benchmark_sweep.py
+"""
+
+import random
+import struct
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from custom_components.ctc_ecozenith_i550.const import BMS_REGISTERS
+from custom_components.ctc_ecozenith_i550.read_planner import (
+    build_span_plan,
+    register_span,
+)
+from custom_components.ctc_ecozenith_i550.register_store import RegisterStore
+
+NUMBER = 500
+
+
+def main() -> None:
+    """Time both paths over one response per block of the full read plan."""
+    plan = build_span_plan(
+        register_span(register) for register in BMS_REGISTERS.values()
+    )
+    rng = random.Random(0)  # noqa: S311 benchmark data only
+    # Each PDU is the byte count followed by the big-endian words
+    responses = [
+        (
+            block,
+            bytes([2 * block.count])
+            + struct.pack(
+                f">{block.count}H",
+                *(rng.randrange(0x10000) for _ in range(block.count)),
+            ),
+        )
+        for block in plan
+    ]
+    store = RegisterStore(BMS_REGISTERS)
+
+    def raw() -> None:
+        for block, pdu in responses:
+            store.load(block.address, memoryview(pdu)[1:], 0.0)
+
+    def lists() -> None:
+        for block, pdu in responses:
+            registers = list(struct.unpack_from(f">{block.count}H", pdu, 1))
+            words = dict(zip(range(block.address, block.end), registers, strict=True))
+            store.update(words, store.slots_between(block.address, block.end), 0.0)
+
+    words = sum(block.count for block in plan)
+    print(f"{len(BMS_REGISTERS)} registers, {words} words in {len(plan)} blocks")
+    for name, func in (("raw", raw), ("lists", lists)):
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{name:>6}: {seconds * 1e6:8.1f} us per sweep")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Fixtures for the CTC Ecozenith i550 tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ctc_ecozenith_i550.const import BMS_REGISTERS, DOMAIN
+from custom_components.ctc_ecozenith_i550.topology import Topology
+
+from .fake_device import FakeDevice
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ctc_ecozenith_i550.coordinator import (
+        CTCEcozenithDataUpdateCoordinator,
+    )
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+# Units the fake device reports as installed
+HEAT_PUMPS = 2
+HEATING_SYSTEMS = 1
+
+
+@pytest.fixture
+async def device(socket_enabled: None) -> AsyncGenerator[FakeDevice]:
+    """Return a fake heat pump with some units installed."""
+    device = FakeDevice()
+    topology = Topology(HEAT_PUMPS, HEATING_SYSTEMS)
+    for key, register in BMS_REGISTERS.items():
+        word = device.registers.setdefault(register.visible_adresss, 0)
+        if topology.includes(key):
+            device.registers[register.visible_adresss] = (
+                word | 1 << register.visible_bit
+            )
+        # Limits in a range every setting accepts
+        for address, value in (
+            (register.min_value_adresss, 0),
+            (register.max_value_adresss, 1000),
+            (register.step_adresss, 1),
+        ):
+            if address is not None:
+                device.registers[address] = value
+    await device.start()
+    yield device
+    await device.stop()
+
+
+@pytest.fixture
+async def config_entry(
+    hass: HomeAssistant, enable_custom_integrations: None, device: FakeDevice
+) -> AsyncGenerator[MockConfigEntry]:
+    """Set up the integration against the fake device."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_NAME: "CTC", CONF_HOST: "127.0.0.1", CONF_PORT: device.port},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield entry
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.fixture
+def coordinator(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> CTCEcozenithDataUpdateCoordinator:
+    """Return the coordinator of the set up entry."""
+    return hass.data[DOMAIN][config_entry.entry_id]
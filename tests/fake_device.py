@@ -0,0 +1,111 @@
+"""Modbus TCP server simulating a CTC Ecozenith i550 for the tests."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+
+from custom_components.ctc_ecozenith_i550.modbus import MBAP_HEADER
+
+
+class FakeDevice:
+    """
+    Holding registers served over Modbus TCP on localhost.
+
+    Unset registers read as a pattern derived from their address. Set
+    ``down`` to drop every connection on the next request, ``reject`` to
+    answer reads of some addresses with an exception and ``garble`` to send
+    a malformed response for them. Without ``pipelining`` a request that
+    arrives while another one is answered is ignored.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Initialize the device without a server."""
+        self.registers: dict[int, int] = {}
+        self.latency = latency
+        self.reject: set[int] = set()
+        self.garble: set[int] = set()
+        self.down = False
+        self.pipelining = True
+        self.connections = 0
+        self.requests: list[tuple[int, int]] = []
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._server: asyncio.Server | None = None
+        self.port = 0
+
+    async def start(self) -> None:
+        """Listen on a free localhost port."""
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        self._server.close()
+
+    def word(self, address: int) -> int:
+        """Return the value of a register."""
+        return self.registers.get(address, (address * 7) & 0xFFFF)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        tasks = set()
+        try:
+            while True:
+                header = await reader.readexactly(MBAP_HEADER.size)
+                transaction_id, _, length, unit_id = MBAP_HEADER.unpack(header)
+                pdu = await reader.readexactly(length - 1)
+                task = asyncio.create_task(
+                    self._respond(writer, transaction_id, unit_id, pdu)
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        transaction_id: int,
+        unit_id: int,
+        pdu: bytes,
+    ) -> None:
+        function_code, address = struct.unpack_from(">BH", pdu)
+        self.requests.append((function_code, address))
+        if self._in_flight and not self.pipelining:
+            return
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        await asyncio.sleep(self.latency)
+        self._in_flight -= 1
+        if self.down:
+            writer.close()
+            return
+        if function_code == 0x03:
+            count = struct.unpack_from(">H", pdu, 3)[0]
+            addresses = range(address, address + count)
+            if self.garble.intersection(addresses):
+                response = bytes((0x03, 2))
+            elif self.reject.intersection(addresses):
+                response = bytes((0x83, 2))
+            else:
+                response = bytes((0x03, 2 * count)) + struct.pack(
+                    f">{count}H", *map(self.word, addresses)
+                )
+        elif function_code == 0x06:
+            self.registers[address] = struct.unpack_from(">H", pdu, 3)[0]
+            response = pdu
+        elif function_code == 0x10:
+            count = struct.unpack_from(">H", pdu, 3)[0]
+            for index, value in enumerate(struct.unpack_from(f">{count}H", pdu, 6)):
+                self.registers[address + index] = value
+            response = pdu[:5]
+        else:
+            response = bytes((function_code | 0x80, 1))
+        if not writer.is_closing():
+            writer.write(
+                MBAP_HEADER.pack(transaction_id, 0, len(response) + 1, unit_id)
+                + response
+            )
@@ -0,0 +1,42 @@
+"""Tests for the options flow."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ctc_ecozenith_i550.const import (
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_options_reject_min_above_max(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """The fast interval bounds must not cross."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_NAME: "CTC", CONF_HOST: "127.0.0.1", CONF_PORT: 502}
+    )
+    entry.add_to_hass(hass)
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_MIN_SCAN_INTERVAL: 20, CONF_MAX_SCAN_INTERVAL: 10},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_MIN_SCAN_INTERVAL: "min_above_max"}
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_MIN_SCAN_INTERVAL: 5, CONF_MAX_SCAN_INTERVAL: 10},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_MIN_SCAN_INTERVAL] == 5
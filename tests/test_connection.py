@@ -0,0 +1,165 @@
+"""Tests for the circuit breaker around the Modbus client."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from custom_components.ctc_ecozenith_i550.connection import (
+    CircuitOpenError,
+    CircuitState,
+    ConnectionManager,
+)
+from custom_components.ctc_ecozenith_i550.modbus import (
+    ModbusError,
+    ModbusExceptionResponseError,
+)
+
+
+class FakeClient:
+    """Track connects and closes of a client that may refuse to connect."""
+
+    def __init__(self, *, reachable: bool = True) -> None:
+        """Initialize a disconnected client."""
+        self.reachable = reachable
+        self.connected = False
+        self.connects = 0
+
+    async def connect(self) -> None:
+        """Connect if the device is reachable."""
+        self.connects += 1
+        # Let concurrent requests run into the connect in progress
+        await asyncio.sleep(0)
+        if not self.reachable:
+            msg = "Connection refused"
+            raise ModbusError(msg)
+        self.connected = True
+
+    async def close(self) -> None:
+        """Drop the connection."""
+        self.connected = False
+
+
+async def _fail() -> None:
+    msg = "Timeout"
+    raise ModbusError(msg)
+
+
+async def _reject() -> None:
+    raise ModbusExceptionResponseError(0x03, 2)
+
+
+async def _answer() -> int:
+    return 1
+
+
+async def _run(
+    manager: ConnectionManager, request: Callable[[], Awaitable[object]]
+) -> None:
+    with pytest.raises(ModbusError):
+        await manager.async_run(request)
+
+
+async def test_opens_after_repeated_failures() -> None:
+    """The circuit opens after the threshold and then fails fast."""
+    client = FakeClient()
+    manager = ConnectionManager(client, failure_threshold=3)
+    for _ in range(2):
+        await _run(manager, _fail)
+    assert manager.state is CircuitState.CLOSED
+    await _run(manager, _fail)
+    assert manager.state is CircuitState.OPEN
+    assert not client.connected
+    connects = client.connects
+    with pytest.raises(CircuitOpenError):
+        await manager.async_run(_answer)
+    assert client.connects == connects
+
+
+async def test_refused_connect_opens_right_away() -> None:
+    """An unreachable device is not retried before the backoff passed."""
+    client = FakeClient(reachable=False)
+    manager = ConnectionManager(client, backoff_min=10.0)
+    await _run(manager, _answer)
+    assert manager.state is CircuitState.OPEN
+    assert 5.0 <= manager.retry_in <= 10.0
+
+
+async def test_half_open_probe_closes_or_reopens() -> None:
+    """After the backoff one request probes the device."""
+    changes = []
+    client = FakeClient(reachable=False)
+    manager = ConnectionManager(client, lambda: changes.append(manager.state))
+    await _run(manager, _answer)
+    manager._retry_at = 0.0
+    await _run(manager, _answer)
+    assert changes == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.OPEN]
+    client.reachable = True
+    manager._retry_at = 0.0
+    assert await manager.async_run(_answer) == 1
+    assert manager.state is CircuitState.CLOSED
+    assert manager.failures == 0
+
+
+async def test_exception_response_counts_as_answer() -> None:
+    """A rejected request proves the device is reachable."""
+    manager = ConnectionManager(FakeClient(), failure_threshold=1)
+    with pytest.raises(ModbusExceptionResponseError):
+        await manager.async_run(_reject)
+    assert manager.state is CircuitState.CLOSED
+    assert manager.failures == 0
+
+
+async def test_concurrent_requests_connect_once() -> None:
+    """A refused connect opens the circuit for the requests waiting on it."""
+    client = FakeClient(reachable=False)
+    manager = ConnectionManager(client)
+    results = await asyncio.gather(
+        *(manager.async_run(_answer) for _ in range(3)), return_exceptions=True
+    )
+    assert client.connects == 1
+    assert [type(result) for result in results] == [
+        ModbusError,
+        CircuitOpenError,
+        CircuitOpenError,
+    ]
+
+
+async def test_half_open_lets_one_trial_through() -> None:
+    """Requests arriving during the trial fail fast until it decided."""
+    client = FakeClient(reachable=False)
+    manager = ConnectionManager(client)
+    await _run(manager, _answer)
+    client.reachable = True
+    manager._retry_at = 0.0
+
+    async def _slow_answer() -> int:
+        await asyncio.sleep(0.01)
+        return 1
+
+    results = await asyncio.gather(
+        *(manager.async_run(_slow_answer) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert results[0] == 1
+    assert all(isinstance(result, CircuitOpenError) for result in results[1:])
+    assert client.connects == 2
+    assert manager.state is CircuitState.CLOSED
+    assert await manager.async_run(_answer) == 1
+
+
+async def test_cancelled_trial_reopens() -> None:
+    """A trial cancelled before it decided leaves the next request to try."""
+    client = FakeClient(reachable=False)
+    manager = ConnectionManager(client)
+    await _run(manager, _answer)
+    client.reachable = True
+    manager._retry_at = 0.0
+    trial = asyncio.create_task(manager.async_run(asyncio.Event().wait))
+    await asyncio.sleep(0.01)
+    assert manager.state is CircuitState.HALF_OPEN
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+    assert manager.state is CircuitState.OPEN
+    assert await manager.async_run(_answer) == 1
@@ -0,0 +1,258 @@
+"""Tests for the coordinator against a fake heat pump."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.ctc_ecozenith_i550.const import (
+    ATTR_CURVE,
+    ATTR_POINTS,
+    BMS_REGISTERS,
+    CURVE_POINTS,
+    DOMAIN,
+    SERVICE_SET_HEATING_CURVE,
+)
+from custom_components.ctc_ecozenith_i550.scheduler import POLL_INTERVALS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ctc_ecozenith_i550.coordinator import (
+        CTCEcozenithDataUpdateCoordinator,
+    )
+
+    from .fake_device import FakeDevice
+
+# A setting with a scale, as written by its number entity
+SETTING = "max_immersion_heater_dhw_kw_upper"
+WRITE_REGISTER = 0x06
+WRITE_REGISTERS = 0x10
+
+
+def _age(coordinator: CTCEcozenithDataUpdateCoordinator, seconds: float) -> None:
+    """Move the last poll of every polled group back in time."""
+    groups = [*coordinator._groups.values()]
+    groups += [group for group, _ in coordinator._boosts.values()]
+    for group in groups:
+        if group.last_poll is not None:
+            group.last_poll -= seconds
+
+
+async def test_first_read_keeps_intervals(
+    coordinator: CTCEcozenithDataUpdateCoordinator,
+) -> None:
+    """Setting up reads every register once without tuning the intervals."""
+    for poll_class, group in coordinator._groups.items():
+        assert group.interval == POLL_INTERVALS[poll_class]
+    assert not coordinator._boosts
+
+
+async def test_notification_during_sweep_keeps_sweep_changes(
+    hass: HomeAssistant,
+    coordinator: CTCEcozenithDataUpdateCoordinator,
+    device: FakeDevice,
+) -> None:
+    """A write confirmation during a sweep leaves its changes to the sweep."""
+    device.registers[BMS_REGISTERS["heat_pump_1_status"].address] = 3
+    store = coordinator._store
+    load = store.load
+
+    def _load_and_notify(*args: object) -> None:
+        load(*args)
+        # Like a rollback timer or write confirmation firing mid-sweep
+        coordinator._async_notify_changed()
+
+    store.load = _load_and_notify
+    _age(coordinator, 30)
+    await coordinator.async_refresh()
+    assert ("heat_pump", 1) in coordinator._boosts
+    assert coordinator._store.get("heat_pump_1_status") == 3
+
+
+async def test_queued_writes_coalesce(
+    hass: HomeAssistant,
+    coordinator: CTCEcozenithDataUpdateCoordinator,
+    device: FakeDevice,
+) -> None:
+    """A burst of writes to one register sends only the last value."""
+    register = BMS_REGISTERS[SETTING]
+    slot = coordinator._store.slot(SETTING)
+    for value in (10, 11, 12):
+        coordinator.async_queue_write(SETTING, value, value * register.scale)
+    assert coordinator._store.value(slot) == pytest.approx(1.2)
+    assert coordinator._store.is_pending(slot)
+    device.requests.clear()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=coordinator.write_debounce)
+    )
+    await hass.async_block_till_done()
+    assert device.requests.count((WRITE_REGISTER, register.address)) == 1
+    assert device.word(register.address) == 12
+    # The read back confirms the write
+    assert not coordinator._store.is_pending(slot)
+    assert coordinator._store.value(slot) == pytest.approx(1.2)
+
+
+async def test_queued_write_of_reported_value_is_skipped(
+    hass: HomeAssistant,
+    coordinator: CTCEcozenithDataUpdateCoordinator,
+    device: FakeDevice,
+) -> None:
+    """Setting the value the device already reports sends nothing."""
+    register = BMS_REGISTERS[SETTING]
+    word = device.word(register.address)
+    coordinator.async_queue_write(SETTING, word, word * register.scale)
+    device.requests.clear()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=coordinator.write_debounce)
+    )
+    await hass.async_block_till_done()
+    assert (WRITE_REGISTER, register.address) not in device.requests
+    assert not coordinator._store.is_pending(coordinator._store.slot(SETTING))
+
+
+async def test_unconfirmed_write_rolls_back(
+    hass: HomeAssistant,
+    coordinator: CTCEcozenithDataUpdateCoordinator,
+    device: FakeDevice,
+) -> None:
+    """A write no read confirms in time falls back to the read value."""
+    register = BMS_REGISTERS[SETTING]
+    slot = coordinator._store.slot(SETTING)
+    reported = coordinator._store.reported(slot)
+    await coordinator.async_write_register(register.address, 12, pending=(SETTING, 1.2))
+    assert coordinator._store.value(slot) == pytest.approx(1.2)
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=coordinator.rollback_timeout)
+    )
+    await hass.async_block_till_done()
+    assert not coordinator._store.is_pending(slot)
+    assert coordinator._store.value(slot) == reported
+
+
+async def test_failed_write_drops_pending_value(
+    coordinator: CTCEcozenithDataUpdateCoordinator,
+    device: FakeDevice,
+) -> None:
+    """A write the device never answers shows the read value again."""
+    register = BMS_REGISTERS[SETTING]
+    slot = coordinator._store.slot(SETTING)
+    device.down = True
+    with pytest.raises(UpdateFailed):
+        await coordinator.async_write_register(
+            register.address, 12, pending=(SETTING, 1.2)
+        )
+    assert not coordinator._store.is_pending(slot)
+
+
+async def test_boost_starts_and_ends(
+    coordinator: CTCEcozenithDataUpdateCoordinator,
+    device: FakeDevice,
+) -> None:
+    """A change of a trigger boosts its unit until the boost runs out."""
+    device.registers[BMS_REGISTERS["heat_pump_1_status"].address] = 3
+    _age(coordinator, 30)
+    await coordinator.async_refresh()
+    group, _ = coordinator._boosts[("heat_pump", 1)]
+    assert "heat_pump_1_status" in group.keys
+    assert "heat_pump_2_status" not in group.keys
+
+    coordinator._boosts[("heat_pump", 1)] = (group, 0.0)
+    await coordinator.async_refresh()
+    assert not coordinator._boosts
+
+
+async def test_refresh_register_reads_one_block(
+    coordinator: CTCEcozenithDataUpdateCoordinator,
+    device: FakeDevice,
+) -> None:
+    """Re-reading a register reads its block, visibility word and limits only."""
+    register = BMS_REGISTERS[SETTING]
+    device.registers[register.address] = 42
+    device.requests.clear()
+    await coordinator.async_refresh_register(SETTING)
+    assert coordinator._store.get(SETTING) == pytest.approx(4.2)
+    assert {address for _, address in device.requests} <= {
+        register.address,
+        register.visible_adresss,
+        register.min_value_adresss,
+        register.max_value_adresss,
+        register.step_adresss,
+    }
+
+
+async def test_set_heating_curve(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    coordinator: CTCEcozenithDataUpdateCoordinator,
+    device: FakeDevice,
+) -> None:
+    """The curve service writes every point in one request and reads it back."""
+    points = [[point, 20 + point] for point in range(1, CURVE_POINTS + 1)]
+    address = BMS_REGISTERS["hc_1_curve_point_1_x"].address
+    device.requests.clear()
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_HEATING_CURVE,
+        {
+            ATTR_CONFIG_ENTRY_ID: config_entry.entry_id,
+            ATTR_CURVE: "hc_1",
+            ATTR_POINTS: points,
+        },
+        blocking=True,
+    )
+    assert device.requests.count((WRITE_REGISTERS, address)) == 1
+    for point, (x, y) in enumerate(points, 1):
+        assert coordinator._store.get(f"hc_1_curve_point_{point}_x") == x
+        assert coordinator._store.get(f"hc_1_curve_point_{point}_y") == pytest.approx(y)
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        [(1, 20)] * (CURVE_POINTS - 1),
+        [(1, 20)] * (CURVE_POINTS - 1) + [(1, 2000)],
+        [(1, 20)] * (CURVE_POINTS - 1) + [(-1, 20)],
+    ],
+)
+async def test_invalid_curve_is_not_written(
+    coordinator: CTCEcozenithDataUpdateCoordinator,
+    device: FakeDevice,
+    points: list[tuple[float, float]],
+) -> None:
+    """A curve with a wrong point count or a value out of range is rejected."""
+    device.requests.clear()
+    with pytest.raises(ServiceValidationError):
+        await coordinator.async_write_curve("hc_1", points)
+    assert not any(request[0] == WRITE_REGISTERS for request in device.requests)
+
+
+async def test_set_heating_curve_of_unknown_entry(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> None:
+    """The curve service rejects an entry that is not loaded."""
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_HEATING_CURVE,
+            {
+                ATTR_CONFIG_ENTRY_ID: "unknown",
+                ATTR_CURVE: "hc_1",
+                ATTR_POINTS: [[1, 20]] * CURVE_POINTS,
+            },
+            blocking=True,
+        )
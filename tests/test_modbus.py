@@ -0,0 +1,234 @@
+"""Tests for the transaction window of the Modbus TCP client."""
+
+import asyncio
+import struct
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+import pytest
+
+from custom_components.ctc_ecozenith_i550.modbus import (
+    MBAP_HEADER,
+    PRIORITY_POLL,
+    PRIORITY_VERIFY,
+    AsyncModbusTcpClient,
+    ModbusError,
+    ModbusExceptionResponseError,
+)
+
+from .fake_device import FakeDevice
+
+
+class FakeWriter:
+    """Record the request frames the client sends."""
+
+    def __init__(self) -> None:
+        """Initialize an open writer."""
+        self.frames: list[tuple[int, int, int]] = []
+        self.sent = asyncio.Event()
+        self._closing = False
+
+    def write(self, data: bytes) -> None:
+        """Record transaction id, function code and address of a frame."""
+        transaction_id = MBAP_HEADER.unpack_from(data)[0]
+        function_code, address = struct.unpack_from(">BH", data, MBAP_HEADER.size)
+        self.frames.append((transaction_id, function_code, address))
+        self.sent.set()
+
+    async def drain(self) -> None:
+        """Nothing is buffered."""
+
+    def is_closing(self) -> bool:
+        """Return True once closed."""
+        return self._closing
+
+    def close(self) -> None:
+        """Close the writer."""
+        self._closing = True
+
+    async def wait_closed(self) -> None:
+        """Nothing to wait for."""
+
+
+def _client(max_in_flight: int = 1) -> tuple[AsyncModbusTcpClient, FakeWriter]:
+    """Return a client connected to in-memory streams."""
+    client = AsyncModbusTcpClient("device", 502, max_in_flight=max_in_flight)
+    reader = asyncio.StreamReader()
+    writer = FakeWriter()
+    client._reader, client._writer = reader, writer
+    client._read_task = asyncio.create_task(client._read_loop(reader, writer))
+    return client, writer
+
+
+def _respond(client: AsyncModbusTcpClient, frame: tuple[int, int, int]) -> None:
+    """Answer a recorded request with the address as every word."""
+    transaction_id, function_code, address = frame
+    if function_code == 0x03:
+        pdu = struct.pack(">BBH", 0x03, 2, address)
+    else:
+        pdu = struct.pack(">BHH", function_code, address, 0)
+    client._reader.feed_data(MBAP_HEADER.pack(transaction_id, 0, len(pdu) + 1, 1) + pdu)
+
+
+async def _next_frame(writer: FakeWriter, count: int) -> tuple[int, int, int]:
+    """Wait until the client sent count frames and return the last one."""
+    while len(writer.frames) < count:
+        writer.sent.clear()
+        await asyncio.wait_for(writer.sent.wait(), 1)
+    return writer.frames[count - 1]
+
+
+async def test_write_goes_ahead_of_queued_reads() -> None:
+    """Queued transactions are sent in priority order, not arrival order."""
+    client, writer = _client()
+    first = asyncio.create_task(client.read_holding_registers(1, 1))
+    await _next_frame(writer, 1)
+    reads = [
+        asyncio.create_task(client.read_holding_registers(address, 1))
+        for address in (2, 3)
+    ]
+    verify = asyncio.create_task(client.read_holding_registers(4, 1, PRIORITY_VERIFY))
+    write = asyncio.create_task(client.write_register(9, 1))
+    await asyncio.sleep(0)
+    # One request at a time, so the rest wait for the first response
+    assert len(writer.frames) == 1
+    for count in range(1, 6):
+        _respond(client, await _next_frame(writer, count))
+    assert await first == [1]
+    await write
+    assert await verify == [4]
+    assert [await read for read in reads] == [[2], [3]]
+    assert [frame[2] for frame in writer.frames] == [1, 9, 4, 2, 3]
+    await client.close()
+
+
+async def test_write_waits_for_pipelined_reads() -> None:
+    """A write is exclusive and holds back the reads queued behind it."""
+    client, writer = _client(max_in_flight=2)
+    reads = [
+        asyncio.create_task(client.read_holding_registers(address, 1, PRIORITY_POLL))
+        for address in (1, 2)
+    ]
+    await _next_frame(writer, 2)
+    write = asyncio.create_task(client.write_register(9, 1))
+    later = asyncio.create_task(client.read_holding_registers(3, 1))
+    await asyncio.sleep(0)
+    assert len(writer.frames) == 2
+    _respond(client, writer.frames[0])
+    await asyncio.sleep(0)
+    # The write needs the link to itself, so the freed slot stays unused
+    assert len(writer.frames) == 2
+    _respond(client, writer.frames[1])
+    _respond(client, await _next_frame(writer, 3))
+    await write
+    _respond(client, await _next_frame(writer, 4))
+    assert await later == [3]
+    assert [await read for read in reads] == [[1], [2]]
+    assert [frame[2] for frame in writer.frames] == [1, 2, 9, 3]
+    await client.close()
+
+
+async def test_exception_response() -> None:
+    """An exception response raises with its exception code."""
+    client, writer = _client()
+    read = asyncio.create_task(client.read_holding_registers(1, 1))
+    transaction_id = (await _next_frame(writer, 1))[0]
+    client._reader.feed_data(MBAP_HEADER.pack(transaction_id, 0, 3, 1) + b"\x83\x02")
+    with pytest.raises(ModbusExceptionResponseError) as err:
+        await read
+    assert err.value.exception_code == 2
+    await client.close()
+
+
+async def test_concurrent_connect_opens_one_connection(socket_enabled: None) -> None:
+    """A read and a write on a disconnected client share one connection."""
+    device = FakeDevice(latency=0.01)
+    await device.start()
+    client = AsyncModbusTcpClient("127.0.0.1", device.port, timeout=1.0)
+
+    async def _connected[T](request: Callable[[], Awaitable[T]]) -> T:
+        await client.connect()
+        return await request()
+
+    read, _ = await asyncio.gather(
+        _connected(partial(client.read_holding_registers, 10, 1)),
+        _connected(partial(client.write_register, 20, 5)),
+    )
+    assert read == [device.word(10)]
+    assert device.registers[20] == 5
+    assert device.connections == 1
+    await client.close()
+    await device.stop()
+
+
+async def _read_concurrently(client: AsyncModbusTcpClient, *addresses: int) -> list:
+    """Connect and read single registers at once, returning the outcomes."""
+    await client.connect()
+    return await asyncio.gather(
+        *(client.read_holding_registers(address, 1) for address in addresses),
+        return_exceptions=True,
+    )
+
+
+async def test_falls_back_to_serial_when_device_drops_requests(
+    socket_enabled: None,
+) -> None:
+    """A device ignoring pipelined requests is then sent one at a time."""
+    device = FakeDevice(latency=0.05)
+    device.pipelining = False
+    await device.start()
+    client = AsyncModbusTcpClient(
+        "127.0.0.1", device.port, timeout=0.2, max_in_flight=2
+    )
+    first, second = await _read_concurrently(client, 1, 2)
+    assert first == [device.word(1)]
+    assert isinstance(second, ModbusError)
+    assert client.max_in_flight == 1
+    assert await _read_concurrently(client, 1, 2) == [
+        [device.word(1)],
+        [device.word(2)],
+    ]
+    await client.close()
+    await device.stop()
+
+
+async def test_connection_loss_keeps_pipelining(socket_enabled: None) -> None:
+    """Losing or closing the connection says nothing about pipelining."""
+    device = FakeDevice(latency=0.05)
+    await device.start()
+    client = AsyncModbusTcpClient(
+        "127.0.0.1", device.port, timeout=1.0, max_in_flight=2
+    )
+    device.down = True
+    results = await _read_concurrently(client, 1, 2)
+    assert all(isinstance(result, ModbusError) for result in results)
+    assert client.max_in_flight == 2
+    device.down = False
+    reads = asyncio.create_task(_read_concurrently(client, 1, 2))
+    await asyncio.sleep(0.01)
+    await client.close()
+    assert all(isinstance(result, ModbusError) for result in await reads)
+    assert client.max_in_flight == 2
+    await device.stop()
+
+
+async def test_reconnect_restores_pipelining(socket_enabled: None) -> None:
+    """A new connection tries pipelining again after a fallback."""
+    device = FakeDevice(latency=0.05)
+    device.pipelining = False
+    await device.start()
+    client = AsyncModbusTcpClient(
+        "127.0.0.1", device.port, timeout=0.2, max_in_flight=2
+    )
+    await _read_concurrently(client, 1, 2)
+    assert client.max_in_flight == 1
+    await client.close()
+    device.pipelining = True
+    assert await _read_concurrently(client, 1, 2) == [
+        [device.word(1)],
+        [device.word(2)],
+    ]
+    assert client.max_in_flight == 2
+    assert device.max_in_flight == 2
+    await client.close()
+    await device.stop()
@@ -0,0 +1,104 @@
+"""Tests for coalescing register reads into block reads."""
+
+import struct
+from collections.abc import Iterable
+
+from custom_components.ctc_ecozenith_i550.feature_register import FeatureRegister
+from custom_components.ctc_ecozenith_i550.modbus import (
+    ModbusError,
+    ModbusExceptionResponseError,
+)
+from custom_components.ctc_ecozenith_i550.read_planner import (
+    ReadBlock,
+    build_read_plan,
+    build_span_plan,
+    read_plan,
+    read_plan_into,
+)
+from custom_components.ctc_ecozenith_i550.register_store import RegisterStore
+
+
+class FakeClient:
+    """Answer reads from a word map, rejecting or failing some addresses."""
+
+    def __init__(
+        self,
+        words: dict[int, int],
+        rejected: Iterable[int] = (),
+        broken: Iterable[int] = (),
+    ) -> None:
+        """Initialize the client with the words of the device."""
+        self.words = words
+        self.rejected = set(rejected)
+        self.broken = set(broken)
+        self.requests: list[tuple[int, int]] = []
+
+    async def read_holding_registers(
+        self, address: int, count: int, priority: int = 2
+    ) -> list[int]:
+        """Return the words of a range like the Modbus client."""
+        self.requests.append((address, count))
+        addresses = range(address, address + count)
+        if self.broken.intersection(addresses):
+            msg = "Timeout"
+            raise ModbusError(msg)
+        if self.rejected.intersection(addresses):
+            raise ModbusExceptionResponseError(0x03, 2)
+        return [self.words.get(a, 0) for a in addresses]
+
+    async def read_holding_registers_raw(
+        self, address: int, count: int, priority: int = 2
+    ) -> bytes:
+        """Return the words of a range as big-endian bytes."""
+        words = await self.read_holding_registers(address, count, priority)
+        return struct.pack(f">{count}H", *words)
+
+
+def test_build_read_plan_coalesces_close_addresses() -> None:
+    """Addresses within the gap share a block, farther ones start a new one."""
+    plan = build_read_plan([100, 101, 105, 130, 131], max_gap=10)
+    assert plan == (ReadBlock(100, 6), ReadBlock(130, 2))
+
+
+def test_build_read_plan_limits_block_size() -> None:
+    """No block reads more registers than allowed in one request."""
+    plan = build_read_plan(range(300), max_count=125)
+    assert [block.count for block in plan] == [125, 125, 50]
+    assert plan[1].address == 125
+
+
+def test_build_span_plan_keeps_spans_whole() -> None:
+    """A two-word register never straddles two blocks."""
+    plan = build_span_plan(
+        [ReadBlock(0, 1), ReadBlock(3, 2), ReadBlock(5, 1)], max_count=4
+    )
+    assert plan == (ReadBlock(0, 1), ReadBlock(3, 3))
+
+
+def test_build_read_plan_deduplicates() -> None:
+    """A register address listed twice is read once."""
+    assert build_read_plan([7, 7, 8]) == (ReadBlock(7, 2),)
+
+
+async def test_read_plan_falls_back_to_single_reads() -> None:
+    """A rejected block is read register by register, skipping rejects."""
+    client = FakeClient({10: 1, 11: 2, 12: 3}, rejected={11})
+    words = await read_plan(client, [ReadBlock(10, 3)])
+    assert words == {10: 1, 12: 3}
+    assert client.requests == [(10, 3), (10, 1), (11, 1), (12, 1)]
+
+
+async def test_read_plan_into_returns_failed_blocks() -> None:
+    """A failing block is returned while the other blocks are stored."""
+    registers = {
+        "a": FeatureRegister(10, 1, 0),
+        "b": FeatureRegister(50, 1, 1),
+    }
+    store = RegisterStore(registers)
+    store.set_visibility(dict.fromkeys(registers, True))
+    client = FakeClient({10: 4, 50: 5}, broken={50})
+    plan = (ReadBlock(10, 1), ReadBlock(50, 1))
+    failed = await read_plan_into(client, plan, store, 1.0)
+    assert [block for block, _ in failed] == [ReadBlock(50, 1)]
+    assert store.get("a") == 4
+    assert store.get("b") is None
@@ -0,0 +1,174 @@
+"""Tests for the decoding of register words in the register store."""
+
+import struct
+
+import pytest
+
+from custom_components.ctc_ecozenith_i550.feature_register import FeatureRegister
+from custom_components.ctc_ecozenith_i550.register_store import (
+    RegisterStore,
+    to_signed,
+)
+
+REGISTERS = {
+    "outdoor_temperature": FeatureRegister(100, 1, 0, scale=0.1, signed=True),
+    "status": FeatureRegister(101, 1, 1),
+    "supply_setpoint": FeatureRegister(102, 1, 2, scale=0.1),
+    "energy": FeatureRegister(104, 1, 3, scale=0.1, word_count=2),
+}
+
+
+def _store() -> RegisterStore:
+    store = RegisterStore(REGISTERS)
+    store.set_visibility(dict.fromkeys(REGISTERS, True))
+    return store
+
+
+def _words(*words: int) -> bytes:
+    return struct.pack(f">{len(words)}H", *words)
+
+
+@pytest.mark.parametrize(
+    ("word", "signed", "expected"),
+    [
+        (0x0000, True, 0),
+        (0x7FFF, True, 32767),
+        (0x8000, True, -32768),
+        (0xFFF6, True, -10),
+        (0xFFFF, True, -1),
+        (0xFFF6, False, 0xFFF6),
+    ],
+)
+def test_to_signed(word: int, signed: bool, expected: int) -> None:
+    """Only signed registers are reinterpreted as int16."""
+    assert to_signed(word, signed=signed) == expected
+
+
+def test_load_decodes_int16_and_scale() -> None:
+    """Signed words are two's complement and every value is scaled."""
+    store = _store()
+    store.load(100, _words(0xFFF6, 0xFFF6, 215), 1.0)
+    assert store.get("outdoor_temperature") == pytest.approx(-1.0)
+    assert store.get("status") == 0xFFF6
+    assert store.get("supply_setpoint") == pytest.approx(21.5)
+
+
+def test_load_joins_32_bit_low_word_first() -> None:
+    """A two-word register is joined low word first and then scaled."""
+    store = _store()
+    store.load(104, _words(0xFFF6, 0x0001), 1.0)
+    assert store.get("energy") == pytest.approx(0x1FFF6 * 0.1)
+
+
+def test_load_skips_split_two_word_register() -> None:
+    """A two-word register without both words in the block gets no value."""
+    store = _store()
+    store.load(100, _words(1, 2, 3, 0, 0xFFF6), 1.0)
+    assert store.get("supply_setpoint") == pytest.approx(0.3)
+    assert store.get("energy") is None
+
+
+def test_snapshot_decodes_every_slot() -> None:
+    """A snapshot holds the value of every slot and None where there is none."""
+    store = _store()
+    assert store.snapshot() == [None] * len(REGISTERS)
+    store.load(100, _words(0xFFF6, 7, 215, 0, 0xFFF6, 0x0001), 1.0)
+    assert store.snapshot() == pytest.approx([-1.0, 7, 21.5, 0x1FFF6 * 0.1])
+    store.load(101, _words(8), 2.0)
+    assert store.snapshot()[store.slot("status")] == 8
+
+
+def test_overlapping_registers_decode_separately() -> None:
+    """Registers sharing a word still decode from their own offset."""
+    store = RegisterStore(
+        {
+            "counter": FeatureRegister(100, 1, 0, word_count=2),
+            "counter_msb": FeatureRegister(101, 1, 1, signed=True),
+            "other": FeatureRegister(102, 1, 2),
+        }
+    )
+    store.set_visibility(dict.fromkeys(("counter", "counter_msb", "other"), True))
+    store.load(100, _words(2, 0xFFFF, 9), 1.0)
+    assert store.snapshot() == [0xFFFF0002, -1, 9]
+
+
+def test_update_matches_load() -> None:
+    """Words keyed by address decode like the raw block response."""
+    words = {100: 0xFFF6, 101: 7, 102: 215, 104: 0xFFF6, 105: 0x0001}
+    loaded = _store()
+    loaded.load(100, _words(*(words.get(a, 0) for a in range(100, 106))), 1.0)
+    updated = _store()
+    updated.update(words, range(len(updated)), 1.0)
+    for key in REGISTERS:
+        assert updated.get(key) == loaded.get(key)
+
+
+def test_update_without_all_words_drops_value() -> None:
+    """A register is only kept if all of its words were read."""
+    store = _store()
+    store.update({104: 1, 105: 0}, [store.slot("energy")], 1.0)
+    assert store.get("energy") == pytest.approx(0.1)
+    store.update({104: 1}, [store.slot("energy")], 2.0)
+    assert store.get("energy") is None
+
+
+def test_hidden_register_has_no_value() -> None:
+    """A register the visibility bitmap reports as unused has no value."""
+    store = _store()
+    store.load(100, _words(10), 1.0)
+    store.set_visibility({"outdoor_temperature": False})
+    assert store.get("outdoor_temperature") is None
+
+
+def test_changed_slots() -> None:
+    """Only first reads and changed words are reported as changed."""
+    store = _store()
+    store.load(100, _words(1, 2, 3), 1.0)
+    assert store.pop_changed() == {0, 1, 2}
+    store.load(100, _words(1, 2, 3), 2.0)
+    assert store.pop_changed() == set()
+    store.load(100, _words(1, 5, 3), 3.0)
+    assert store.pop_changed() == {1}
+
+
+def test_stale_values_expire_by_slot_age() -> None:
+    """Stale values are kept until they are older than their slot's max age."""
+    store = _store()
+    store.load(100, _words(1, 2, 3), 1.0)
+    store.set_max_age([0], 10.0)
+    store.mark_stale([0, 1])
+    assert store.is_stale(0)
+    store.expire(5.0)
+    assert store.get("outdoor_temperature") == pytest.approx(0.1)
+    store.expire(20.0)
+    assert store.get("outdoor_temperature") is None
+    # Slots without a max age are never dropped
+    assert store.get("status") == 2
+    store.load(100, _words(1, 2, 3), 30.0)
+    assert not store.is_stale(1)
+
+
+def test_pending_value_settles_on_later_read() -> None:
+    """A written value is shown until a read started after the write."""
+    store = _store()
+    store.load(100, _words(0, 0, 200), 1.0)
+    slot = store.slot("supply_setpoint")
+    store.set_pending(slot, 22.0, 5.0)
+    assert store.get("supply_setpoint") == 22.0
+    assert store.reported(slot) == pytest.approx(20.0)
+    store.load(100, _words(0, 0, 200), 4.0)
+    assert store.is_pending(slot)
+    store.load(100, _words(0, 0, 220), 5.0)
+    assert not store.is_pending(slot)
+    assert store.get("supply_setpoint") == pytest.approx(22.0)
+    assert not store.drop_pending(slot)
+
+
+def test_first_reads() -> None:
+    """Only registers without a value before count as first reads."""
+    store = _store()
+    store.load(100, _words(1, 2), 1.0)
+    assert store.pop_first_reads() == {0, 1}
+    store.load(100, _words(1, 3, 4), 2.0)
+    assert store.pop_first_reads() == {2}
+    assert store.pop_changed() == {0, 1, 2}
@@ -0,0 +1,85 @@
+"""Tests for the poll groups and their adaptive intervals."""
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.ctc_ecozenith_i550.feature_register import (
+    FeatureRegister,
+    PollClass,
+)
+from custom_components.ctc_ecozenith_i550.scheduler import (
+    BACK_OFF,
+    SCHEDULER_SLACK,
+    SPEED_UP,
+    PollGroup,
+    build_poll_groups,
+)
+
+REGISTERS = {
+    "temperature": FeatureRegister(1, 0, 0),
+    "setpoint": FeatureRegister(2, 0, 1, poll_class=PollClass.SETTING),
+    "energy": FeatureRegister(3, 0, 2, word_count=2, poll_class=PollClass.COUNTER),
+    "version": FeatureRegister(5, 0, 3, poll_class=PollClass.IDENTITY),
+}
+
+
+def _group(seconds: float, **kwargs: float) -> PollGroup:
+    return PollGroup(PollClass.FAST, ("a",), timedelta(seconds=seconds), **kwargs)
+
+
+def test_build_poll_groups_scales_bounds() -> None:
+    """Every poll class gets a group, its bounds scaled by its interval."""
+    groups = build_poll_groups(REGISTERS, (2.0, 30.0))
+    assert list(groups) == [
+        PollClass.FAST,
+        PollClass.SETTING,
+        PollClass.COUNTER,
+        PollClass.IDENTITY,
+    ]
+    assert groups[PollClass.SETTING].keys == ("setpoint",)
+    assert groups[PollClass.SETTING].min_interval == pytest.approx(24.0)
+    assert groups[PollClass.SETTING].max_interval == pytest.approx(360.0)
+    assert groups[PollClass.IDENTITY].interval is None
+
+
+def test_due_with_slack() -> None:
+    """A group is due once its interval passed, allowing for tick drift."""
+    group = _group(5)
+    assert group.due(0.0)
+    group.last_poll = 100.0
+    assert not group.due(104.0)
+    assert group.due(105.0 - SCHEDULER_SLACK)
+
+
+def test_identity_group_is_due_once() -> None:
+    """A group without an interval is only due before its first poll."""
+    group = PollGroup(PollClass.IDENTITY, ("version",), None)
+    assert group.due(0.0)
+    group.last_poll = 0.0
+    assert not group.due(1e9)
+
+
+@pytest.mark.parametrize(
+    ("changes", "expected"),
+    [(5, 10 * SPEED_UP), (1, 10.0), (0, 10 * BACK_OFF)],
+)
+def test_adapt_follows_change_rate(changes: int, expected: float) -> None:
+    """Busy groups poll faster and idle groups back off."""
+    group = _group(10, changes=changes)
+    group.adapt(50)
+    assert group.interval.total_seconds() == pytest.approx(expected)
+    assert group.changes == 0
+
+
+def test_adapt_respects_bounds_and_link_share() -> None:
+    """The interval stays within its bounds unless the link is too slow."""
+    group = _group(10, min_interval=8.0, changes=50)
+    group.adapt(50)
+    assert group.interval.total_seconds() == pytest.approx(8.0)
+    group = _group(10, max_interval=11.0)
+    group.adapt(50)
+    assert group.interval.total_seconds() == pytest.approx(11.0)
+    group = _group(10, max_interval=11.0, cost=9.0)
+    group.adapt(50)
+    assert group.interval.total_seconds() == pytest.approx(18.0)
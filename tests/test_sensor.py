@@ -0,0 +1,133 @@
+"""Tests for the counter sensors."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    mock_restore_cache_with_extra_data,
+)
+
+from custom_components.ctc_ecozenith_i550.const import BMS_REGISTERS, DOMAIN
+from custom_components.ctc_ecozenith_i550.sensor import COUNTER_WRAP
+
+if TYPE_CHECKING:
+    from .fake_device import FakeDevice
+
+COUNTER = "heat_pump_1_compressor_operating_time"
+ENTITY_ID = "sensor.hp1_operating_time"
+
+
+def _entry(hass: HomeAssistant, device: FakeDevice) -> MockConfigEntry:
+    """Return a config entry for the fake device."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_NAME: "CTC", CONF_HOST: "127.0.0.1", CONF_PORT: device.port},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def _setup(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Set up the entry and wait for the entities."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_restores_rollover(
+    hass: HomeAssistant, enable_custom_integrations: None, device: FakeDevice
+) -> None:
+    """A rollover counted before a restart still adds to the counter."""
+    entry = _entry(hass, device)
+    er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{entry.entry_id}-{COUNTER}",
+        config_entry=entry,
+        suggested_object_id=ENTITY_ID.split(".")[1],
+    )
+    mock_restore_cache_with_extra_data(
+        hass,
+        [
+            (
+                State(ENTITY_ID, "0"),
+                {
+                    "native_value": 0,
+                    "native_unit_of_measurement": "h",
+                    "rollover": COUNTER_WRAP,
+                    "last_count": 0,
+                },
+            )
+        ],
+    )
+    await _setup(hass, entry)
+
+    count = hass.data[DOMAIN][entry.entry_id].data.get(COUNTER)
+    assert float(hass.states.get(ENTITY_ID).state) == count + COUNTER_WRAP
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_counts_rollover_while_stopped(
+    hass: HomeAssistant, enable_custom_integrations: None, device: FakeDevice
+) -> None:
+    """A counter that wrapped while Home Assistant was stopped keeps rising."""
+    address = BMS_REGISTERS[COUNTER].address
+    device.registers.update({address: 5, address + 1: 0})
+    entry = _entry(hass, device)
+    er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{entry.entry_id}-{COUNTER}",
+        config_entry=entry,
+        suggested_object_id=ENTITY_ID.split(".")[1],
+    )
+    mock_restore_cache_with_extra_data(
+        hass,
+        [
+            (
+                State(ENTITY_ID, str(COUNTER_WRAP - 1)),
+                {
+                    "native_value": COUNTER_WRAP - 1,
+                    "native_unit_of_measurement": "h",
+                    "rollover": 0,
+                    "last_count": COUNTER_WRAP - 1,
+                },
+            )
+        ],
+    )
+    await _setup(hass, entry)
+
+    assert float(hass.states.get(ENTITY_ID).state) == 5 + COUNTER_WRAP
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_migrates_split_counters(
+    hass: HomeAssistant, enable_custom_integrations: None, device: FakeDevice
+) -> None:
+    """The low word sensor becomes the counter and the high word one goes away."""
+    entry = _entry(hass, device)
+    registry = er.async_get(hass)
+    low = registry.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{entry.entry_id}-heat_pump_1_compressor_power_consumption_kwh_lsb",
+        config_entry=entry,
+    )
+    high = registry.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{entry.entry_id}-heat_pump_1_compressor_power_consumption_kwh_msb",
+        config_entry=entry,
+    )
+    await _setup(hass, entry)
+
+    assert registry.async_get(low.entity_id).unique_id == (
+        f"{entry.entry_id}-heat_pump_1_compressor_power_consumption_kwh"
+    )
+    assert registry.async_get(high.entity_id) is None
+    assert hass.states.get(low.entity_id) is not None
+    await hass.config_entries.async_unload(entry.entry_id)